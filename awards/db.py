@@ -1,6 +1,9 @@
+import dataclasses
 import logging
 import os
 from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Collection, Iterable
 from dotenv import load_dotenv
 from sqlalchemy import bindparam, create_engine, func, select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
@@ -8,7 +11,7 @@ from sqlalchemy.orm import sessionmaker, Session
 
 from sqlalchemy import text as sa_text
 
-from .countries import get_country_name
+from .countries import get_country_name, normalize_country_code
 from .models import (
     Document,
     Organization,
@@ -19,10 +22,11 @@ from .models import (
     AuthorityType,
     Country,
     OrganizationIdentifier,
+    SyncState,
     award_contractors,
     contract_cpv_codes,
 )
-from .schema import AwardDataModel
+from .records import AwardDataRecord
 
 load_dotenv()
 
@@ -97,6 +101,21 @@ _upsert_org_id = _org_id_ins.on_conflict_do_nothing(
     constraint="uq_org_identifier",
 )
 
+# Sync watermark upsert (a NULL leaves the stored watermark unchanged)
+_sync_ins = pg_insert(SyncState.__table__)
+_upsert_sync = _sync_ins.on_conflict_do_update(
+    index_elements=["portal"],
+    set_={
+        "last_downloaded": func.coalesce(
+            _sync_ins.excluded.last_downloaded,
+            SyncState.__table__.c.last_downloaded,
+        ),
+        "last_imported": func.coalesce(
+            _sync_ins.excluded.last_imported, SyncState.__table__.c.last_imported
+        ),
+    },
+)
+
 # Doc existence check
 _check_doc = select(Document.__table__.c.doc_id).where(
     Document.__table__.c.doc_id == bindparam("doc_id")
@@ -117,24 +136,43 @@ def get_session() -> Session:
         session.close()
 
 
-def _normalize_country_code(value: str | None) -> str | None:
-    if not value:
-        return None
-    code = value.upper()
-    if code == "UK":
-        return "GB"
-    if code == "1A":
-        return None
-    return code
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> tuple[str, ...]:
+    if dataclasses.is_dataclass(cls):
+        return tuple(f.name for f in dataclasses.fields(cls))
+    return tuple(cls.model_fields)
+
+
+def _columns(obj: Any, exclude: Collection[str] = ()) -> dict:
+    """Shallow dict of a record's fields (or a schema model's), minus `exclude`."""
+    return {
+        name: getattr(obj, name)
+        for name in _field_names(type(obj))
+        if name not in exclude
+    }
 
 
-def save_document_core(session: Session, award_data: AwardDataModel) -> bool:
+def _identifier_params(identifiers: Iterable[Any], organization_id: int) -> list:
+    return [
+        {
+            "scheme": ident.scheme,
+            "identifier": ident.identifier,
+            "organization_id": organization_id,
+        }
+        for ident in identifiers
+    ]
+
+
+def save_document_core(session: Session, award_data: AwardDataRecord) -> bool:
     """Save a single award document using Core statements.
 
+    Fields are read by attribute, so schema.AwardDataModel instances are
+    accepted as well as parser records.
     Operates within the caller's session/transaction — does not commit.
     Returns True if saved, False if already exists.
     """
-    doc_id = award_data.document.doc_id
+    document = award_data.document
+    doc_id = document.doc_id
 
     existing = session.execute(_check_doc, {"doc_id": doc_id}).scalar_one_or_none()
     if existing:
@@ -142,29 +180,30 @@ def save_document_core(session: Session, award_data: AwardDataModel) -> bool:
         return False
 
     # Upsert authority type into lookup table (FK dependency for document)
-    authority_type_data = None
-    if award_data.document.buyer_authority_type:
-        authority_type_data = award_data.document.buyer_authority_type.model_dump()
-        session.execute(_upsert_at, authority_type_data)
+    authority_type = document.buyer_authority_type
+    if authority_type:
+        session.execute(
+            _upsert_at,
+            {"code": authority_type.code, "description": authority_type.description},
+        )
 
     # Normalize country codes
-    buyer_dict = award_data.buyer.model_dump()
-    buyer_dict["country_code"] = _normalize_country_code(buyer_dict.get("country_code"))
-    doc_params = award_data.document.model_dump()
-    doc_params["source_country"] = _normalize_country_code(
-        doc_params.get("source_country")
-    )
+    buyer = award_data.buyer
+    buyer_dict = _columns(buyer, exclude=("identifiers",))
+    buyer_dict["country_code"] = normalize_country_code(buyer_dict["country_code"])
+    # Document columns; the buyer's authority type is stored by code
+    doc_params = _columns(document, exclude=("buyer_authority_type",))
+    doc_params["source_country"] = normalize_country_code(doc_params["source_country"])
 
     # Collect all contractor country codes (normalized) for batch upsert
     all_contractor_dicts = []
     all_contractor_identifiers = []
     for award_item in award_data.awards:
         for c in award_item.contractors:
-            cd = c.model_dump()
-            cd["country_code"] = _normalize_country_code(cd.get("country_code"))
-            ct_identifiers = cd.pop("identifiers", [])
+            cd = _columns(c, exclude=("identifiers",))
+            cd["country_code"] = normalize_country_code(cd["country_code"])
             all_contractor_dicts.append(cd)
-            all_contractor_identifiers.append(ct_identifiers)
+            all_contractor_identifiers.append(c.identifiers)
 
     # Upsert all distinct country codes before entities (FK dependency)
     country_codes = {
@@ -183,49 +222,42 @@ def save_document_core(session: Session, award_data: AwardDataModel) -> bool:
         )
 
     # Upsert buyer organization
-    buyer_identifiers = buyer_dict.pop("identifiers", [])
     buyer_org_id = session.execute(_upsert_org, buyer_dict).scalar_one()
 
     # Insert buyer organization identifiers
-    if buyer_identifiers:
+    if buyer.identifiers:
         session.execute(
-            _upsert_org_id,
-            [
-                {
-                    "scheme": ident["scheme"],
-                    "identifier": ident["identifier"],
-                    "organization_id": buyer_org_id,
-                }
-                for ident in buyer_identifiers
-            ],
+            _upsert_org_id, _identifier_params(buyer.identifiers, buyer_org_id)
         )
 
     # Create document with FK to buyer organization
-    # Remove Pydantic-only fields not in DB columns
-    doc_params.pop("buyer_authority_type", None)
-    doc_params.pop("buyer_main_activity_code", None)
     doc_params["buyer_organization_id"] = buyer_org_id
     doc_params["buyer_authority_type_code"] = (
-        authority_type_data["code"] if authority_type_data else None
-    )
-    doc_params["buyer_main_activity_code"] = (
-        award_data.document.buyer_main_activity_code
+        authority_type.code if authority_type else None
     )
     session.execute(_insert_doc, doc_params)
 
     # Upsert CPV codes into lookup table before creating contract (FK dependency)
-    contract_dict = award_data.contract.model_dump()
-    cpv_codes_data = contract_dict.pop("cpv_codes", [])
+    contract = award_data.contract
+    contract_dict = _columns(contract, exclude=("cpv_codes", "procedure_type"))
+    # Deduplicate by code — PG upsert can't affect the same row twice in one statement
+    cpv_codes_data = list(
+        {
+            e.code: {"code": e.code, "description": e.description}
+            for e in contract.cpv_codes
+        }.values()
+    )
     if cpv_codes_data:
-        # Deduplicate by code — PG upsert can't affect the same row twice in one statement
-        cpv_codes_data = list({e["code"]: e for e in cpv_codes_data}.values())
         session.execute(_upsert_cpv, cpv_codes_data)
 
     # Upsert procedure type into lookup table before creating contract (FK dependency)
-    procedure_type_data = contract_dict.pop("procedure_type", None)
-    if procedure_type_data:
-        session.execute(_upsert_pt, procedure_type_data)
-        contract_dict["procedure_type_code"] = procedure_type_data["code"]
+    procedure_type = contract.procedure_type
+    if procedure_type:
+        session.execute(
+            _upsert_pt,
+            {"code": procedure_type.code, "description": procedure_type.description},
+        )
+        contract_dict["procedure_type_code"] = procedure_type.code
 
     # Create contract
     contract_dict["doc_id"] = doc_id
@@ -233,8 +265,7 @@ def save_document_core(session: Session, award_data: AwardDataModel) -> bool:
 
     # Link all CPV codes to contract
     cpv_junc_params = [
-        {"contract_id": contract_id, "cpv_code": code}
-        for code in {e["code"] for e in cpv_codes_data}
+        {"contract_id": contract_id, "cpv_code": e["code"]} for e in cpv_codes_data
     ]
     if cpv_junc_params:
         session.execute(_insert_cpv_junc, cpv_junc_params)
@@ -243,20 +274,18 @@ def save_document_core(session: Session, award_data: AwardDataModel) -> bool:
     all_award_ct_params = []
     ct_offset = 0
     for award_item in award_data.awards:
-        award_dict = award_item.model_dump()
-        contractors_raw = award_dict.pop("contractors", [])
+        award_dict = _columns(award_item, exclude=("contractors",))
+        num_contractors = len(award_item.contractors)
 
         award_dict["contract_id"] = contract_id
         award_id = session.execute(_insert_award, award_dict).scalar_one()
 
         # Slice pre-normalized contractor dicts for this award
-        contractors_data = all_contractor_dicts[
-            ct_offset : ct_offset + len(contractors_raw)
-        ]
+        contractors_data = all_contractor_dicts[ct_offset : ct_offset + num_contractors]
         ct_identifiers_data = all_contractor_identifiers[
-            ct_offset : ct_offset + len(contractors_raw)
+            ct_offset : ct_offset + num_contractors
         ]
-        ct_offset += len(contractors_raw)
+        ct_offset += num_contractors
 
         seen_org_ids = set()
         for c, ct_idents in zip(contractors_data, ct_identifiers_data):
@@ -268,17 +297,7 @@ def save_document_core(session: Session, award_data: AwardDataModel) -> bool:
                 )
             # Insert contractor identifiers
             if ct_idents:
-                session.execute(
-                    _upsert_org_id,
-                    [
-                        {
-                            "scheme": ident["scheme"],
-                            "identifier": ident["identifier"],
-                            "organization_id": org_id,
-                        }
-                        for ident in ct_idents
-                    ],
-                )
+                session.execute(_upsert_org_id, _identifier_params(ct_idents, org_id))
 
     if all_award_ct_params:
         session.execute(_insert_award_ct, all_award_ct_params)
@@ -286,7 +305,33 @@ def save_document_core(session: Session, award_data: AwardDataModel) -> bool:
     return True
 
 
-def save_document(award_data: AwardDataModel) -> bool:
+def get_sync_state(portal: str) -> tuple[int | None, int | None]:
+    """Get a portal's (last_downloaded, last_imported) sync watermarks."""
+    with get_session() as session:
+        state = session.get(SyncState, portal)
+        if state is None:
+            return None, None
+        return state.last_downloaded, state.last_imported
+
+
+def save_sync_state(
+    portal: str,
+    last_downloaded: int | None = None,
+    last_imported: int | None = None,
+) -> None:
+    """Advance a portal's sync watermarks; None leaves a watermark unchanged."""
+    with get_session() as session:
+        session.execute(
+            _upsert_sync,
+            {
+                "portal": portal,
+                "last_downloaded": last_downloaded,
+                "last_imported": last_imported,
+            },
+        )
+
+
+def save_document(award_data: AwardDataRecord) -> bool:
     """Save a single award document to database in its own transaction.
 
     Returns True if saved, False if already exists.
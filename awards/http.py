@@ -0,0 +1,155 @@
+"""Shared HTTP client for portal downloads and rates fetching.
+
+A single requests.Session is shared by all fetchers so connections are
+kept alive and reused across requests (and threads), and transient
+failures are retried with jittered exponential backoff.
+
+fetch_cached() adds an on-disk cache for small, re-fetched resources
+(rate series): responses are stored with their validators and revalidated
+with If-None-Match / If-Modified-Since, so unchanged data costs a 304.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Connections kept open per host; should cover the download concurrency
+POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "16"))
+
+# Responses worth retrying: rate limiting and server-side failures
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Conditional-request cache for fetch_cached
+CACHE_DIR = Path(
+    os.getenv(
+        "HTTP_CACHE_DIR", str(Path(os.getenv("TED_DATA_DIR", "./data")) / ".http-cache")
+    )
+)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def build_retry(
+    attempts: int = 5, backoff_factor: float = 1.0, backoff_jitter: float = 1.0
+) -> Retry:
+    """Build the retry policy for idempotent requests.
+
+    Retries connection errors, read timeouts and RETRY_STATUSES with
+    exponential backoff (capped at 60s) plus random jitter, honoring the
+    server's Retry-After header. After the last attempt the final response
+    is returned as-is, so callers still see it via raise_for_status().
+    """
+    return Retry(
+        total=attempts,
+        connect=attempts,
+        read=attempts,
+        status=attempts,
+        backoff_factor=backoff_factor,
+        backoff_jitter=backoff_jitter,
+        backoff_max=60,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+def build_session(
+    pool_size: int = POOL_SIZE, retry: Optional[Retry] = None
+) -> requests.Session:
+    """Create a session with a sized connection pool and retry policy."""
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry if retry is not None else build_retry(),
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = "awards-scraper"
+    return session
+
+
+def get_http_session() -> requests.Session:
+    """Get the process-wide shared session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = build_session()
+    return _session
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file so readers only ever see the old or the new content."""
+    tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def _cache_paths(
+    cache_dir: Path, url: str, headers: dict[str, str]
+) -> tuple[Path, Path]:
+    """Cache file locations (body, metadata) for a URL and request headers."""
+    key_source = json.dumps([url, sorted(headers.items())])
+    key = hashlib.sha256(key_source.encode()).hexdigest()
+    return cache_dir / f"{key}.body", cache_dir / f"{key}.json"
+
+
+def fetch_cached(
+    url: str,
+    headers: Optional[dict[str, str]] = None,
+    timeout: float = 60,
+    cache_dir: Optional[Path] = None,
+) -> bytes:
+    """GET a URL through the conditional-request cache and return its body.
+
+    A cached copy is revalidated with the stored ETag / Last-Modified; on
+    304 Not Modified the cached body is returned without a transfer.
+    Responses without validators are not cached.
+
+    Raises:
+        requests.HTTPError: For error statuses
+    """
+    headers = dict(headers or {})
+    cache_dir = cache_dir or CACHE_DIR
+    body_path, meta_path = _cache_paths(cache_dir, url, headers)
+
+    meta = None
+    if meta_path.exists() and body_path.exists():
+        meta = json.loads(meta_path.read_text())
+
+    request_headers = dict(headers)
+    if meta is not None:
+        if meta.get("etag"):
+            request_headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            request_headers["If-Modified-Since"] = meta["last_modified"]
+
+    response = get_http_session().get(url, headers=request_headers, timeout=timeout)
+    if response.status_code == 304 and meta is not None:
+        logger.debug(f"Not modified, using cached copy of {url}")
+        return body_path.read_bytes()
+    response.raise_for_status()
+
+    body = response.content
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Body first: metadata only ever points at a complete body
+        _write_atomic(body_path, body)
+        meta = {"url": url, "etag": etag, "last_modified": last_modified}
+        _write_atomic(meta_path, json.dumps(meta).encode())
+    return body
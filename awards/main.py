@@ -11,6 +11,13 @@ logging.basicConfig(
     level=getattr(logging, os.getenv("LOG_LEVEL", "INFO")),
     format="%(asctime)s - %(levelname)s - %(message)s",
 )
+logger = logging.getLogger(__name__)
+
+
+def _check_storage(keep_archives: bool, awards_only: bool) -> None:
+    """Reject storage options that cannot be combined."""
+    if keep_archives and awards_only:
+        raise click.UsageError("--awards-only cannot be combined with --keep-archives")
 
 
 def _resolve_portals(portal_arg: str | None) -> list:
@@ -43,15 +50,39 @@ def cli():
     default=None,
     help="Comma-separated portal names (default: all)",
 )
-def download(start_year, end_year, portal):
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Number of packages to download in parallel",
+)
+@click.option(
+    "--keep-archives",
+    is_flag=True,
+    help="Store packages as .tar.gz archives instead of extracting them",
+)
+@click.option(
+    "--awards-only",
+    is_flag=True,
+    help="Only store award notices, dropping other notices at download time",
+)
+def download(start_year, end_year, portal, concurrency, keep_archives, awards_only):
     """Download packages without importing to database.
 
     Skips packages that are already downloaded.
     """
+    _check_storage(keep_archives, awards_only)
     if end_year is None:
         end_year = datetime.now().year
     for p in _resolve_portals(portal):
-        p.download(start_year, end_year)
+        p.download(
+            start_year,
+            end_year,
+            concurrency=concurrency,
+            keep_archives=keep_archives,
+            awards_only=awards_only,
+        )
 
 
 @cli.command(name="import")
@@ -63,15 +94,178 @@ def download(start_year, end_year, portal):
     default=None,
     help="Comma-separated portal names (default: all)",
 )
-def import_cmd(start_year, end_year, portal):
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of parse workers (default: number of CPUs)",
+)
+@click.option(
+    "--processes",
+    is_flag=True,
+    help="Parse in worker processes instead of threads (scales with cores)",
+)
+@click.option(
+    "--max-in-flight",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Files parsed ahead of the database writer (default: 256)",
+)
+@click.option(
+    "--validate",
+    is_flag=True,
+    help="Check every parsed notice against the schema before saving",
+)
+def import_cmd(
+    start_year, end_year, portal, workers, processes, max_in_flight, validate
+):
     """Import downloaded packages into the database."""
     if end_year is None:
         end_year = datetime.now().year
     for p in _resolve_portals(portal):
-        p.import_data(start_year, end_year)
+        p.import_data(
+            start_year,
+            end_year,
+            workers=workers,
+            processes=processes,
+            max_in_flight=max_in_flight,
+            validate=validate,
+        )
     refresh_materialized_view()
 
 
+@cli.command()
+@click.option("--start-year", type=int, required=True, help="Start year")
+@click.option("--end-year", type=int, help="End year (default: current year)")
+@click.option(
+    "--portal",
+    type=str,
+    default=None,
+    help="Comma-separated portal names (default: all)",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Number of packages to download in parallel",
+)
+@click.option(
+    "--keep-archives",
+    is_flag=True,
+    help="Store packages as .tar.gz archives instead of extracting them",
+)
+@click.option(
+    "--awards-only",
+    is_flag=True,
+    help="Only store award notices, dropping other notices at download time",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of parse workers (default: number of CPUs)",
+)
+@click.option(
+    "--processes",
+    is_flag=True,
+    help="Parse in worker processes instead of threads (scales with cores)",
+)
+def backfill(
+    start_year,
+    end_year,
+    portal,
+    concurrency,
+    keep_archives,
+    awards_only,
+    workers,
+    processes,
+):
+    """Download and import in one pass, overlapping the two.
+
+    Packages are parsed and imported while later ones are still
+    downloading. Already downloaded packages are imported too.
+    """
+    _check_storage(keep_archives, awards_only)
+    if end_year is None:
+        end_year = datetime.now().year
+    for p in _resolve_portals(portal):
+        p.backfill(
+            start_year,
+            end_year,
+            concurrency=concurrency,
+            keep_archives=keep_archives,
+            awards_only=awards_only,
+            workers=workers,
+            processes=processes,
+        )
+    refresh_materialized_view()
+
+
+@cli.command()
+@click.option(
+    "--start-year",
+    type=int,
+    help="Year to start from on the first sync (default: current year)",
+)
+@click.option(
+    "--portal",
+    type=str,
+    default=None,
+    help="Comma-separated portal names (default: all)",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Number of packages to download in parallel",
+)
+@click.option(
+    "--keep-archives",
+    is_flag=True,
+    help="Store packages as .tar.gz archives instead of extracting them",
+)
+@click.option(
+    "--awards-only",
+    is_flag=True,
+    help="Only store award notices, dropping other notices at download time",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of parse workers (default: number of CPUs)",
+)
+@click.option(
+    "--processes",
+    is_flag=True,
+    help="Parse in worker processes instead of threads (scales with cores)",
+)
+def sync(
+    start_year, portal, concurrency, keep_archives, awards_only, workers, processes
+):
+    """Download and import packages published since the last sync.
+
+    Refreshes the materialized view only if something was imported.
+    """
+    _check_storage(keep_archives, awards_only)
+    imported = 0
+    for p in _resolve_portals(portal):
+        imported += p.sync(
+            start_year,
+            concurrency=concurrency,
+            keep_archives=keep_archives,
+            awards_only=awards_only,
+            workers=workers,
+            processes=processes,
+        )
+    if imported:
+        refresh_materialized_view()
+    else:
+        logger.info("Nothing new imported, materialized view left as is")
+
+
 @cli.command(name="update-rates")
 @click.option("--start-year", type=int, default=2011, help="Start year (default: 2011)")
 @click.option("--end-year", type=int, help="End year (default: current year)")
@@ -354,3 +354,17 @@ class OrganizationIdentifier(Base):
         Index("idx_org_id_org", "organization_id"),
         Index("idx_org_id_scheme_id", "scheme", "identifier"),
     )
+
+
+class SyncState(Base):
+    """Per-portal watermarks for incremental sync.
+
+    Package numbers sort chronologically across years, so everything up to
+    and including a watermark is known to be downloaded (or imported).
+    """
+
+    __tablename__ = "sync_state"
+
+    portal: Mapped[str] = mapped_column(String, primary_key=True)
+    last_downloaded: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    last_imported: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
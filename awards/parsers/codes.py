@@ -10,9 +10,10 @@ OP-TED/ted-xml-data-converter mappings (xslt/other-mappings.xml).
 import logging
 from typing import NamedTuple, Optional
 
-from ..schema import (
-    AuthorityTypeEntry,
-    ProcedureTypeEntry,
+from .. import quality
+from ..records import (
+    AuthorityTypeRecord,
+    ProcedureTypeRecord,
 )
 
 logger = logging.getLogger(__name__)
@@ -93,7 +94,8 @@ def normalize_contract_nature_code(raw_code: Optional[str]) -> Optional[str]:
 
     Old-style numeric codes are mapped via CONTRACT_NATURE_CODE_MAP.
     TED v2 uppercase codes are mapped via TED_V2_CONTRACT_NATURE_TO_CANONICAL.
-    Known eForms codes pass through. Unknown codes log a warning and return None.
+    Known eForms codes pass through. Unknown codes are counted as a data-quality
+    issue and return None.
     """
     if raw_code is None:
         return None
@@ -107,7 +109,8 @@ def normalize_contract_nature_code(raw_code: Optional[str]) -> Optional[str]:
     if raw_code in CONTRACT_NATURE_CODES:
         return raw_code
 
-    logger.warning("Unknown contract nature code: %r", raw_code)
+    quality.record(quality.UNKNOWN_CODE, "contract_nature", raw_code)
+    logger.debug("Unknown contract nature code: %r", raw_code)
     return None
 
 
@@ -182,90 +185,112 @@ PROCEDURE_TYPE_DESCRIPTIONS: dict[str, str] = {
 }
 
 
+# Every possible result, built once: raw code -> shared, immutable entry.
+# Later updates win, so the precedence matches the docstrings below
+# (old-style codes, then R2.0.9 codes, then eForms codes passed through).
+_PROCEDURE_TYPE_ENTRIES: dict[str, ProcedureTypeRecord] = {
+    code: ProcedureTypeRecord(code=code, description=description)
+    for code, description in PROCEDURE_TYPE_DESCRIPTIONS.items()
+}
+
+
+def _procedure_type_result(
+    mapping: ProcedureMapping,
+) -> tuple[Optional[ProcedureTypeRecord], bool]:
+    if mapping.code is None:
+        return None, False
+    entry = _PROCEDURE_TYPE_ENTRIES.get(mapping.code) or ProcedureTypeRecord(
+        code=mapping.code
+    )
+    return entry, mapping.accelerated
+
+
+_PROCEDURE_TYPES: dict[str, tuple[Optional[ProcedureTypeRecord], bool]] = {
+    **{code: (entry, False) for code, entry in _PROCEDURE_TYPE_ENTRIES.items()},
+    **{raw: _procedure_type_result(m) for raw, m in TED_V2_TO_CANONICAL.items()},
+    **{raw: _procedure_type_result(m) for raw, m in PROCEDURE_TYPE_CODE_MAP.items()},
+    "unpublished": (None, False),
+}
+
+
 def normalize_procedure_type(
     raw_code: Optional[str], description: Optional[str]
-) -> tuple[Optional[ProcedureTypeEntry], bool]:
-    """Convert a raw procedure type code to a normalized ProcedureTypeEntry.
+) -> tuple[Optional[ProcedureTypeRecord], bool]:
+    """Convert a raw procedure type code to a normalized ProcedureTypeRecord.
 
     Returns (procedure_type_entry, accelerated) tuple.
     All codes normalize to exact eForms codes (lowercase, hyphens). Mapping chain:
     - R2.0.7/R2.0.8 numeric/letter codes (e.g. "1") → via PROCEDURE_TYPE_CODE_MAP
     - R2.0.9 canonical codes (e.g. "AWARD_CONTRACT_WITHOUT_CALL") → via TED_V2_TO_CANONICAL
-    - eForms codes (e.g. "neg-wo-call") → pass through as-is
+    - eForms codes (e.g. "neg-wo-call") → pass through as-is, keeping `description`
+      if given
+
+    Entries are shared between calls and must not be modified.
     """
-    if raw_code is None or raw_code == "unpublished":
+    if raw_code is None:
         return None, False
 
-    # Old-style numeric/letter code (R2.0.7/R2.0.8)
-    if raw_code in PROCEDURE_TYPE_CODE_MAP:
-        canonical, accelerated = PROCEDURE_TYPE_CODE_MAP[raw_code]
-        if canonical is None:
-            return None, False
-        return ProcedureTypeEntry(
-            code=canonical,
-            description=PROCEDURE_TYPE_DESCRIPTIONS.get(canonical),
-        ), accelerated
-
-    # TED v2 R2.0.9 uppercase code that needs remapping
-    if raw_code in TED_V2_TO_CANONICAL:
-        canonical, accelerated = TED_V2_TO_CANONICAL[raw_code]
-        if canonical is None:
-            return None, False
-        return ProcedureTypeEntry(
-            code=canonical,
-            description=PROCEDURE_TYPE_DESCRIPTIONS.get(canonical),
-        ), accelerated
-
-    # Known eForms code — pass through
-    if raw_code in PROCEDURE_TYPE_DESCRIPTIONS:
-        return ProcedureTypeEntry(
-            code=raw_code,
-            description=description or PROCEDURE_TYPE_DESCRIPTIONS[raw_code],
-        ), False
-
-    logger.warning("Unknown procedure type code: %r", raw_code)
-    return None, False
+    result = _PROCEDURE_TYPES.get(raw_code)
+    if result is None:
+        quality.record(quality.UNKNOWN_CODE, "procedure_type", raw_code)
+        logger.debug("Unknown procedure type code: %r", raw_code)
+        return None, False
+
+    entry = result[0]
+    if (
+        description
+        and entry is not None
+        and entry.code == raw_code
+        and description != entry.description
+    ):
+        return ProcedureTypeRecord(code=raw_code, description=description), False
+    return result
+
+
+_AUTHORITY_TYPE_ENTRIES: dict[str, AuthorityTypeRecord] = {
+    code: AuthorityTypeRecord(code=code, description=description)
+    for code, description in AUTHORITY_TYPE_DESCRIPTIONS.items()
+}
+
+
+def _authority_type_entry(canonical: Optional[str]) -> Optional[AuthorityTypeRecord]:
+    if canonical is None:
+        return None
+    return _AUTHORITY_TYPE_ENTRIES.get(canonical) or AuthorityTypeRecord(code=canonical)
+
+
+# Raw code -> shared entry, with the same precedence as _PROCEDURE_TYPES
+_AUTHORITY_TYPES: dict[str, Optional[AuthorityTypeRecord]] = {
+    **_AUTHORITY_TYPE_ENTRIES,
+    **{
+        raw: _authority_type_entry(canonical)
+        for raw, canonical in TED_V2_AUTHORITY_TO_CANONICAL.items()
+    },
+    **{
+        raw: _authority_type_entry(canonical)
+        for raw, canonical in AUTHORITY_TYPE_CODE_MAP.items()
+    },
+}
 
 
 def make_authority_type_entry(
     raw_code: Optional[str],
-) -> Optional[AuthorityTypeEntry]:
-    """Convert a raw authority type code to a normalized AuthorityTypeEntry.
+) -> Optional[AuthorityTypeRecord]:
+    """Convert a raw authority type code to a normalized AuthorityTypeRecord.
 
     All codes normalize to exact eForms codes (lowercase, hyphens). Mapping chain:
     - R2.0.7/R2.0.8 numeric/letter codes (e.g. "6") → via AUTHORITY_TYPE_CODE_MAP
     - R2.0.9 canonical codes (e.g. "BODY_PUBLIC") → via TED_V2_AUTHORITY_TO_CANONICAL
     - eForms codes (e.g. "body-pl") → pass through as-is
+
+    Entries are shared between calls and must not be modified.
     """
     if raw_code is None:
         return None
 
-    # Old-style numeric/letter code (R2.0.7/R2.0.8)
-    if raw_code in AUTHORITY_TYPE_CODE_MAP:
-        canonical = AUTHORITY_TYPE_CODE_MAP[raw_code]
-        if canonical is None:
-            return None
-        return AuthorityTypeEntry(
-            code=canonical,
-            description=AUTHORITY_TYPE_DESCRIPTIONS.get(canonical),
-        )
-
-    # TED v2 R2.0.9 uppercase code that needs remapping
-    if raw_code in TED_V2_AUTHORITY_TO_CANONICAL:
-        canonical = TED_V2_AUTHORITY_TO_CANONICAL[raw_code]
-        if canonical is None:
-            return None
-        return AuthorityTypeEntry(
-            code=canonical,
-            description=AUTHORITY_TYPE_DESCRIPTIONS.get(canonical),
-        )
-
-    # Known eForms code — pass through
-    if raw_code in AUTHORITY_TYPE_DESCRIPTIONS:
-        return AuthorityTypeEntry(
-            code=raw_code,
-            description=AUTHORITY_TYPE_DESCRIPTIONS[raw_code],
-        )
-
-    logger.warning("Unknown authority type code: %r", raw_code)
-    return None
+    try:
+        return _AUTHORITY_TYPES[raw_code]
+    except KeyError:
+        quality.record(quality.UNKNOWN_CODE, "authority_type", raw_code)
+        logger.debug("Unknown authority type code: %r", raw_code)
+        return None
@@ -8,23 +8,25 @@ Date formats in eForms UBL:
 
 import logging
 import re
+from dataclasses import replace
 from datetime import date
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from lxml import etree
 
-from ..schema import (
-    AwardDataModel,
-    DocumentModel,
-    OrganizationModel,
-    ContractModel,
-    CpvCodeEntry,
-    AwardModel,
-    IdentifierEntry,
+from .. import quality
+from ..records import (
+    AwardDataRecord,
+    DocumentRecord,
+    OrganizationRecord,
+    ContractRecord,
+    CpvCodeRecord,
+    AwardRecord,
+    IdentifierRecord,
 )
 from .codes import normalize_contract_nature_code, normalize_procedure_type
-from .xml import first_attr, first_text
+from .xml import first_attr, first_text, xml_parser
 
 
 def _parse_date_eforms(text: Optional[str]) -> Optional[date]:
@@ -61,7 +63,8 @@ def _parse_optional_int(text: Optional[str], field_name: str) -> Optional[int]:
     """Parse an optional integer field from eForms XML.
 
     Accepts plain integers ("3") and whole-number floats ("3.0") since
-    eForms UBL NumericType is decimal-based. Logs a warning for anything else.
+    eForms UBL NumericType is decimal-based. Anything else is counted as a
+    data-quality issue.
     """
     if text is None:
         return None
@@ -72,7 +75,8 @@ def _parse_optional_int(text: Optional[str], field_name: str) -> Optional[int]:
         return int(stripped)
     if re.match(r"^\d+\.0+$", stripped):
         return int(stripped.split(".")[0])
-    logger.warning(
+    quality.record(quality.INVALID_INTEGER, field_name, stripped)
+    logger.debug(
         "Invalid integer value for %s: %r",
         field_name,
         text,
@@ -92,36 +96,212 @@ NAMESPACES = {
 }
 
 
-def parse_xml_file(xml_file: Path) -> Optional[List[AwardDataModel]]:
+def _xpath(expr: str) -> etree.XPath:
+    """Compile an XPath expression against the eForms namespaces."""
+    return etree.XPath(expr, namespaces=NAMESPACES)
+
+
+# Compiled once at import; evaluated as EXPR(element)
+_PUBLICATION_DATE = _xpath(".//efac:Publication/efbc:PublicationDate")
+_ISSUE_DATE = _xpath(".//cbc:IssueDate")
+_SETTLED_CONTRACT_ISSUE_DATE = _xpath(".//efac:SettledContract/cbc:IssueDate")
+_NOTICE_ISSUE_DATE = _xpath(".//cac:ContractAwardNotice/cbc:IssueDate")
+_COUNTRY_CODES = _xpath(".//cac:Country/cbc:IdentificationCode/text()")
+_CONTRACTING_PARTY_ID = _xpath(
+    ".//cac:ContractingParty/cac:Party/cac:PartyIdentification/cbc:ID"
+)
+_COMPANY = _xpath(".//efac:Company")
+_PARTY_ID = _xpath(".//cac:PartyIdentification/cbc:ID")
+_PARTY_NAME = _xpath(".//cac:PartyName/cbc:Name")
+_STREET_NAME = _xpath(".//cac:PostalAddress/cbc:StreetName")
+_CITY_NAME = _xpath(".//cac:PostalAddress/cbc:CityName")
+_POSTAL_ZONE = _xpath(".//cac:PostalAddress/cbc:PostalZone")
+_ADDRESS_COUNTRY = _xpath(".//cac:PostalAddress/cac:Country/cbc:IdentificationCode")
+_TELEPHONE = _xpath(".//cac:Contact/cbc:Telephone")
+_EMAIL = _xpath(".//cac:Contact/cbc:ElectronicMail")
+_WEBSITE = _xpath(".//cbc:WebsiteURI")
+_ADDRESS_NUTS = _xpath(".//cac:PostalAddress/cbc:CountrySubentityCode")
+_COMPANY_ID = _xpath(".//cac:PartyLegalEntity/cbc:CompanyID")
+_SETTLED_CONTRACT_TITLE = _xpath(".//efac:SettledContract/cbc:Title")
+_MAIN_CPV = _xpath(
+    "./cac:ProcurementProject/cac:MainCommodityClassification"
+    "/cbc:ItemClassificationCode"
+)
+_ADDITIONAL_CPV = _xpath(
+    "./cac:ProcurementProject/cac:AdditionalCommodityClassification"
+    "/cbc:ItemClassificationCode"
+)
+_PROCUREMENT_TYPE = _xpath(".//cac:ProcurementProject/cbc:ProcurementTypeCode")
+_PROCEDURE_CODE = _xpath(".//cac:TenderingProcess/cbc:ProcedureCode")
+_LOT_PERFORMANCE_NUTS = _xpath(".//cac:RealizedLocation//cbc:CountrySubentityCode")
+_PROJECT_PERFORMANCE_NUTS = _xpath(
+    ".//cac:ProcurementProject/cac:RealizedLocation//cbc:CountrySubentityCode"
+)
+_ACCELERATED = _xpath(
+    ".//cac:TenderingProcess/cac:ProcessJustification"
+    "/cbc:ProcessReasonCode[@listName='accelerated-procedure']"
+)
+_ESTIMATED_VALUE = _xpath(
+    "cac:ProcurementProject/cac:RequestedTenderTotal/cbc:EstimatedOverallContractAmount"
+)
+_FRAMEWORK_AGREEMENT = _xpath(
+    ".//cbc:ContractingSystemTypeCode[@listName='framework-agreement']"
+)
+_EU_FUNDED = _xpath(".//cbc:FundingProgramCode[@listName='eu-funded']")
+_ID = _xpath("cbc:ID")
+_PLANNED_START_DATE = _xpath(".//cac:PlannedPeriod/cbc:StartDate")
+_PLANNED_END_DATE = _xpath(".//cac:PlannedPeriod/cbc:EndDate")
+_AWARD_DATE = _xpath(".//cac:TenderResult/cbc:AwardDate")
+_LOT_RESULT_LOT_ID = _xpath("efac:TenderLot/cbc:ID")
+_LOT_RESULT_TENDER_ID = _xpath("efac:LotTender/cbc:ID")
+_PAYABLE_AMOUNT = _xpath("cac:LegalMonetaryTotal/cbc:PayableAmount")
+_TENDERING_PARTY_ID = _xpath("efac:TenderingParty/cbc:ID")
+_LOT_RESULT_CONTRACT_ID = _xpath("efac:SettledContract/cbc:ID")
+_TITLE = _xpath("cbc:Title")
+_CONTRACT_REFERENCE = _xpath("efac:ContractReference/cbc:ID")
+_TENDERS_RECEIVED = _xpath(
+    "efac:ReceivedSubmissionsStatistics[efbc:StatisticsCode='tenders']"
+    "/efbc:StatisticsNumeric/text()"
+)
+_TENDERER_IDS = _xpath("efac:Tenderer/cbc:ID/text()")
+
+
+def _tag(prefix: str, name: str) -> str:
+    return f"{{{NAMESPACES[prefix]}}}{name}"
+
+
+_ORGANIZATIONS_TAG = _tag("efac", "Organizations")
+_ORGANIZATION_TAG = _tag("efac", "Organization")
+_NOTICE_RESULT_TAG = _tag("efac", "NoticeResult")
+_LOT_TENDER_TAG = _tag("efac", "LotTender")
+_SETTLED_CONTRACT_TAG = _tag("efac", "SettledContract")
+_TENDERING_PARTY_TAG = _tag("efac", "TenderingParty")
+_LOT_RESULT_TAG = _tag("efac", "LotResult")
+_LOT_TAG = _tag("cac", "ProcurementProjectLot")
+
+
+def _element_id(elem: etree._Element, xpath: etree.XPath = _ID) -> Optional[str]:
+    """Raw text of an element's ID, None if missing or empty."""
+    id_elems = xpath(elem)
+    return id_elems[0].text if id_elems and id_elems[0].text else None
+
+
+class _NoticeIndex:
+    """Elements of a notice that are resolved by ID, collected in one pass.
+
+    eForms links organizations, tenders, contracts and lots through ID
+    references. Walking the tree once for all of them, instead of one
+    descendant scan per element kind, keeps notices with hundreds of lots
+    linear. Shared by buyer, contract and award extraction.
+    """
+
+    def __init__(self, root: etree._Element):
+        # Company of the first organization, the buyer fallback
+        self.first_company: Optional[etree._Element] = None
+        # Companies by organization ID: for a repeated ID, the buyer lookup
+        # uses the first organization and the contractor lookup the last
+        self.buyer_companies: dict[str, etree._Element] = {}
+        self.companies: dict[str, etree._Element] = {}
+        self.lot_tenders: dict[str, etree._Element] = {}
+        self.settled_contracts: dict[str, etree._Element] = {}
+        self.tendering_parties: dict[str, etree._Element] = {}
+        self.lots: list[etree._Element] = []
+        self.lot_results: list[etree._Element] = []
+
+        # LotTender, SettledContract and TenderingParty also occur as ID
+        # references inside other elements; only NoticeResult children count
+        by_id = {
+            _LOT_TENDER_TAG: self.lot_tenders,
+            _SETTLED_CONTRACT_TAG: self.settled_contracts,
+            _TENDERING_PARTY_TAG: self.tendering_parties,
+        }
+        first_org = True
+        for elem in root.iter(_ORGANIZATION_TAG, _LOT_RESULT_TAG, _LOT_TAG, *by_id):
+            tag = elem.tag
+            parent = elem.getparent()
+            parent_tag = parent.tag if parent is not None else None
+            if tag == _LOT_RESULT_TAG:
+                self.lot_results.append(elem)
+            elif tag == _LOT_TAG:
+                self.lots.append(elem)
+            elif tag == _ORGANIZATION_TAG:
+                if parent_tag != _ORGANIZATIONS_TAG:
+                    continue
+                companies = _COMPANY(elem)
+                company = companies[0] if companies else None
+                if first_org:
+                    self.first_company = company
+                    first_org = False
+                if company is not None:
+                    org_id = _element_id(company, _PARTY_ID)
+                    if org_id:
+                        self.buyer_companies.setdefault(org_id, company)
+                        self.companies[org_id] = company
+            elif parent_tag == _NOTICE_RESULT_TAG:
+                elem_id = _element_id(elem)
+                if elem_id:
+                    by_id[tag][elem_id] = elem
+
+    def first_in_lots(self, xpath: etree.XPath) -> list:
+        """Results of a lot-relative expression for the first lot matching it."""
+        for lot in self.lots:
+            result = xpath(lot)
+            if result:
+                return result
+        return []
+
+
+def parse_xml_file(xml_file: Path) -> Optional[List[AwardDataRecord]]:
     """Parse eForms UBL XML file and return structured data."""
+    return _parse(xml_file, xml_file)
+
+
+def parse_xml_bytes(
+    data: bytes, source_name: Union[str, Path]
+) -> Optional[List[AwardDataRecord]]:
+    """Parse a eForms UBL notice held in memory (e.g. a package archive member).
+
+    `source_name` is the notice's file name; it stands in for the file path
+    where parse_xml_file uses it (doc ID fallback, log messages).
+    """
+    return _parse(data, Path(source_name))
+
+
+def _parse(
+    source: Union[bytes, Path], xml_file: Path
+) -> Optional[List[AwardDataRecord]]:
     try:
-        tree = etree.parse(xml_file)
-        root = tree.getroot()
+        if isinstance(source, bytes):
+            root = etree.fromstring(source, xml_parser())
+        else:
+            root = etree.parse(source, xml_parser()).getroot()
 
         document = _extract_document_info(root, xml_file)
         if not document:
             return None
 
-        buyer, contact_fields = _extract_buyer(root)
+        index = _NoticeIndex(root)
+
+        buyer, contact_fields = _extract_buyer(root, index)
         if not buyer:
             logger.debug(f"No contracting body found in {xml_file.name}")
             return None
 
         # Add contact fields to document
-        document = document.model_copy(update=contact_fields)
+        document = replace(document, **contact_fields)
 
-        contract = _extract_contract_info(root)
+        contract = _extract_contract_info(root, index)
         if not contract:
             logger.debug(f"No contract info found in {xml_file.name}")
             return None
 
-        awards = _extract_awards(root)
+        awards = _extract_awards(root, index)
         if not awards:
             logger.debug(f"No awards found in {xml_file.name}")
             return None
 
         return [
-            AwardDataModel(
+            AwardDataRecord(
                 document=document,
                 buyer=buyer,
                 contract=contract,
@@ -136,7 +316,7 @@ def parse_xml_file(xml_file: Path) -> Optional[List[AwardDataModel]]:
 
 def _extract_document_info(
     root: etree._Element, xml_file: Path
-) -> Optional[DocumentModel]:
+) -> Optional[DocumentRecord]:
     """Extract document metadata from eForms UBL."""
     # Extract document ID from filename
     doc_id = xml_file.stem
@@ -145,10 +325,10 @@ def _extract_document_info(
 
     # Extract publication date from various possible locations
     pub_date_elem = (
-        root.xpath(".//efac:Publication/efbc:PublicationDate", namespaces=NAMESPACES)
-        or root.xpath(".//cbc:IssueDate", namespaces=NAMESPACES)
-        or root.xpath(".//efac:SettledContract/cbc:IssueDate", namespaces=NAMESPACES)
-        or root.xpath(".//cac:ContractAwardNotice/cbc:IssueDate", namespaces=NAMESPACES)
+        _PUBLICATION_DATE(root)
+        or _ISSUE_DATE(root)
+        or _SETTLED_CONTRACT_ISSUE_DATE(root)
+        or _NOTICE_ISSUE_DATE(root)
     )
 
     if not pub_date_elem or not pub_date_elem[0].text:
@@ -161,9 +341,7 @@ def _extract_document_info(
         return None
 
     # Extract sender country
-    countries = root.xpath(
-        ".//cac:Country/cbc:IdentificationCode/text()", namespaces=NAMESPACES
-    )
+    countries = _COUNTRY_CODES(root)
     country = countries[0] if countries else ""
 
     # Create official journal reference
@@ -171,7 +349,7 @@ def _extract_document_info(
     day_of_year = pub_date.timetuple().tm_yday
     official_ref = f"{year}/S {day_of_year:03d}-{doc_id}"
 
-    return DocumentModel(
+    return DocumentRecord(
         doc_id=doc_id,
         edition=f"{year}{day_of_year:03d}",
         version="eForms-UBL",
@@ -183,78 +361,35 @@ def _extract_document_info(
 
 
 def _extract_buyer(
-    root: etree._Element,
-) -> tuple[Optional[OrganizationModel], dict]:
+    root: etree._Element, index: _NoticeIndex
+) -> tuple[Optional[OrganizationRecord], dict]:
     """Extract buyer organization from eForms UBL.
 
     Returns (organization, contact_fields_dict).
     Contact fields belong on the document, not the organization.
     """
     # Find the contracting party organization ID
-    contracting_party_id_elem = root.xpath(
-        ".//cac:ContractingParty/cac:Party/cac:PartyIdentification/cbc:ID",
-        namespaces=NAMESPACES,
-    )
-    contracting_party_id = (
-        contracting_party_id_elem[0].text
-        if contracting_party_id_elem and contracting_party_id_elem[0].text
-        else None
-    )
-
-    company_elem = None
+    contracting_party_id = _element_id(root, _CONTRACTING_PARTY_ID)
 
     if not contracting_party_id:
         # Fallback to first organization
-        orgs = root.xpath(
-            ".//efac:Organizations/efac:Organization", namespaces=NAMESPACES
-        )
-        if orgs:
-            company_elem = orgs[0].find(".//efac:Company", NAMESPACES)
+        company_elem = index.first_company
     else:
         # Find the organization with matching ID
-        orgs = root.xpath(
-            ".//efac:Organizations/efac:Organization", namespaces=NAMESPACES
-        )
-        for org in orgs:
-            company = org.find(".//efac:Company", NAMESPACES)
-            if company is not None:
-                org_id_elem = company.xpath(
-                    ".//cac:PartyIdentification/cbc:ID", namespaces=NAMESPACES
-                )
-                org_id = (
-                    org_id_elem[0].text if org_id_elem and org_id_elem[0].text else None
-                )
-                if org_id == contracting_party_id:
-                    company_elem = company
-                    break
+        company_elem = index.buyer_companies.get(contracting_party_id)
 
     if company_elem is None:
         return None, {}
 
-    name_elem = company_elem.xpath(".//cac:PartyName/cbc:Name", namespaces=NAMESPACES)
-    address_elem = company_elem.xpath(
-        ".//cac:PostalAddress/cbc:StreetName", namespaces=NAMESPACES
-    )
-    town_elem = company_elem.xpath(
-        ".//cac:PostalAddress/cbc:CityName", namespaces=NAMESPACES
-    )
-    postal_elem = company_elem.xpath(
-        ".//cac:PostalAddress/cbc:PostalZone", namespaces=NAMESPACES
-    )
-    country_elem = company_elem.xpath(
-        ".//cac:PostalAddress/cac:Country/cbc:IdentificationCode",
-        namespaces=NAMESPACES,
-    )
-    phone_elem = company_elem.xpath(
-        ".//cac:Contact/cbc:Telephone", namespaces=NAMESPACES
-    )
-    email_elem = company_elem.xpath(
-        ".//cac:Contact/cbc:ElectronicMail", namespaces=NAMESPACES
-    )
-    url_elem = company_elem.xpath(".//cbc:WebsiteURI", namespaces=NAMESPACES)
-    nuts_elem = company_elem.xpath(
-        ".//cac:PostalAddress/cbc:CountrySubentityCode", namespaces=NAMESPACES
-    )
+    name_elem = _PARTY_NAME(company_elem)
+    address_elem = _STREET_NAME(company_elem)
+    town_elem = _CITY_NAME(company_elem)
+    postal_elem = _POSTAL_ZONE(company_elem)
+    country_elem = _ADDRESS_COUNTRY(company_elem)
+    phone_elem = _TELEPHONE(company_elem)
+    email_elem = _EMAIL(company_elem)
+    url_elem = _WEBSITE(company_elem)
+    nuts_elem = _ADDRESS_NUTS(company_elem)
 
     contact_fields = {
         "phone": first_text(phone_elem),
@@ -264,22 +399,21 @@ def _extract_buyer(
 
     # Extract organization identifier (BT-501)
     identifiers = []
-    company_id_elem = company_elem.xpath(
-        ".//cac:PartyLegalEntity/cbc:CompanyID", namespaces=NAMESPACES
-    )
+    company_id_elem = _COMPANY_ID(company_elem)
     company_id = first_text(company_id_elem)
     if company_id:
         scheme = first_attr(company_id_elem, "schemeName")
         scheme_id = first_attr(company_id_elem, "schemeID")
         if scheme_id:
-            logger.warning(
+            quality.record(quality.UNEXPECTED_SCHEME_ID, "CompanyID", scheme_id)
+            logger.debug(
                 "CompanyID has schemeID=%r (not part of eForms SDK), value=%r",
                 scheme_id,
                 company_id,
             )
-        identifiers.append(IdentifierEntry(scheme=scheme, identifier=company_id))
+        identifiers.append(IdentifierRecord(scheme=scheme, identifier=company_id))
 
-    org = OrganizationModel(
+    org = OrganizationRecord(
         official_name=first_text(name_elem) or "",
         address=first_text(address_elem),
         town=first_text(town_elem),
@@ -292,72 +426,51 @@ def _extract_buyer(
     return org, contact_fields
 
 
-def _extract_contract_info(root: etree._Element) -> Optional[ContractModel]:
+def _extract_contract_info(
+    root: etree._Element, index: _NoticeIndex
+) -> Optional[ContractRecord]:
     """Extract contract information from eForms UBL."""
-    title_elem = root.xpath(".//efac:SettledContract/cbc:Title", namespaces=NAMESPACES)
+    title_elem = _SETTLED_CONTRACT_TITLE(root)
     title = first_text(title_elem) or ""
 
     # Main CPV from top-level ProcurementProject (direct child, not lot-level to avoid duplicates)
-    cpv_main_elems = root.xpath(
-        "./cac:ProcurementProject/cac:MainCommodityClassification/cbc:ItemClassificationCode",
-        namespaces=NAMESPACES,
-    )
+    cpv_main_elems = _MAIN_CPV(root)
 
     # Additional CPVs from top-level ProcurementProject (direct child)
-    cpv_additional_elems = root.xpath(
-        "./cac:ProcurementProject/cac:AdditionalCommodityClassification/cbc:ItemClassificationCode",
-        namespaces=NAMESPACES,
-    )
+    cpv_additional_elems = _ADDITIONAL_CPV(root)
 
-    nature_elem = root.xpath(
-        ".//cac:ProcurementProject/cbc:ProcurementTypeCode", namespaces=NAMESPACES
-    )
-    proc_elem = root.xpath(
-        ".//cac:TenderingProcess/cbc:ProcedureCode", namespaces=NAMESPACES
-    )
+    nature_elem = _PROCUREMENT_TYPE(root)
+    proc_elem = _PROCEDURE_CODE(root)
 
     # Performance location NUTS - try lot-level first, then main project level
-    nuts_elem = root.xpath(
-        ".//cac:ProcurementProjectLot//cac:RealizedLocation//cbc:CountrySubentityCode",
-        namespaces=NAMESPACES,
-    ) or root.xpath(
-        ".//cac:ProcurementProject/cac:RealizedLocation//cbc:CountrySubentityCode",
-        namespaces=NAMESPACES,
-    )
+    lot_nuts_elem = index.first_in_lots(_LOT_PERFORMANCE_NUTS)
+    nuts_elem = lot_nuts_elem or _PROJECT_PERFORMANCE_NUTS(root)
 
     # Build CPV codes list (no descriptions available in eForms)
-    cpv_codes: list[CpvCodeEntry] = []
+    cpv_codes: list[CpvCodeRecord] = []
 
     main_code = first_text(cpv_main_elems)
     if main_code:
-        cpv_codes.append(CpvCodeEntry(code=main_code))
+        cpv_codes.append(CpvCodeRecord(code=main_code))
 
     for additional_elem in cpv_additional_elems:
         additional_code = additional_elem.text
         if additional_code and additional_code.strip():
-            cpv_codes.append(CpvCodeEntry(code=additional_code.strip()))
+            cpv_codes.append(CpvCodeRecord(code=additional_code.strip()))
 
     proc_code = first_text(proc_elem)
     procedure_type, accelerated = normalize_procedure_type(proc_code, None)
 
     # BT-106: Procedure Accelerated — separate boolean in eForms
     if not accelerated:
-        accel_elems = root.xpath(
-            ".//cac:TenderingProcess/cac:ProcessJustification"
-            "/cbc:ProcessReasonCode[@listName='accelerated-procedure']",
-            namespaces=NAMESPACES,
-        )
+        accel_elems = _ACCELERATED(root)
         if accel_elems and first_text(accel_elems) == "true":
             accelerated = True
 
     # BT-27: Estimated value from lot-level ProcurementProject
     estimated_value = None
     estimated_value_currency = None
-    est_val_elems = root.xpath(
-        ".//cac:ProcurementProjectLot/cac:ProcurementProject"
-        "/cac:RequestedTenderTotal/cbc:EstimatedOverallContractAmount",
-        namespaces=NAMESPACES,
-    )
+    est_val_elems = index.first_in_lots(_ESTIMATED_VALUE)
     if est_val_elems and est_val_elems[0].text:
         try:
             from decimal import Decimal
@@ -368,11 +481,7 @@ def _extract_contract_info(root: etree._Element) -> Optional[ContractModel]:
             pass
 
     # BT-765: Framework agreement
-    framework_elems = root.xpath(
-        ".//cac:ProcurementProjectLot//cbc:ContractingSystemTypeCode"
-        "[@listName='framework-agreement']",
-        namespaces=NAMESPACES,
-    )
+    framework_elems = index.first_in_lots(_FRAMEWORK_AGREEMENT)
     framework_agreement = False
     if framework_elems:
         fw_value = first_text(framework_elems)
@@ -380,17 +489,14 @@ def _extract_contract_info(root: etree._Element) -> Optional[ContractModel]:
             framework_agreement = True
 
     # BT-60: EU funded
-    eu_funded_elems = root.xpath(
-        ".//cac:ProcurementProjectLot//cbc:FundingProgramCode[@listName='eu-funded']",
-        namespaces=NAMESPACES,
-    )
+    eu_funded_elems = index.first_in_lots(_EU_FUNDED)
     eu_funded = False
     if eu_funded_elems:
         eu_value = first_text(eu_funded_elems)
         if eu_value == "eu-funds":
             eu_funded = True
 
-    return ContractModel(
+    return ContractRecord(
         title=title,
         short_description=title,
         main_cpv_code=main_code,
@@ -406,7 +512,7 @@ def _extract_contract_info(root: etree._Element) -> Optional[ContractModel]:
     )
 
 
-def _extract_awards(root: etree._Element) -> List[AwardModel]:
+def _extract_awards(root: etree._Element, index: _NoticeIndex) -> List[AwardRecord]:
     """Extract award information from eForms UBL using reference-based lookups.
 
     eForms uses ID cross-references between sibling elements under NoticeResult:
@@ -417,57 +523,18 @@ def _extract_awards(root: etree._Element) -> List[AwardModel]:
     """
     awards = []
 
-    # Build organization lookup: org_id -> Company element
-    org_lookup: dict[str, etree._Element] = {}
-    for org in root.xpath(
-        ".//efac:Organizations/efac:Organization", namespaces=NAMESPACES
-    ):
-        company = org.find(".//efac:Company", NAMESPACES)
-        if company is not None:
-            org_id_elem = company.xpath(
-                ".//cac:PartyIdentification/cbc:ID", namespaces=NAMESPACES
-            )
-            org_id = (
-                org_id_elem[0].text if org_id_elem and org_id_elem[0].text else None
-            )
-            if org_id:
-                org_lookup[org_id] = company
-
-    # Build lookup dicts from NoticeResult sibling elements
-    lot_tenders: dict[str, etree._Element] = {}
-    for lt in root.xpath(".//efac:NoticeResult/efac:LotTender", namespaces=NAMESPACES):
-        tender_id_elem = lt.xpath("cbc:ID", namespaces=NAMESPACES)
-        if tender_id_elem and tender_id_elem[0].text:
-            lot_tenders[tender_id_elem[0].text] = lt
-
-    settled_contracts: dict[str, etree._Element] = {}
-    for sc in root.xpath(
-        ".//efac:NoticeResult/efac:SettledContract", namespaces=NAMESPACES
-    ):
-        contract_id_elem = sc.xpath("cbc:ID", namespaces=NAMESPACES)
-        if contract_id_elem and contract_id_elem[0].text:
-            settled_contracts[contract_id_elem[0].text] = sc
-
-    tendering_parties: dict[str, etree._Element] = {}
-    for tp in root.xpath(
-        ".//efac:NoticeResult/efac:TenderingParty", namespaces=NAMESPACES
-    ):
-        party_id_elem = tp.xpath("cbc:ID", namespaces=NAMESPACES)
-        if party_id_elem and party_id_elem[0].text:
-            tendering_parties[party_id_elem[0].text] = tp
+    org_lookup = index.companies
+    lot_tenders = index.lot_tenders
+    settled_contracts = index.settled_contracts
+    tendering_parties = index.tendering_parties
 
     # Build lot PlannedPeriod lookup: lot_id -> (start_date, end_date)
     lot_periods: dict[str, tuple[Optional[date], Optional[date]]] = {}
-    for lot_elem in root.xpath(".//cac:ProcurementProjectLot", namespaces=NAMESPACES):
-        lot_id_elem = lot_elem.xpath("cbc:ID", namespaces=NAMESPACES)
-        if lot_id_elem and lot_id_elem[0].text:
-            lot_id = lot_id_elem[0].text
-            start_elems = lot_elem.xpath(
-                ".//cac:PlannedPeriod/cbc:StartDate", namespaces=NAMESPACES
-            )
-            end_elems = lot_elem.xpath(
-                ".//cac:PlannedPeriod/cbc:EndDate", namespaces=NAMESPACES
-            )
+    for lot_elem in index.lots:
+        lot_id = _element_id(lot_elem)
+        if lot_id:
+            start_elems = _PLANNED_START_DATE(lot_elem)
+            end_elems = _PLANNED_END_DATE(lot_elem)
             start_date = (
                 _parse_date_eforms(start_elems[0].text) if start_elems else None
             )
@@ -476,9 +543,7 @@ def _extract_awards(root: etree._Element) -> List[AwardModel]:
 
     # Extract award_date from TenderResult (document-level)
     award_date = None
-    award_date_elems = root.xpath(
-        ".//cac:TenderResult/cbc:AwardDate", namespaces=NAMESPACES
-    )
+    award_date_elems = _AWARD_DATE(root)
     if award_date_elems:
         parsed = _parse_date_eforms(award_date_elems[0].text)
         # Skip placeholder values like 2000-01-01
@@ -486,16 +551,13 @@ def _extract_awards(root: etree._Element) -> List[AwardModel]:
             award_date = parsed
 
     # Process each LotResult
-    lot_results = root.xpath(".//efac:LotResult", namespaces=NAMESPACES)
-    for lot_result in lot_results:
+    for lot_result in index.lot_results:
         # Get lot number
-        lot_ref_elems = lot_result.xpath("efac:TenderLot/cbc:ID", namespaces=NAMESPACES)
+        lot_ref_elems = _LOT_RESULT_LOT_ID(lot_result)
         lot_number = first_text(lot_ref_elems)
 
         # Get tender ID -> look up LotTender -> extract value + TenderingParty ID
-        tender_ref_elems = lot_result.xpath(
-            "efac:LotTender/cbc:ID", namespaces=NAMESPACES
-        )
+        tender_ref_elems = _LOT_RESULT_TENDER_ID(lot_result)
         tender_id = first_text(tender_ref_elems)
 
         awarded_value = None
@@ -503,9 +565,7 @@ def _extract_awards(root: etree._Element) -> List[AwardModel]:
         party_id = None
         if tender_id and tender_id in lot_tenders:
             lot_tender = lot_tenders[tender_id]
-            amount_elems = lot_tender.xpath(
-                "cac:LegalMonetaryTotal/cbc:PayableAmount", namespaces=NAMESPACES
-            )
+            amount_elems = _PAYABLE_AMOUNT(lot_tender)
             if amount_elems and amount_elems[0].text:
                 try:
                     awarded_value = float(amount_elems[0].text)
@@ -517,33 +577,24 @@ def _extract_awards(root: etree._Element) -> List[AwardModel]:
                 awarded_currency = amount_elems[0].get("currencyID")
 
             # Get TenderingParty ID from LotTender
-            party_ref_elems = lot_tender.xpath(
-                "efac:TenderingParty/cbc:ID", namespaces=NAMESPACES
-            )
+            party_ref_elems = _TENDERING_PARTY_ID(lot_tender)
             party_id = first_text(party_ref_elems)
 
         # Get contract ID -> look up SettledContract -> extract title + contract number
-        contract_ref_elems = lot_result.xpath(
-            "efac:SettledContract/cbc:ID", namespaces=NAMESPACES
-        )
+        contract_ref_elems = _LOT_RESULT_CONTRACT_ID(lot_result)
         contract_id = first_text(contract_ref_elems)
 
         award_title = None
         contract_number = None
         if contract_id and contract_id in settled_contracts:
             sc = settled_contracts[contract_id]
-            title_elems = sc.xpath("cbc:Title", namespaces=NAMESPACES)
+            title_elems = _TITLE(sc)
             award_title = first_text(title_elems)
-            ref_elems = sc.xpath("efac:ContractReference/cbc:ID", namespaces=NAMESPACES)
+            ref_elems = _CONTRACT_REFERENCE(sc)
             contract_number = first_text(ref_elems)
 
         # Extract tenders_received from ReceivedSubmissionsStatistics
-        stats = lot_result.xpath(
-            "efac:ReceivedSubmissionsStatistics"
-            "[efbc:StatisticsCode='tenders']"
-            "/efbc:StatisticsNumeric/text()",
-            namespaces=NAMESPACES,
-        )
+        stats = _TENDERS_RECEIVED(lot_result)
         tenders_received = (
             _parse_optional_int(stats[0], "tenders_received") if stats else None
         )
@@ -552,9 +603,7 @@ def _extract_awards(root: etree._Element) -> List[AwardModel]:
         contractors = []
         if party_id and party_id in tendering_parties:
             tp = tendering_parties[party_id]
-            tenderer_org_ids = tp.xpath(
-                "efac:Tenderer/cbc:ID/text()", namespaces=NAMESPACES
-            )
+            tenderer_org_ids = _TENDERER_IDS(tp)
             for org_id in tenderer_org_ids:
                 if org_id in org_lookup:
                     contractor = _company_to_contractor(org_lookup[org_id])
@@ -568,7 +617,7 @@ def _extract_awards(root: etree._Element) -> List[AwardModel]:
             contract_start_date, contract_end_date = lot_periods[lot_number]
 
         awards.append(
-            AwardModel(
+            AwardRecord(
                 award_title=award_title,
                 contract_number=contract_number,
                 awarded_value=awarded_value,
@@ -587,49 +636,36 @@ def _extract_awards(root: etree._Element) -> List[AwardModel]:
 
 def _company_to_contractor(
     company_elem: etree._Element,
-) -> Optional[OrganizationModel]:
-    """Convert an eForms Company element to an OrganizationModel."""
-    name_elem = company_elem.xpath(".//cac:PartyName/cbc:Name", namespaces=NAMESPACES)
+) -> Optional[OrganizationRecord]:
+    """Convert an eForms Company element to an OrganizationRecord."""
+    name_elem = _PARTY_NAME(company_elem)
     official_name = first_text(name_elem)
     if not official_name:
         return None
 
-    address_elem = company_elem.xpath(
-        ".//cac:PostalAddress/cbc:StreetName", namespaces=NAMESPACES
-    )
-    town_elem = company_elem.xpath(
-        ".//cac:PostalAddress/cbc:CityName", namespaces=NAMESPACES
-    )
-    postal_elem = company_elem.xpath(
-        ".//cac:PostalAddress/cbc:PostalZone", namespaces=NAMESPACES
-    )
-    country_elem = company_elem.xpath(
-        ".//cac:PostalAddress/cac:Country/cbc:IdentificationCode",
-        namespaces=NAMESPACES,
-    )
-    nuts_elem = company_elem.xpath(
-        ".//cac:PostalAddress/cbc:CountrySubentityCode",
-        namespaces=NAMESPACES,
-    )
+    address_elem = _STREET_NAME(company_elem)
+    town_elem = _CITY_NAME(company_elem)
+    postal_elem = _POSTAL_ZONE(company_elem)
+    country_elem = _ADDRESS_COUNTRY(company_elem)
+    nuts_elem = _ADDRESS_NUTS(company_elem)
 
     # Extract organization identifier (BT-501)
     identifiers = []
-    company_id_elem = company_elem.xpath(
-        ".//cac:PartyLegalEntity/cbc:CompanyID", namespaces=NAMESPACES
-    )
+    company_id_elem = _COMPANY_ID(company_elem)
     company_id = first_text(company_id_elem)
     if company_id:
         scheme = first_attr(company_id_elem, "schemeName")
         scheme_id = first_attr(company_id_elem, "schemeID")
         if scheme_id:
-            logger.warning(
+            quality.record(quality.UNEXPECTED_SCHEME_ID, "CompanyID", scheme_id)
+            logger.debug(
                 "CompanyID has schemeID=%r (not part of eForms SDK), value=%r",
                 scheme_id,
                 company_id,
             )
-        identifiers.append(IdentifierEntry(scheme=scheme, identifier=company_id))
+        identifiers.append(IdentifierRecord(scheme=scheme, identifier=company_id))
 
-    return OrganizationModel(
+    return OrganizationRecord(
         official_name=official_name,
         address=first_text(address_elem),
         town=first_text(town_elem),
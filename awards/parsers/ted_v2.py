@@ -8,28 +8,34 @@ Date formats in TED 2.0:
 - CONTRACT_AWARD_DATE (R2.0.7/R2.0.8): nested <DAY>/<MONTH>/<YEAR> XML elements
 """
 
+import io
 import logging
 import re
+from dataclasses import replace
 from datetime import date
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, Callable, List, Optional, Union
 
 from lxml import etree
 
-from ..schema import (
-    AwardDataModel,
-    DocumentModel,
-    OrganizationModel,
-    ContractModel,
-    CpvCodeEntry,
-    IdentifierEntry,
-    AwardModel,
+from .. import quality
+from ..records import (
+    AwardDataRecord,
+    DocumentRecord,
+    OrganizationRecord,
+    ContractRecord,
+    CpvCodeRecord,
+    IdentifierRecord,
+    AwardRecord,
 )
 from .monetary import parse_monetary_value
 from .xml import (
     elem_text,
     elem_attr,
     element_text,
+    iterparse,
+    xml_parser,
 )
 from .codes import (
     normalize_contract_nature_code,
@@ -40,10 +46,149 @@ from .codes import (
 logger = logging.getLogger(__name__)
 
 
-def _default_ns(elem: etree._Element) -> str:
-    """Get the default namespace wrapped in braces for use in find/findall."""
-    ns = elem.nsmap.get(None)
-    return f"{{{ns}}}" if ns else ""
+# Default namespace of R2.0.7/R2.0.8 notices
+TED_EXPORT_NS = "http://publications.europa.eu/TED_schema/Export"
+
+# Bytes searched for the root element by _detect_variant_from_header
+_HEADER_SIZE = 3000
+
+# Notices at least this large are parsed incrementally, extracting and
+# dropping each award as it completes; smaller ones are faster to parse whole
+STREAMING_THRESHOLD = 1024 * 1024
+
+# Top-level sections no extractor reads (links, title translations)
+_UNUSED_SECTIONS = frozenset({"LINKS_SECTION", "TRANSLATION_SECTION"})
+
+# Elements handled while streaming: unused sections and award candidates
+_STREAMED_TAGS = (
+    *(f"{{*}}{section}" for section in sorted(_UNUSED_SECTIONS)),
+    "{*}AWARD_CONTRACT",
+    "{*}AWARD_OF_CONTRACT",
+)
+
+_SCHEMA_LOCATION = "{http://www.w3.org/2001/XMLSchema-instance}schemaLocation"
+
+_ROOT_TAG_RE = re.compile(rb"<TED_EXPORT\b[^>]*>")
+_SCHEMA_LOCATION_RE = re.compile(rb"schemaLocation\s*=\s*[\"']([^\"']*)")
+
+# Tags looked up inside an already located element (".//TAG")
+_NESTED_TAGS = (
+    "ADDRESS",
+    "ADDRESS_CONTRACTING_BODY",
+    "AWARDED_CONTRACT",
+    "CA_ACTIVITY",
+    "CA_TYPE",
+    "CONTACT_DATA_WITHOUT_RESPONSIBLE_NAME",
+    "CONTACT_POINT",
+    "CONTRACT_AWARD_DATE",
+    "CONTRACT_NO",
+    "CONTRACT_NUMBER",
+    "CONTRACT_TITLE",
+    "CONTRACT_VALUE_INFORMATION",
+    "CONTRACTOR",
+    "COUNTRY",
+    "DATE_CONCLUSION_CONTRACT",
+    "DAY",
+    "E_MAIL",
+    "ECONOMIC_OPERATOR_NAME_ADDRESS",
+    "MONTH",
+    "NATIONALID",
+    "NB_TENDERS_RECEIVED",
+    "OFFERS_RECEIVED_NUMBER",
+    "OFFICIALNAME",
+    "ORGANISATION",
+    "PHONE",
+    "POSTAL_CODE",
+    "SHORT_DESCR",
+    "TITLE",
+    "TOWN",
+    "TYPE_CONTRACT",
+    "URL_BUYER",
+    "URL_GENERAL",
+    "VAL_ESTIMATED_TOTAL",
+    "VAL_TOTAL",
+    "YEAR",
+)
+
+
+class _Tags:
+    """Tag names and lookup paths of one TED 2.0 namespace, built once.
+
+    Coded data sits at fixed positions under CODED_DATA_SECTION and form
+    content only under FORM_SECTION, so document-level lookups are
+    anchored there instead of searching the whole tree (which also holds
+    the translation section).
+    """
+
+    def __init__(self, namespace: Optional[str]):
+        ns = f"{{{namespace}}}" if namespace else ""
+        self.ns = ns
+        coded = f"{ns}CODED_DATA_SECTION"
+        notice_data = f"{coded}/{ns}NOTICE_DATA"
+        codif_data = f"{coded}/{ns}CODIF_DATA"
+        form = f"{ns}FORM_SECTION"
+
+        # Header and coded data
+        self.reception_id = f"{ns}TECHNICAL_SECTION/{ns}RECEPTION_ID"
+        self.date_pub = f"{coded}/{ns}REF_OJS/{ns}DATE_PUB"
+        self.no_doc_ojs = f"{notice_data}/{ns}NO_DOC_OJS"
+        self.iso_country = f"{notice_data}/{ns}ISO_COUNTRY"
+        self.original_cpv = f"{notice_data}/{ns}ORIGINAL_CPV"
+        self.ds_date_dispatch = f"{codif_data}/{ns}DS_DATE_DISPATCH"
+        self.aa_authority_type = f"{codif_data}/{ns}AA_AUTHORITY_TYPE"
+        self.ma_main_activities = f"{codif_data}/{ns}MA_MAIN_ACTIVITIES"
+        self.nc_contract_nature = f"{codif_data}/{ns}NC_CONTRACT_NATURE"
+        self.pr_proc = f"{codif_data}/{ns}PR_PROC"
+
+        # R2.0.7/R2.0.8 forms (CONTRACT_AWARD and its sector variants)
+        self.contract_award = f"{form}/{ns}CONTRACT_AWARD"
+        self.ca_profile = f"{form}//{ns}CA_CE_CONCESSIONAIRE_PROFILE"
+        self.url_general = f"{form}//{ns}URL_GENERAL"
+        self.url_buyer = f"{form}//{ns}URL_BUYER"
+        self.title_contract = f"{form}//{ns}TITLE_CONTRACT"
+        self.short_contract_description = f"{form}//{ns}SHORT_CONTRACT_DESCRIPTION"
+        self.cpv_main_code = f"{form}//{ns}CPV_MAIN//{ns}CPV_CODE"
+        self.cpv_additional_code = f"{form}//{ns}CPV_ADDITIONAL//{ns}CPV_CODE"
+        self.location_nuts = f"{form}//{ns}LOCATION_NUTS//{ns}NUTS"
+        self.eu_project = f"{form}//{ns}RELATES_TO_EU_PROJECT_YES"
+        self.award_of_contract = f"{form}//{ns}AWARD_OF_CONTRACT"
+        self.costs_value = (
+            f".//{ns}CONTRACT_VALUE_INFORMATION"
+            f"//{ns}COSTS_RANGE_AND_CURRENCY_WITH_VAT_RATE"
+            f"//{ns}VALUE_COST"
+        )
+        self.costs_currency = (
+            f".//{ns}CONTRACT_VALUE_INFORMATION"
+            f"//{ns}COSTS_RANGE_AND_CURRENCY_WITH_VAT_RATE"
+        )
+
+        # R2.0.9 F03_2014 form
+        f03 = f"{form}/{ns}F03_2014"
+        self.f03 = f03
+        self.contracting_body = f"{f03}/{ns}CONTRACTING_BODY"
+        self.object_contract = f"{f03}/{ns}OBJECT_CONTRACT"
+        self.award_contract = f"{f03}/{ns}AWARD_CONTRACT"
+        self.cpv_main = f".//{ns}CPV_MAIN//{ns}CPV_CODE"
+        self.object_nuts = f".//{ns}OBJECT_DESCR//{{*}}NUTS"
+        self.framework = f".//{ns}OBJECT_DESCR//{ns}FRAMEWORK"
+        self.eu_progr_related = f".//{ns}OBJECT_DESCR//{ns}EU_PROGR_RELATED"
+
+        # ".//TAG" paths for lookups inside a located element
+        self.nested = {tag: f".//{ns}{tag}" for tag in _NESTED_TAGS}
+
+
+@lru_cache(maxsize=None)
+def _tags(namespace: Optional[str]) -> _Tags:
+    return _Tags(namespace)
+
+
+def _root_tags(root: etree._Element) -> _Tags:
+    """Tags in the root element's default namespace."""
+    return _tags(root.nsmap.get(None))
+
+
+# R2.0.7/R2.0.8 notices always use the TED export namespace
+_R207 = _tags(TED_EXPORT_NS)
 
 
 def _parse_date_yyyymmdd(text: Optional[str]) -> Optional[date]:
@@ -77,7 +222,7 @@ def _parse_optional_int(text: Optional[str], field_name: str) -> Optional[int]:
     """Parse an optional integer field, returning None for invalid values.
 
     For optional fields, malformed data (e.g., text where a number is expected)
-    is treated as missing data. Logs a warning for visibility into data quality.
+    is treated as missing data and counted as a data-quality issue.
     """
     if text is None:
         return None
@@ -87,7 +232,8 @@ def _parse_optional_int(text: Optional[str], field_name: str) -> Optional[int]:
     try:
         return int(text)
     except ValueError:
-        logger.warning(
+        quality.record(quality.INVALID_INTEGER, field_name, text)
+        logger.debug(
             "Invalid integer value for %s: %r (expected numeric value)",
             field_name,
             text,
@@ -95,13 +241,33 @@ def _parse_optional_int(text: Optional[str], field_name: str) -> Optional[int]:
         return None
 
 
-def parse_xml_file(xml_file: Path) -> Optional[List[AwardDataModel]]:
+def parse_xml_file(xml_file: Path) -> Optional[List[AwardDataRecord]]:
     """Parse TED 2.0 XML file and return structured data."""
+    return _parse(xml_file, xml_file)
+
+
+def parse_xml_bytes(
+    data: bytes, source_name: Union[str, Path]
+) -> Optional[List[AwardDataRecord]]:
+    """Parse a TED 2.0 notice held in memory (e.g. a package archive member).
+
+    `source_name` is the notice's file name; it stands in for the file path
+    where parse_xml_file uses it (doc ID fallback, log messages).
+    """
+    return _parse(data, Path(source_name))
+
+
+def _parse(
+    source: Union[bytes, Path], xml_file: Path
+) -> Optional[List[AwardDataRecord]]:
     try:
-        tree = etree.parse(xml_file)
-        root = tree.getroot()
+        variant = None
+        if isinstance(source, bytes):
+            variant = _detect_variant_from_header(source[:_HEADER_SIZE])
+        root, awards = _load(source, variant)
 
-        variant = _detect_variant(root)
+        if variant is None:
+            variant = _detect_variant(root)
         logger.debug(f"Processing {xml_file.name} as {variant}")
 
         document = _extract_document_info(root, xml_file, variant)
@@ -114,20 +280,21 @@ def parse_xml_file(xml_file: Path) -> Optional[List[AwardDataModel]]:
             return None
 
         # Add contact fields (including buyer authority/activity) to document
-        document = document.model_copy(update=contact_fields)
+        document = replace(document, **contact_fields)
 
         contract = _extract_contract_info(root, variant)
         if not contract:
             logger.debug(f"No contract info found in {xml_file.name}")
             return None
 
-        awards = _extract_awards(root, variant)
+        if awards is None:
+            awards = _extract_awards(root, variant)
         if not awards:
             logger.debug(f"No awards found in {xml_file.name}")
             return None
 
         return [
-            AwardDataModel(
+            AwardDataRecord(
                 document=document,
                 buyer=buyer,
                 contract=contract,
@@ -140,30 +307,133 @@ def parse_xml_file(xml_file: Path) -> Optional[List[AwardDataModel]]:
         raise
 
 
+def _load(
+    source: Union[bytes, Path], variant: Optional[str]
+) -> tuple[etree._Element, Optional[List[AwardRecord]]]:
+    """Parse a notice, streaming very large ones (see _parse_streaming).
+
+    Returns the tree and the awards extracted while streaming, or None if
+    the awards are still in the tree.
+    """
+    if isinstance(source, bytes):
+        if len(source) >= STREAMING_THRESHOLD:
+            return _parse_streaming(io.BytesIO(source), variant)
+        return etree.fromstring(source, xml_parser()), None
+    if source.stat().st_size >= STREAMING_THRESHOLD:
+        return _parse_streaming(source, variant)
+    return etree.parse(source, xml_parser()).getroot(), None
+
+
+def _parse_streaming(
+    source: Union[Path, BinaryIO], variant: Optional[str]
+) -> tuple[etree._Element, Optional[List[AwardRecord]]]:
+    """Parse a very large notice, extracting awards as they are read.
+
+    Each award element is extracted on its end tag and then removed, as are
+    the unused top-level sections, so the tree holds the header, coded data
+    and form parts outside the awards, plus at most one award. The other
+    extractors run on that tree afterwards; the notice-level elements they
+    read all sit outside the awards.
+    If the variant is not known from the header or the root element, the
+    awards are kept in the tree and None is returned for them.
+    """
+    events = iterparse(source, _STREAMED_TAGS)
+    root = None
+    awards = None
+    for _, elem in events:
+        if root is None:
+            root = elem.getroottree().getroot()
+            if variant is None:
+                variant = _variant_from_schema_location(root.get(_SCHEMA_LOCATION, ""))
+            if variant is not None:
+                is_award, extract_award = _award_stream(root, variant)
+                awards = []
+
+        parent = elem.getparent()
+        if parent is root:
+            if elem.tag.rpartition("}")[2] in _UNUSED_SECTIONS:
+                root.remove(elem)
+        elif awards is not None and is_award(elem):
+            award = extract_award(elem)
+            if award is not None:
+                awards.append(award)
+            parent.remove(elem)
+    return (events.root if root is None else root), awards
+
+
+def _award_stream(
+    root: etree._Element, variant: str
+) -> tuple[
+    Callable[[etree._Element], bool],
+    Callable[[etree._Element], Optional[AwardRecord]],
+]:
+    """Award test and extractor for streaming, matching _extract_awards."""
+    if variant == "R2.0.9":
+        t = _root_tags(root)
+        award_tag, f03_tag, form_tag = (
+            f"{t.ns}{tag}" for tag in ("AWARD_CONTRACT", "F03_2014", "FORM_SECTION")
+        )
+
+        def is_award_r209(elem: etree._Element) -> bool:
+            # FORM_SECTION/F03_2014/AWARD_CONTRACT
+            if elem.tag != award_tag or elem.getparent().tag != f03_tag:
+                return False
+            form = elem.getparent().getparent()
+            return form.tag == form_tag and form.getparent() is root
+
+        return is_award_r209, partial(_extract_award_r209, t=t)
+
+    award_tag, form_tag = (
+        f"{_R207.ns}{tag}" for tag in ("AWARD_OF_CONTRACT", "FORM_SECTION")
+    )
+
+    def is_award_r207(elem: etree._Element) -> bool:
+        # FORM_SECTION//AWARD_OF_CONTRACT
+        if elem.tag != award_tag:
+            return False
+        for ancestor in elem.iterancestors():
+            if ancestor.getparent() is root:
+                return ancestor.tag == form_tag
+        return False
+
+    return is_award_r207, _extract_award_r207
+
+
+def _variant_from_schema_location(schema_location: str) -> Optional[str]:
+    for variant in ("R2.0.9", "R2.0.8", "R2.0.7"):
+        if variant in schema_location:
+            return variant
+    return None
+
+
+def _detect_variant_from_header(header: bytes) -> Optional[str]:
+    """Detect the TED 2.0 variant from the schema location in the root tag.
+
+    Uses the first bytes of the file, which the caller has already read to
+    sniff the notice format. Returns None if the root tag is not in the
+    header or names no version; _detect_variant then decides on the tree.
+    """
+    root_tag = _ROOT_TAG_RE.search(header)
+    if root_tag is None:
+        return None
+    schema_location = _SCHEMA_LOCATION_RE.search(root_tag.group())
+    if schema_location is None:
+        return None
+    return _variant_from_schema_location(schema_location.group(1).decode("latin-1"))
+
+
 def _detect_variant(root: etree._Element) -> str:
     """Detect which TED 2.0 variant this is based on XML structure."""
     # Check schema location for version
-    schema_location = root.get(
-        "{http://www.w3.org/2001/XMLSchema-instance}schemaLocation", ""
-    )
-
-    if "R2.0.9" in schema_location:
-        return "R2.0.9"
-    elif "R2.0.8" in schema_location:
-        return "R2.0.8"
-    elif "R2.0.7" in schema_location:
-        return "R2.0.7"
+    schema_location = root.get(_SCHEMA_LOCATION, "")
+    variant = _variant_from_schema_location(schema_location)
+    if variant is not None:
+        return variant
 
-    # Fall back to structural detection
-    if (
-        root.find(".//{http://publications.europa.eu/TED_schema/Export}F03_2014")
-        is not None
-    ):
+    # Fall back to structural detection: the form under FORM_SECTION
+    if root.find(_R207.f03) is not None:
         return "R2.0.9"
-    elif (
-        root.find(".//{http://publications.europa.eu/TED_schema/Export}CONTRACT_AWARD")
-        is not None
-    ):
+    elif root.find(_R207.contract_award) is not None:
         return "R2.0.7/R2.0.8"
 
     return "Unknown"
@@ -171,9 +441,9 @@ def _detect_variant(root: etree._Element) -> str:
 
 def _extract_document_info(
     root: etree._Element, xml_file: Path, variant: str
-) -> Optional[DocumentModel]:
+) -> Optional[DocumentRecord]:
     """Extract document-level information."""
-    ns = _default_ns(root)
+    t = _root_tags(root)
 
     # Extract document ID from DOC_ID attribute or filename
     doc_id = root.get("DOC_ID")
@@ -187,7 +457,7 @@ def _extract_document_info(
         return None
 
     # Extract publication date (required)
-    pub_date_elem = root.find(f".//{ns}DATE_PUB")
+    pub_date_elem = root.find(t.date_pub)
     if pub_date_elem is None or not pub_date_elem.text:
         logger.debug(f"No publication date found in {xml_file.name}")
         return None
@@ -198,27 +468,27 @@ def _extract_document_info(
         return None
 
     # Extract dispatch date (optional)
-    dispatch_date_elem = root.find(f".//{ns}DS_DATE_DISPATCH")
+    dispatch_date_elem = root.find(t.ds_date_dispatch)
     dispatch_date = None
     if dispatch_date_elem is not None and dispatch_date_elem.text:
         dispatch_date = _parse_date_yyyymmdd(dispatch_date_elem.text)
 
     # Extract other document metadata
-    return DocumentModel(
+    return DocumentRecord(
         doc_id=doc_id,
         edition=edition,
         publication_date=pub_date,
         dispatch_date=dispatch_date,
-        reception_id=elem_text(root.find(f".//{ns}RECEPTION_ID")),
-        official_journal_ref=elem_text(root.find(f".//{ns}NO_DOC_OJS")),
-        source_country=elem_attr(root.find(f".//{ns}ISO_COUNTRY"), "VALUE"),
+        reception_id=elem_text(root.find(t.reception_id)),
+        official_journal_ref=elem_text(root.find(t.no_doc_ojs)),
+        source_country=elem_attr(root.find(t.iso_country), "VALUE"),
         version=variant,
     )
 
 
 def _extract_buyer(
     root: etree._Element, variant: str
-) -> tuple[Optional[OrganizationModel], dict]:
+) -> tuple[Optional[OrganizationRecord], dict]:
     """Extract buyer organization based on variant.
 
     Returns a tuple of (organization, contact_fields_dict).
@@ -230,65 +500,45 @@ def _extract_buyer(
         return _extract_buyer_r207(root)
 
 
+def _organisation_name(org_elem: Optional[etree._Element]) -> str:
+    """Name from an R2.0.7/R2.0.8 ORGANISATION (OFFICIALNAME child or own text)."""
+    if org_elem is None:
+        return ""
+    officialname_elem = org_elem.find(_R207.nested["OFFICIALNAME"])
+    if officialname_elem is not None and officialname_elem.text:
+        return officialname_elem.text
+    return org_elem.text or ""
+
+
 def _extract_buyer_r207(
     root: etree._Element,
-) -> tuple[Optional[OrganizationModel], dict]:
+) -> tuple[Optional[OrganizationRecord], dict]:
     """Extract buyer organization for R2.0.7/R2.0.8 formats.
 
     Returns (organization, contact_fields_dict).
     """
-    ca_elem = root.find(
-        ".//{http://publications.europa.eu/TED_schema/Export}CA_CE_CONCESSIONAIRE_PROFILE"
-    )
+    nested = _R207.nested
+    ca_elem = root.find(_R207.ca_profile)
     if ca_elem is None:
         return None, {}
 
     # Extract organization name - handle both R2.0.7 and R2.0.8 structures
-    org_elem = ca_elem.find(
-        ".//{http://publications.europa.eu/TED_schema/Export}ORGANISATION"
-    )
-    official_name = ""
-    if org_elem is not None:
-        officialname_elem = org_elem.find(
-            ".//{http://publications.europa.eu/TED_schema/Export}OFFICIALNAME"
-        )
-        if officialname_elem is not None and officialname_elem.text:
-            official_name = officialname_elem.text
-        elif org_elem.text:
-            official_name = org_elem.text
+    official_name = _organisation_name(ca_elem.find(nested["ORGANISATION"]))
 
-    address_elem = ca_elem.find(
-        ".//{http://publications.europa.eu/TED_schema/Export}ADDRESS"
-    )
-    town_elem = ca_elem.find(".//{http://publications.europa.eu/TED_schema/Export}TOWN")
-    postal_code_elem = ca_elem.find(
-        ".//{http://publications.europa.eu/TED_schema/Export}POSTAL_CODE"
-    )
-    country_elem = ca_elem.find(
-        ".//{http://publications.europa.eu/TED_schema/Export}COUNTRY"
-    )
-    phone_elem = ca_elem.find(
-        ".//{http://publications.europa.eu/TED_schema/Export}PHONE"
-    )
-    email_elem = ca_elem.find(
-        ".//{http://publications.europa.eu/TED_schema/Export}E_MAIL"
-    )
+    address_elem = ca_elem.find(nested["ADDRESS"])
+    town_elem = ca_elem.find(nested["TOWN"])
+    postal_code_elem = ca_elem.find(nested["POSTAL_CODE"])
+    country_elem = ca_elem.find(nested["COUNTRY"])
+    phone_elem = ca_elem.find(nested["PHONE"])
+    email_elem = ca_elem.find(nested["E_MAIL"])
 
     # Extract URL from various possible locations
-    url_general_elem = root.find(
-        ".//{http://publications.europa.eu/TED_schema/Export}URL_GENERAL"
-    )
-    url_buyer_elem = root.find(
-        ".//{http://publications.europa.eu/TED_schema/Export}URL_BUYER"
-    )
+    url_general_elem = root.find(_R207.url_general)
+    url_buyer_elem = root.find(_R207.url_buyer)
 
     # Extract authority type and activity codes from coded data section
-    authority_type_elem = root.find(
-        ".//{http://publications.europa.eu/TED_schema/Export}AA_AUTHORITY_TYPE"
-    )
-    activity_elem = root.find(
-        ".//{http://publications.europa.eu/TED_schema/Export}MA_MAIN_ACTIVITIES"
-    )
+    authority_type_elem = root.find(_R207.aa_authority_type)
+    activity_elem = root.find(_R207.ma_main_activities)
 
     contact_fields = {
         "phone": elem_text(phone_elem),
@@ -303,15 +553,13 @@ def _extract_buyer_r207(
 
     # Extract NATIONALID from ORGANISATION element
     identifiers = []
-    nationalid_text = elem_text(
-        ca_elem.find(".//{http://publications.europa.eu/TED_schema/Export}NATIONALID")
-    )
+    nationalid_text = elem_text(ca_elem.find(nested["NATIONALID"]))
     if nationalid_text and nationalid_text.strip():
         identifiers.append(
-            IdentifierEntry(scheme=None, identifier=nationalid_text.strip())
+            IdentifierRecord(scheme=None, identifier=nationalid_text.strip())
         )
 
-    org = OrganizationModel(
+    org = OrganizationRecord(
         official_name=official_name,
         address=elem_text(address_elem),
         town=elem_text(town_elem),
@@ -326,52 +574,53 @@ def _extract_buyer_r207(
 
 def _extract_buyer_r209(
     root: etree._Element,
-) -> tuple[Optional[OrganizationModel], dict]:
+) -> tuple[Optional[OrganizationRecord], dict]:
     """Extract buyer organization for R2.0.9 format.
 
     Returns (organization, contact_fields_dict).
     """
-    ns = _default_ns(root)
-    ca_elem = root.find(f".//{ns}F03_2014//{ns}CONTRACTING_BODY")
+    t = _root_tags(root)
+    nested = t.nested
+    ca_elem = root.find(t.contracting_body)
     if ca_elem is None:
         return None, {}
 
     # NUTS code from ADDRESS_CONTRACTING_BODY
-    addr_cb_elem = ca_elem.find(f".//{ns}ADDRESS_CONTRACTING_BODY")
+    addr_cb_elem = ca_elem.find(nested["ADDRESS_CONTRACTING_BODY"])
     nuts_code = None
     if addr_cb_elem is not None:
         nuts_elem = addr_cb_elem.find(".//{*}NUTS")
         nuts_code = nuts_elem.get("CODE") if nuts_elem is not None else None
 
     contact_fields = {
-        "contact_point": elem_text(ca_elem.find(f".//{ns}CONTACT_POINT")),
-        "phone": elem_text(ca_elem.find(f".//{ns}PHONE")),
-        "email": elem_text(ca_elem.find(f".//{ns}E_MAIL")),
-        "url_general": elem_text(ca_elem.find(f".//{ns}URL_GENERAL")),
-        "buyer_url": elem_text(ca_elem.find(f".//{ns}URL_BUYER")),
+        "contact_point": elem_text(ca_elem.find(nested["CONTACT_POINT"])),
+        "phone": elem_text(ca_elem.find(nested["PHONE"])),
+        "email": elem_text(ca_elem.find(nested["E_MAIL"])),
+        "url_general": elem_text(ca_elem.find(nested["URL_GENERAL"])),
+        "buyer_url": elem_text(ca_elem.find(nested["URL_BUYER"])),
         "buyer_authority_type": make_authority_type_entry(
-            elem_attr(ca_elem.find(f".//{ns}CA_TYPE"), "VALUE")
+            elem_attr(ca_elem.find(nested["CA_TYPE"]), "VALUE")
         ),
         "buyer_main_activity_code": elem_attr(
-            ca_elem.find(f".//{ns}CA_ACTIVITY"), "VALUE"
+            ca_elem.find(nested["CA_ACTIVITY"]), "VALUE"
         ),
     }
 
     # Extract NATIONALID from ADDRESS_CONTRACTING_BODY
     identifiers = []
     if addr_cb_elem is not None:
-        nationalid_text = elem_text(addr_cb_elem.find(f".//{ns}NATIONALID"))
+        nationalid_text = elem_text(addr_cb_elem.find(nested["NATIONALID"]))
         if nationalid_text and nationalid_text.strip():
             identifiers.append(
-                IdentifierEntry(scheme=None, identifier=nationalid_text.strip())
+                IdentifierRecord(scheme=None, identifier=nationalid_text.strip())
             )
 
-    org = OrganizationModel(
-        official_name=elem_text(ca_elem.find(f".//{ns}OFFICIALNAME")) or "",
-        address=elem_text(ca_elem.find(f".//{ns}ADDRESS")),
-        town=elem_text(ca_elem.find(f".//{ns}TOWN")),
-        postal_code=elem_text(ca_elem.find(f".//{ns}POSTAL_CODE")),
-        country_code=elem_attr(ca_elem.find(f".//{ns}COUNTRY"), "VALUE"),
+    org = OrganizationRecord(
+        official_name=elem_text(ca_elem.find(nested["OFFICIALNAME"])) or "",
+        address=elem_text(ca_elem.find(nested["ADDRESS"])),
+        town=elem_text(ca_elem.find(nested["TOWN"])),
+        postal_code=elem_text(ca_elem.find(nested["POSTAL_CODE"])),
+        country_code=elem_attr(ca_elem.find(nested["COUNTRY"]), "VALUE"),
         nuts_code=nuts_code,
         identifiers=identifiers,
     )
@@ -381,7 +630,7 @@ def _extract_buyer_r209(
 
 def _extract_contract_info(
     root: etree._Element, variant: str
-) -> Optional[ContractModel]:
+) -> Optional[ContractRecord]:
     """Extract contract information based on variant."""
     if variant == "R2.0.9":
         return _extract_contract_info_r209(root)
@@ -391,9 +640,8 @@ def _extract_contract_info(
 
 def _build_cpv_description_map(root: etree._Element) -> dict[str, str]:
     """Build a map of CPV code -> description from CODED_DATA_SECTION/ORIGINAL_CPV."""
-    ns = _default_ns(root)
     desc_map = {}
-    for elem in root.iter(f"{ns}ORIGINAL_CPV"):
+    for elem in root.iterfind(_root_tags(root).original_cpv):
         code = elem.get("CODE")
         text = elem.text
         if code and text:
@@ -401,38 +649,21 @@ def _build_cpv_description_map(root: etree._Element) -> dict[str, str]:
     return desc_map
 
 
-def _extract_contract_info_r207(root: etree._Element) -> Optional[ContractModel]:
+def _extract_contract_info_r207(root: etree._Element) -> Optional[ContractRecord]:
     """Extract contract info for R2.0.7/R2.0.8 formats."""
-    title_elem = root.find(
-        ".//{http://publications.europa.eu/TED_schema/Export}TITLE_CONTRACT"
-    )
-    description_elem = root.find(
-        ".//{http://publications.europa.eu/TED_schema/Export}SHORT_CONTRACT_DESCRIPTION"
-    )
+    title_elem = root.find(_R207.title_contract)
+    description_elem = root.find(_R207.short_contract_description)
 
-    cpv_main_elem = root.find(
-        ".//{http://publications.europa.eu/TED_schema/Export}CPV_MAIN"
-        "//{http://publications.europa.eu/TED_schema/Export}CPV_CODE"
-    )
+    cpv_main_elem = root.find(_R207.cpv_main_code)
 
     # Additional CPV codes
-    cpv_additional_elems = root.findall(
-        ".//{http://publications.europa.eu/TED_schema/Export}CPV_ADDITIONAL"
-        "//{http://publications.europa.eu/TED_schema/Export}CPV_CODE"
-    )
+    cpv_additional_elems = root.findall(_R207.cpv_additional_code)
 
-    nature_elem = root.find(
-        ".//{http://publications.europa.eu/TED_schema/Export}NC_CONTRACT_NATURE"
-    )
-    procedure_elem = root.find(
-        ".//{http://publications.europa.eu/TED_schema/Export}PR_PROC"
-    )
+    nature_elem = root.find(_R207.nc_contract_nature)
+    procedure_elem = root.find(_R207.pr_proc)
 
     # Performance location NUTS
-    location_nuts_elem = root.find(
-        ".//{http://publications.europa.eu/TED_schema/Export}LOCATION_NUTS"
-        "//{http://publications.europa.eu/TED_schema/Export}NUTS"
-    )
+    location_nuts_elem = root.find(_R207.location_nuts)
     nuts_code = (
         elem_attr(location_nuts_elem, "CODE")
         if location_nuts_elem is not None
@@ -441,12 +672,12 @@ def _extract_contract_info_r207(root: etree._Element) -> Optional[ContractModel]
 
     # Build CPV codes list with descriptions
     cpv_desc_map = _build_cpv_description_map(root)
-    cpv_codes: list[CpvCodeEntry] = []
+    cpv_codes: list[CpvCodeRecord] = []
 
     main_code = elem_attr(cpv_main_elem, "CODE")
     if main_code:
         cpv_codes.append(
-            CpvCodeEntry(
+            CpvCodeRecord(
                 code=main_code,
                 description=cpv_desc_map.get(main_code),
             )
@@ -456,7 +687,7 @@ def _extract_contract_info_r207(root: etree._Element) -> Optional[ContractModel]
         additional_code = additional_elem.get("CODE")
         if additional_code:
             cpv_codes.append(
-                CpvCodeEntry(
+                CpvCodeRecord(
                     code=additional_code,
                     description=cpv_desc_map.get(additional_code),
                 )
@@ -471,10 +702,9 @@ def _extract_contract_info_r207(root: etree._Element) -> Optional[ContractModel]
     )
 
     # EU funded: check if RELATES_TO_EU_PROJECT_YES is present
-    ns_r207 = "{http://publications.europa.eu/TED_schema/Export}"
-    eu_funded = root.find(f".//{ns_r207}RELATES_TO_EU_PROJECT_YES") is not None
+    eu_funded = root.find(_R207.eu_project) is not None
 
-    return ContractModel(
+    return ContractRecord(
         title=element_text(title_elem) or "",
         short_description=element_text(description_elem),
         main_cpv_code=main_code,
@@ -489,35 +719,36 @@ def _extract_contract_info_r207(root: etree._Element) -> Optional[ContractModel]
     )
 
 
-def _extract_contract_info_r209(root: etree._Element) -> Optional[ContractModel]:
+def _extract_contract_info_r209(root: etree._Element) -> Optional[ContractRecord]:
     """Extract contract info for R2.0.9 format."""
-    ns = _default_ns(root)
-    object_elem = root.find(f".//{ns}F03_2014//{ns}OBJECT_CONTRACT")
+    t = _root_tags(root)
+    nested = t.nested
+    object_elem = root.find(t.object_contract)
     if object_elem is None:
         return None
 
-    title_elem = object_elem.find(f".//{ns}TITLE")
-    description_elem = object_elem.find(f".//{ns}SHORT_DESCR")
-    cpv_main_elem = object_elem.find(f".//{ns}CPV_MAIN//{ns}CPV_CODE")
-    type_contract_elem = object_elem.find(f".//{ns}TYPE_CONTRACT")
+    title_elem = object_elem.find(nested["TITLE"])
+    description_elem = object_elem.find(nested["SHORT_DESCR"])
+    cpv_main_elem = object_elem.find(t.cpv_main)
+    type_contract_elem = object_elem.find(nested["TYPE_CONTRACT"])
 
     # Procedure type from CODED_DATA_SECTION (same location as R2.0.7/R2.0.8)
-    procedure_elem = root.find(f".//{ns}PR_PROC")
+    procedure_elem = root.find(t.pr_proc)
 
     # Performance location NUTS from OBJECT_DESCR
-    nuts_elem = object_elem.find(f".//{ns}OBJECT_DESCR//{{*}}NUTS")
+    nuts_elem = object_elem.find(t.object_nuts)
     nuts_code = nuts_elem.get("CODE") if nuts_elem is not None else None
 
     # Build CPV codes list with descriptions
     cpv_desc_map = _build_cpv_description_map(root)
-    cpv_codes: list[CpvCodeEntry] = []
+    cpv_codes: list[CpvCodeRecord] = []
 
     main_code = None
     if cpv_main_elem is not None:
         main_code = cpv_main_elem.get("CODE")
         if main_code:
             cpv_codes.append(
-                CpvCodeEntry(
+                CpvCodeRecord(
                     code=main_code,
                     description=cpv_desc_map.get(main_code),
                 )
@@ -532,19 +763,19 @@ def _extract_contract_info_r209(root: etree._Element) -> Optional[ContractModel]
     )
 
     # Framework agreement
-    framework_elem = object_elem.find(f".//{ns}OBJECT_DESCR//{ns}FRAMEWORK")
+    framework_elem = object_elem.find(t.framework)
     framework_agreement = framework_elem is not None
 
     # EU funded
     eu_funded = False
-    eu_progr_elem = object_elem.find(f".//{ns}OBJECT_DESCR//{ns}EU_PROGR_RELATED")
+    eu_progr_elem = object_elem.find(t.eu_progr_related)
     if eu_progr_elem is not None:
         eu_funded = True
 
     # Estimated value from VAL_ESTIMATED_TOTAL
     estimated_value = None
     estimated_value_currency = None
-    est_val_elem = object_elem.find(f".//{ns}VAL_ESTIMATED_TOTAL")
+    est_val_elem = object_elem.find(nested["VAL_ESTIMATED_TOTAL"])
     if est_val_elem is not None:
         estimated_value = _extract_value_amount(est_val_elem)
         estimated_value_currency = est_val_elem.get("CURRENCY")
@@ -553,7 +784,7 @@ def _extract_contract_info_r209(root: etree._Element) -> Optional[ContractModel]
 
             estimated_value = Decimal(str(estimated_value))
 
-    return ContractModel(
+    return ContractRecord(
         title=element_text(title_elem) or "",
         short_description=element_text(description_elem),
         main_cpv_code=main_code,
@@ -571,7 +802,7 @@ def _extract_contract_info_r209(root: etree._Element) -> Optional[ContractModel]
     )
 
 
-def _extract_awards(root: etree._Element, variant: str) -> List[AwardModel]:
+def _extract_awards(root: etree._Element, variant: str) -> List[AwardRecord]:
     """Extract award information based on variant."""
     if variant == "R2.0.9":
         return _extract_awards_r209(root)
@@ -579,184 +810,158 @@ def _extract_awards(root: etree._Element, variant: str) -> List[AwardModel]:
         return _extract_awards_r207(root)
 
 
-def _extract_awards_r207(root: etree._Element) -> List[AwardModel]:
+def _extract_awards_r207(root: etree._Element) -> List[AwardRecord]:
     """Extract awards for R2.0.7/R2.0.8 formats."""
     awards = []
+    for award_elem in root.iterfind(_R207.award_of_contract):
+        award = _extract_award_r207(award_elem)
+        if award is not None:
+            awards.append(award)
+    return awards
 
-    award_elems = root.findall(
-        ".//{http://publications.europa.eu/TED_schema/Export}AWARD_OF_CONTRACT"
-    )
 
-    ns = "{http://publications.europa.eu/TED_schema/Export}"
-
-    for award_elem in award_elems:
-        # Skip empty AWARD_OF_CONTRACT placeholder elements.
-        # In R2.0.7/R2.0.8, non-awarded lots appear as empty elements
-        # or with only boilerplate (e.g. MORE_INFORMATION_TO_SUB_CONTRACTED).
-        if (
-            award_elem.find(f".//{ns}ECONOMIC_OPERATOR_NAME_ADDRESS") is None
-            and award_elem.find(f".//{ns}CONTRACT_VALUE_INFORMATION") is None
-            and award_elem.find(f".//{ns}CONTRACT_NUMBER") is None
-            and award_elem.find(f".//{ns}CONTRACT_AWARD_DATE") is None
-        ):
-            continue
+def _extract_award_r207(award_elem: etree._Element) -> Optional[AwardRecord]:
+    """Extract one AWARD_OF_CONTRACT, None for an empty placeholder."""
+    nested = _R207.nested
 
-        contract_number_elem = award_elem.find(f".//{ns}CONTRACT_NUMBER")
-        title_elem = award_elem.find(f".//{ns}CONTRACT_TITLE")
+    # Skip empty AWARD_OF_CONTRACT placeholder elements.
+    # In R2.0.7/R2.0.8, non-awarded lots appear as empty elements
+    # or with only boilerplate (e.g. MORE_INFORMATION_TO_SUB_CONTRACTED).
+    contract_number_elem = award_elem.find(nested["CONTRACT_NUMBER"])
+    award_date_elem = award_elem.find(nested["CONTRACT_AWARD_DATE"])
+    if (
+        award_elem.find(nested["ECONOMIC_OPERATOR_NAME_ADDRESS"]) is None
+        and award_elem.find(nested["CONTRACT_VALUE_INFORMATION"]) is None
+        and contract_number_elem is None
+        and award_date_elem is None
+    ):
+        return None
 
-        value_elem = award_elem.find(
-            f".//{ns}CONTRACT_VALUE_INFORMATION"
-            f"//{ns}COSTS_RANGE_AND_CURRENCY_WITH_VAT_RATE"
-            f"//{ns}VALUE_COST"
-        )
-        currency_elem = award_elem.find(
-            f".//{ns}CONTRACT_VALUE_INFORMATION"
-            f"//{ns}COSTS_RANGE_AND_CURRENCY_WITH_VAT_RATE"
-        )
+    title_elem = award_elem.find(nested["CONTRACT_TITLE"])
 
-        offers_elem = award_elem.find(f".//{ns}OFFERS_RECEIVED_NUMBER")
-
-        # Lot number from ITEM attribute
-        lot_number = award_elem.get("ITEM")
-
-        # Award date from CONTRACT_AWARD_DATE (nested DAY/MONTH/YEAR)
-        award_date = None
-        award_date_elem = award_elem.find(f".//{ns}CONTRACT_AWARD_DATE")
-        if award_date_elem is not None:
-            day = elem_text(award_date_elem.find(f".//{ns}DAY"))
-            month = elem_text(award_date_elem.find(f".//{ns}MONTH"))
-            year = elem_text(award_date_elem.find(f".//{ns}YEAR"))
-            if day and month and year:
-                try:
-                    award_date = date(int(year), int(month), int(day))
-                except (ValueError, TypeError):
-                    pass
-
-        contractors = _extract_contractors_r207(award_elem)
-
-        awards.append(
-            AwardModel(
-                contract_number=elem_text(contract_number_elem),
-                award_title=element_text(title_elem),
-                awarded_value=_extract_value_amount(value_elem),
-                awarded_value_currency=elem_attr(currency_elem, "CURRENCY"),
-                tenders_received=_parse_optional_int(
-                    elem_text(offers_elem),
-                    "tenders_received",
-                ),
-                lot_number=lot_number,
-                award_date=award_date,
-                contractors=contractors,
-            )
-        )
+    value_elem = award_elem.find(_R207.costs_value)
+    currency_elem = award_elem.find(_R207.costs_currency)
 
-    return awards
+    offers_elem = award_elem.find(nested["OFFERS_RECEIVED_NUMBER"])
 
+    # Lot number from ITEM attribute
+    lot_number = award_elem.get("ITEM")
 
-def _extract_awards_r209(root: etree._Element) -> List[AwardModel]:
-    """Extract awards for R2.0.9 format."""
-    ns = _default_ns(root)
-    awards = []
+    # Award date from CONTRACT_AWARD_DATE (nested DAY/MONTH/YEAR)
+    award_date = None
+    if award_date_elem is not None:
+        day = elem_text(award_date_elem.find(nested["DAY"]))
+        month = elem_text(award_date_elem.find(nested["MONTH"]))
+        year = elem_text(award_date_elem.find(nested["YEAR"]))
+        if day and month and year:
+            try:
+                award_date = date(int(year), int(month), int(day))
+            except (ValueError, TypeError):
+                pass
 
-    for award_elem in root.findall(f".//{ns}F03_2014//{ns}AWARD_CONTRACT"):
-        award_decision_elem = award_elem.find(f".//{ns}AWARDED_CONTRACT")
-        if award_decision_elem is None:
-            continue
+    contractors = _extract_contractors_r207(award_elem)
 
-        value_elem = award_decision_elem.find(f".//{ns}VAL_TOTAL")
-        offers_elem = award_decision_elem.find(f".//{ns}NB_TENDERS_RECEIVED")
+    return AwardRecord(
+        contract_number=elem_text(contract_number_elem),
+        award_title=element_text(title_elem),
+        awarded_value=_extract_value_amount(value_elem),
+        awarded_value_currency=elem_attr(currency_elem, "CURRENCY"),
+        tenders_received=_parse_optional_int(
+            elem_text(offers_elem),
+            "tenders_received",
+        ),
+        lot_number=lot_number,
+        award_date=award_date,
+        contractors=contractors,
+    )
 
-        # Lot number from ITEM attribute
-        lot_number = award_elem.get("ITEM")
 
-        # Award date from DATE_CONCLUSION_CONTRACT (YYYY-MM-DD)
-        award_date = None
-        date_elem = award_decision_elem.find(f".//{ns}DATE_CONCLUSION_CONTRACT")
-        if date_elem is not None and date_elem.text:
-            try:
-                award_date = date.fromisoformat(date_elem.text.strip())
-            except ValueError:
-                pass
+def _extract_awards_r209(root: etree._Element) -> List[AwardRecord]:
+    """Extract awards for R2.0.9 format."""
+    t = _root_tags(root)
+    awards = []
+    for award_elem in root.iterfind(t.award_contract):
+        award = _extract_award_r209(award_elem, t)
+        if award is not None:
+            awards.append(award)
+    return awards
 
-        contractors = _extract_contractors_r209(award_decision_elem)
 
-        awards.append(
-            AwardModel(
-                contract_number=elem_text(award_elem.find(f".//{ns}CONTRACT_NO")),
-                award_title=element_text(award_elem.find(f".//{ns}TITLE")),
-                awarded_value=_extract_value_amount(value_elem),
-                awarded_value_currency=(
-                    value_elem.get("CURRENCY") if value_elem is not None else None
-                ),
-                tenders_received=_parse_optional_int(
-                    offers_elem.text if offers_elem is not None else None,
-                    "tenders_received",
-                ),
-                lot_number=lot_number,
-                award_date=award_date,
-                contractors=contractors,
-            )
-        )
+def _extract_award_r209(award_elem: etree._Element, t: _Tags) -> Optional[AwardRecord]:
+    """Extract one AWARD_CONTRACT, None if no contract was awarded."""
+    nested = t.nested
+    award_decision_elem = award_elem.find(nested["AWARDED_CONTRACT"])
+    if award_decision_elem is None:
+        return None
 
-    return awards
+    value_elem = award_decision_elem.find(nested["VAL_TOTAL"])
+    offers_elem = award_decision_elem.find(nested["NB_TENDERS_RECEIVED"])
+
+    # Lot number from ITEM attribute
+    lot_number = award_elem.get("ITEM")
+
+    # Award date from DATE_CONCLUSION_CONTRACT (YYYY-MM-DD)
+    award_date = None
+    date_elem = award_decision_elem.find(nested["DATE_CONCLUSION_CONTRACT"])
+    if date_elem is not None and date_elem.text:
+        try:
+            award_date = date.fromisoformat(date_elem.text.strip())
+        except ValueError:
+            pass
+
+    contractors = _extract_contractors_r209(award_decision_elem, t)
+
+    return AwardRecord(
+        contract_number=elem_text(award_elem.find(nested["CONTRACT_NO"])),
+        award_title=element_text(award_elem.find(nested["TITLE"])),
+        awarded_value=_extract_value_amount(value_elem),
+        awarded_value_currency=(
+            value_elem.get("CURRENCY") if value_elem is not None else None
+        ),
+        tenders_received=_parse_optional_int(
+            offers_elem.text if offers_elem is not None else None,
+            "tenders_received",
+        ),
+        lot_number=lot_number,
+        award_date=award_date,
+        contractors=contractors,
+    )
 
 
-def _extract_contractors_r207(award_elem: etree._Element) -> List[OrganizationModel]:
+def _extract_contractors_r207(award_elem: etree._Element) -> List[OrganizationRecord]:
     """Extract contractor information for R2.0.7/R2.0.8."""
     contractors = []
+    nested = _R207.nested
 
-    contractor_elems = award_elem.findall(
-        ".//{http://publications.europa.eu/TED_schema/Export}ECONOMIC_OPERATOR_NAME_ADDRESS"
-    )
-
-    for contractor_elem in contractor_elems:
+    for contractor_elem in award_elem.iterfind(
+        nested["ECONOMIC_OPERATOR_NAME_ADDRESS"]
+    ):
         contact_data_elem = contractor_elem.find(
-            ".//{http://publications.europa.eu/TED_schema/Export}CONTACT_DATA_WITHOUT_RESPONSIBLE_NAME"
+            nested["CONTACT_DATA_WITHOUT_RESPONSIBLE_NAME"]
         )
         if contact_data_elem is None:
             continue
 
         # Extract organization name
-        org_elem = contact_data_elem.find(
-            ".//{http://publications.europa.eu/TED_schema/Export}ORGANISATION"
+        official_name = _organisation_name(
+            contact_data_elem.find(nested["ORGANISATION"])
         )
-        official_name = ""
-        if org_elem is not None:
-            officialname_elem = org_elem.find(
-                ".//{http://publications.europa.eu/TED_schema/Export}OFFICIALNAME"
-            )
-            if officialname_elem is not None and officialname_elem.text:
-                official_name = officialname_elem.text
-            elif org_elem.text:
-                official_name = org_elem.text
 
-        address_elem = contact_data_elem.find(
-            ".//{http://publications.europa.eu/TED_schema/Export}ADDRESS"
-        )
-        town_elem = contact_data_elem.find(
-            ".//{http://publications.europa.eu/TED_schema/Export}TOWN"
-        )
-        postal_code_elem = contact_data_elem.find(
-            ".//{http://publications.europa.eu/TED_schema/Export}POSTAL_CODE"
-        )
-        country_elem = contact_data_elem.find(
-            ".//{http://publications.europa.eu/TED_schema/Export}COUNTRY"
-        )
+        address_elem = contact_data_elem.find(nested["ADDRESS"])
+        town_elem = contact_data_elem.find(nested["TOWN"])
+        postal_code_elem = contact_data_elem.find(nested["POSTAL_CODE"])
+        country_elem = contact_data_elem.find(nested["COUNTRY"])
 
         # Extract NATIONALID from ORGANISATION element
         identifiers = []
-        nationalid_text = elem_text(
-            contact_data_elem.find(
-                ".//{http://publications.europa.eu/TED_schema/Export}NATIONALID"
-            )
-        )
+        nationalid_text = elem_text(contact_data_elem.find(nested["NATIONALID"]))
         if nationalid_text and nationalid_text.strip():
             identifiers.append(
-                IdentifierEntry(scheme=None, identifier=nationalid_text.strip())
+                IdentifierRecord(scheme=None, identifier=nationalid_text.strip())
             )
 
         contractors.append(
-            OrganizationModel(
+            OrganizationRecord(
                 official_name=official_name,
                 address=elem_text(address_elem),
                 town=elem_text(town_elem),
@@ -770,31 +975,33 @@ def _extract_contractors_r207(award_elem: etree._Element) -> List[OrganizationMo
     return contractors
 
 
-def _extract_contractors_r209(award_elem: etree._Element) -> List[OrganizationModel]:
+def _extract_contractors_r209(
+    award_elem: etree._Element, t: _Tags
+) -> List[OrganizationRecord]:
     """Extract contractor information for R2.0.9."""
-    ns = _default_ns(award_elem)
+    nested = t.nested
     contractors = []
 
-    for contractor_elem in award_elem.findall(f".//{ns}CONTRACTOR"):
+    for contractor_elem in award_elem.iterfind(nested["CONTRACTOR"]):
         nuts_elem = contractor_elem.find(".//{*}NUTS")
 
         # Extract NATIONALID from ADDRESS_CONTRACTOR
         identifiers = []
-        nationalid_text = elem_text(contractor_elem.find(f".//{ns}NATIONALID"))
+        nationalid_text = elem_text(contractor_elem.find(nested["NATIONALID"]))
         if nationalid_text and nationalid_text.strip():
             identifiers.append(
-                IdentifierEntry(scheme=None, identifier=nationalid_text.strip())
+                IdentifierRecord(scheme=None, identifier=nationalid_text.strip())
             )
 
         contractors.append(
-            OrganizationModel(
-                official_name=elem_text(contractor_elem.find(f".//{ns}OFFICIALNAME"))
+            OrganizationRecord(
+                official_name=elem_text(contractor_elem.find(nested["OFFICIALNAME"]))
                 or "",
-                address=elem_text(contractor_elem.find(f".//{ns}ADDRESS")),
-                town=elem_text(contractor_elem.find(f".//{ns}TOWN")),
-                postal_code=elem_text(contractor_elem.find(f".//{ns}POSTAL_CODE")),
+                address=elem_text(contractor_elem.find(nested["ADDRESS"])),
+                town=elem_text(contractor_elem.find(nested["TOWN"])),
+                postal_code=elem_text(contractor_elem.find(nested["POSTAL_CODE"])),
                 country_code=elem_attr(
-                    contractor_elem.find(f".//{ns}COUNTRY"), "VALUE"
+                    contractor_elem.find(nested["COUNTRY"]), "VALUE"
                 ),
                 nuts_code=nuts_elem.get("CODE") if nuts_elem is not None else None,
                 identifiers=identifiers,
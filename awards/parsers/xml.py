@@ -2,10 +2,58 @@
 XML extraction helpers for parsers.
 """
 
-from typing import List, Optional
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import BinaryIO, Collection, List, Optional, Union
 
 from lxml import etree
 
+# An XPath expression, as a string or compiled once with etree.XPath
+XPathExpr = Union[str, etree.XPath]
+
+_local = threading.local()
+
+# Hardening shared by xml_parser and iterparse (see xml_parser)
+_PARSER_OPTIONS = dict(
+    resolve_entities=False,
+    no_network=True,
+    load_dtd=False,
+    collect_ids=False,
+    huge_tree=True,
+)
+
+
+def xml_parser() -> etree.XMLParser:
+    """
+    Get this thread's parser for notice XML, created on first use.
+
+    lxml parsers are not thread-safe, so each thread (and worker process)
+    keeps one and reuses it for every file. Notices come from untrusted
+    national portals: entities are never resolved and nothing is fetched
+    over the network. huge_tree lifts libxml2's limits for giant multi-lot
+    notices. Blank text is kept, as element_text relies on the whitespace
+    between <P> paragraphs.
+    """
+    parser = getattr(_local, "parser", None)
+    if parser is None:
+        parser = etree.XMLParser(**_PARSER_OPTIONS)
+        _local.parser = parser
+    return parser
+
+
+def iterparse(source: Union[Path, BinaryIO], tags: Collection[str]) -> etree.iterparse:
+    """
+    Parse a document incrementally, hardened like xml_parser().
+
+    Yields (event, element) at the end tag of each element matching one of
+    `tags` (lxml patterns such as "{*}NAME"); the iterator's `root` is set
+    once parsing is done. The tree is built as usual, so callers remove the
+    elements they have processed to keep memory bounded. Slower per byte
+    than xml_parser(), so meant for very large documents.
+    """
+    return etree.iterparse(source, tag=tuple(tags), **_PARSER_OPTIONS)
+
 
 def element_text(elem: Optional[etree._Element]) -> Optional[str]:
     """
@@ -19,14 +67,28 @@ def element_text(elem: Optional[etree._Element]) -> Optional[str]:
     return "".join(elem.itertext()).strip()
 
 
-def xpath_text(element: etree._Element, xpath: str) -> str:
+@lru_cache(maxsize=None)
+def _text_xpath(xpath: str) -> etree.XPath:
+    return etree.XPath(xpath + "/text()")
+
+
+def xpath_text(element: etree._Element, xpath: XPathExpr) -> str:
     """
     Extract text at xpath, returning empty string if not found.
 
-    Appends /text() to the xpath automatically.
+    A string xpath gets /text() appended (compiled once per string).
+    A compiled expression is evaluated as-is; if it selects elements,
+    the text of the first one is used.
     """
-    result = element.xpath(xpath + "/text()")
-    return result[0].strip() if result and result[0] else ""
+    if isinstance(xpath, str):
+        xpath = _text_xpath(xpath)
+    result = xpath(element)
+    if not result:
+        return ""
+    first = result[0]
+    if isinstance(first, etree._Element):
+        first = first.text
+    return first.strip() if first else ""
 
 
 def first_text(elements: List[etree._Element]) -> Optional[str]:
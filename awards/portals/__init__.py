@@ -1,6 +1,6 @@
 """Portal modules for procurement data sources."""
 
-from typing import Protocol
+from typing import Optional, Protocol
 
 from .ted import TEDPortal
 
@@ -10,9 +10,45 @@ class Portal(Protocol):
 
     name: str
 
-    def download(self, start_year: int, end_year: int) -> None: ...
-
-    def import_data(self, start_year: int, end_year: int) -> None: ...
+    def download(
+        self,
+        start_year: int,
+        end_year: int,
+        concurrency: int = ...,
+        keep_archives: bool = ...,
+        awards_only: bool = ...,
+    ) -> None: ...
+
+    def import_data(
+        self,
+        start_year: int,
+        end_year: int,
+        workers: Optional[int] = ...,
+        processes: bool = ...,
+        max_in_flight: Optional[int] = ...,
+        validate: bool = ...,
+    ) -> None: ...
+
+    def sync(
+        self,
+        start_year: Optional[int] = None,
+        concurrency: int = ...,
+        keep_archives: bool = ...,
+        awards_only: bool = ...,
+        workers: Optional[int] = ...,
+        processes: bool = ...,
+    ) -> int: ...
+
+    def backfill(
+        self,
+        start_year: int,
+        end_year: int,
+        concurrency: int = ...,
+        keep_archives: bool = ...,
+        awards_only: bool = ...,
+        workers: Optional[int] = ...,
+        processes: bool = ...,
+    ) -> int: ...
 
 
 PORTALS: dict[str, Portal] = {
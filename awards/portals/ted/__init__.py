@@ -2,24 +2,50 @@
 
 from .portal import (  # noqa: F401
     TEDPortal,
+    detect_notice_format,
+    discover_last_issue,
+    parse_award,
     try_parse_award,
+    try_parse_award_bytes,
     download_package,
     download_year,
     get_downloaded_packages,
+    get_package_archive,
     get_package_files,
     get_package_number,
     import_package,
     import_year,
+    iter_download_year,
+    package_exists,
+    package_manifest,
+    parse_executor,
+    parse_package,
+    save_package,
+    sync,
 )
+from .pipeline import run_pipeline  # noqa: F401
 
 __all__ = [
     "TEDPortal",
+    "detect_notice_format",
+    "discover_last_issue",
+    "parse_award",
     "try_parse_award",
+    "try_parse_award_bytes",
     "download_package",
     "download_year",
     "get_downloaded_packages",
+    "get_package_archive",
     "get_package_files",
     "get_package_number",
     "import_package",
     "import_year",
+    "iter_download_year",
+    "package_exists",
+    "package_manifest",
+    "parse_executor",
+    "parse_package",
+    "run_pipeline",
+    "save_package",
+    "sync",
 ]
@@ -0,0 +1,242 @@
+"""Package manifests and the data directory index.
+
+A manifest is written for every package when its download completes: it
+lists the package's files with sizes, checksums and detected notice format,
+and its presence marks the package as complete. The index (index.json)
+records every package in the data directory, so "is it downloaded" and
+"which packages exist for a year" need no directory scans. It also caches
+the last published issue per year found by issue discovery.
+
+Finished packages are appended to a journal (index.journal) instead of
+rewriting index.json, so recording a package costs one short write however
+many packages the index holds. The journal is folded into index.json the
+next time the index is read from disk.
+
+Packages downloaded before manifests existed are picked up by a one-off
+scan when the index is first created and flagged with manifest=False.
+
+Imports also leave a data-quality report per package (see awards.quality)
+next to the manifests, for packages where the parsers found problems.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from ...quality import QualityReport
+
+MANIFEST_DIR = ".manifests"
+QUALITY_DIR = ".quality"
+INDEX_FILE = "index.json"
+JOURNAL_FILE = "index.journal"
+
+Storage = Literal["extracted", "archive"]
+
+
+class ManifestEntry(BaseModel):
+    """A single file of a package."""
+
+    name: str = Field(..., description="Path relative to the package root")
+    size: int = Field(..., description="Size in bytes")
+    sha256: str = Field(..., description="SHA-256 of the file content")
+    format: Optional[str] = Field(
+        None, description="Detected notice format, None if not an award notice"
+    )
+
+
+class PackageManifest(BaseModel):
+    """Contents of a completely downloaded package."""
+
+    package: int = Field(..., description="TED package number")
+    storage: Storage = Field(..., description="How the package is stored")
+    completed_at: datetime = Field(..., description="Download completion time")
+    files: List[ManifestEntry] = Field(default_factory=list)
+    awards_only: bool = Field(
+        False, description="True if only award notices were stored"
+    )
+    skipped: List[str] = Field(
+        default_factory=list,
+        description="Doc IDs of notices not stored by an awards-only download",
+    )
+
+
+class IndexEntry(BaseModel):
+    """Index record of a downloaded package."""
+
+    storage: Storage = Field(..., description="How the package is stored")
+    manifest: bool = Field(
+        True, description="False for packages downloaded before manifests existed"
+    )
+
+
+class YearBounds(BaseModel):
+    """Known range of published OJ S issues for a year."""
+
+    last_issue: int = Field(..., description="Last published issue (0 if none)")
+
+
+class DataIndex(BaseModel):
+    """Top-level index of all packages in a data directory."""
+
+    packages: Dict[int, IndexEntry] = Field(default_factory=dict)
+    years: Dict[int, YearBounds] = Field(default_factory=dict)
+
+
+_index_lock = threading.RLock()
+# data_dir -> (index file mtime, journal bytes applied, parsed index)
+_index_cache: Dict[Path, tuple[int, int, DataIndex]] = {}
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write a file so readers only ever see the old or the new content."""
+    tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    tmp_path.write_text(text)
+    os.replace(tmp_path, path)
+
+
+def manifest_path(data_dir: Path, package_number: int) -> Path:
+    """Location of a package's manifest."""
+    return data_dir / MANIFEST_DIR / f"{package_number:09d}.json"
+
+
+def read_manifest(data_dir: Path, package_number: int) -> Optional[PackageManifest]:
+    """Read a package manifest, or None if the package has none."""
+    path = manifest_path(data_dir, package_number)
+    try:
+        return PackageManifest.model_validate_json(path.read_bytes())
+    except FileNotFoundError:
+        return None
+
+
+def write_manifest(data_dir: Path, manifest: PackageManifest) -> None:
+    """Write a package manifest and register the package in the index."""
+    path = manifest_path(data_dir, manifest.package)
+    path.parent.mkdir(exist_ok=True)
+    _write_atomic(path, manifest.model_dump_json())
+    record_package(data_dir, manifest.package, IndexEntry(storage=manifest.storage))
+
+
+def quality_report_path(data_dir: Path, package_number: int) -> Path:
+    """Location of a package's data-quality report."""
+    return data_dir / QUALITY_DIR / f"{package_number:09d}.json"
+
+
+def write_quality_report(
+    data_dir: Path, package_number: int, report: QualityReport
+) -> None:
+    """Write the data-quality report of an imported package."""
+    path = quality_report_path(data_dir, package_number)
+    path.parent.mkdir(exist_ok=True)
+    _write_atomic(path, json.dumps({"package": package_number, **report.to_dict()}))
+
+
+def scan_data_dir(data_dir: Path) -> DataIndex:
+    """Build an index by scanning the top level of a data directory.
+
+    Only used when no index exists yet, to pick up existing packages.
+    """
+    index = DataIndex()
+    for item in data_dir.iterdir():
+        if item.is_dir():
+            name, storage = item.name, "extracted"
+        elif item.is_file() and item.name.endswith(".tar.gz"):
+            name, storage = item.name.removesuffix(".tar.gz"), "archive"
+        else:
+            continue
+        if len(name) != 9 or not name.isdigit():
+            continue
+        package_number = int(name)
+        index.packages[package_number] = IndexEntry(
+            storage=storage,
+            manifest=manifest_path(data_dir, package_number).exists(),
+        )
+    return index
+
+
+def _save_index(data_dir: Path, index: DataIndex) -> None:
+    """Write the whole index, which then includes the journal."""
+    path = data_dir / INDEX_FILE
+    _write_atomic(path, index.model_dump_json())
+    (data_dir / JOURNAL_FILE).unlink(missing_ok=True)
+    _index_cache[data_dir] = (path.stat().st_mtime_ns, 0, index)
+
+
+def _replay_journal(data_dir: Path, index: DataIndex, offset: int) -> int:
+    """Apply the journal records after `offset` to index.
+
+    Returns the offset up to which the journal has been applied. A last
+    record without its newline is still being written and is left for later.
+    """
+    try:
+        with open(data_dir / JOURNAL_FILE, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+    except FileNotFoundError:
+        return offset
+    end = data.rfind(b"\n") + 1
+    for line in data[:end].splitlines():
+        record = json.loads(line)
+        index.packages[record.pop("package")] = IndexEntry.model_validate(record)
+    return offset + end
+
+
+def load_index(data_dir: Path) -> DataIndex:
+    """Load the data directory index, creating it on first use.
+
+    The parsed index is cached and only re-read when the file changes;
+    journal records written since are applied to it in place. The returned
+    object is shared and must not be modified, and packages recorded later
+    are added to it, so iterate over a copy of `packages`.
+    """
+    path = data_dir / INDEX_FILE
+    with _index_lock:
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            index = scan_data_dir(data_dir)
+            _save_index(data_dir, index)
+            return index
+
+        cached = _index_cache.get(data_dir)
+        if cached is not None and cached[0] == mtime:
+            _, offset, index = cached
+            applied = _replay_journal(data_dir, index, offset)
+            if applied != offset:
+                _index_cache[data_dir] = (mtime, applied, index)
+            return index
+
+        index = DataIndex.model_validate_json(path.read_bytes())
+        if _replay_journal(data_dir, index, 0):
+            _save_index(data_dir, index)
+        else:
+            _index_cache[data_dir] = (mtime, 0, index)
+        return index
+
+
+def record_package(data_dir: Path, package_number: int, entry: IndexEntry) -> None:
+    """Add or update a package in the index by appending to the journal."""
+    record = {"package": package_number, **entry.model_dump()}
+    line = (json.dumps(record) + "\n").encode()
+    with _index_lock:
+        index = load_index(data_dir)
+        with open(data_dir / JOURNAL_FILE, "ab") as f:
+            offset = f.tell()
+            f.write(line)
+        index.packages[package_number] = entry
+        mtime, applied, _ = _index_cache[data_dir]
+        # Records appended by other processes in between are replayed later
+        if applied == offset:
+            _index_cache[data_dir] = (mtime, offset + len(line), index)
+
+
+def record_year_bounds(data_dir: Path, year: int, bounds: YearBounds) -> None:
+    """Cache the discovered issue range of a year in the index."""
+    with _index_lock:
+        index = load_index(data_dir)
+        years = {**index.years, year: bounds}
+        _save_index(data_dir, index.model_copy(update={"years": years}))
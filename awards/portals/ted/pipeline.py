@@ -0,0 +1,201 @@
+"""Pipelined download and import of TED packages.
+
+Three stages run at the same time, connected by bounded queues so a fast
+stage blocks instead of running arbitrarily far ahead of a slow one:
+
+    downloader thread -> package numbers -> parser thread
+        -> parsed documents -> writer (calling thread)
+
+The downloader hands over packages as they complete (already downloaded
+packages first), the parser parses each package's files in a thread or
+process pool with parse_package, and the writer saves each package in one
+transaction.
+A multi-year backfill therefore takes roughly as long as its slowest
+stage rather than the sum of all three.
+"""
+
+import logging
+import queue
+import threading
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from ...db import engine
+from ...models import Base
+from ...quality import QualityReport
+from .portal import (
+    DATA_DIR,
+    DEFAULT_DOWNLOAD_CONCURRENCY,
+    get_downloaded_packages,
+    iter_download_year,
+    parse_executor,
+    parse_package,
+    report_quality,
+    save_package,
+)
+
+logger = logging.getLogger(__name__)
+
+# Parsed documents buffered between the parser and the writer
+DEFAULT_DOCUMENT_QUEUE_SIZE = 256
+
+# Seconds between stop checks while blocked on a queue
+_POLL_INTERVAL = 0.1
+
+# End of all input for the next stage
+_DONE = object()
+# End of the current package in the document queue
+_PACKAGE_END = object()
+
+
+class _Stopped(Exception):
+    """Raised inside a stage when another stage has failed."""
+
+
+class _Pipeline:
+    """Shared stop flag and first error of a running pipeline."""
+
+    def __init__(self):
+        self.stop = threading.Event()
+        self.error: Optional[BaseException] = None
+        self._lock = threading.Lock()
+
+    def fail(self, error: BaseException) -> None:
+        with self._lock:
+            if self.error is None:
+                self.error = error
+        self.stop.set()
+
+    def put(self, q: queue.Queue, item: Any) -> None:
+        """Put an item, waiting for space until the pipeline stops."""
+        while True:
+            if self.stop.is_set():
+                raise _Stopped()
+            try:
+                q.put(item, timeout=_POLL_INTERVAL)
+                return
+            except queue.Full:
+                continue
+
+    def get(self, q: queue.Queue) -> Any:
+        """Get an item, waiting until one arrives or the pipeline stops."""
+        while True:
+            if self.stop.is_set():
+                raise _Stopped()
+            try:
+                return q.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+
+    def start(self, name: str, target: Callable[[], None]) -> threading.Thread:
+        """Run a stage in a thread, recording its failure."""
+
+        def run():
+            try:
+                target()
+            except _Stopped:
+                pass
+            except BaseException as e:
+                logger.error(f"Pipeline {name} stage failed: {e}")
+                self.fail(e)
+
+        thread = threading.Thread(target=run, name=f"pipeline-{name}", daemon=True)
+        thread.start()
+        return thread
+
+
+def run_pipeline(
+    start_year: int,
+    end_year: int,
+    data_dir: Path = DATA_DIR,
+    concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+    keep_archives: bool = False,
+    awards_only: bool = False,
+    document_queue_size: int = DEFAULT_DOCUMENT_QUEUE_SIZE,
+    workers: Optional[int] = None,
+    processes: bool = False,
+) -> int:
+    """Download and import a range of years with overlapping stages.
+
+    Packages already downloaded are imported as well; documents already in
+    the database are skipped by save_document_core as usual. If any stage
+    fails, the others stop and the error is raised here; packages imported
+    before that remain committed.
+
+    Args:
+        start_year: First year to process
+        end_year: Last year to process (inclusive)
+        data_dir: Directory for storing downloaded packages
+        concurrency: Number of packages to download in parallel
+        keep_archives: Store packages as .tar.gz instead of extracting them
+        awards_only: Store only award notices (see download_package)
+        document_queue_size: Parsed documents buffered ahead of the writer
+        workers: Number of parse workers (default: number of CPUs)
+        processes: Parse in worker processes instead of threads
+
+    Returns:
+        Number of award notices imported
+    """
+    Base.metadata.create_all(engine)
+
+    pipeline = _Pipeline()
+    packages: queue.Queue = queue.Queue(maxsize=concurrency)
+    documents: queue.Queue = queue.Queue(maxsize=document_queue_size)
+
+    def download() -> None:
+        for year in range(start_year, end_year + 1):
+            seen = set(get_downloaded_packages(year, data_dir))
+            for package_number in sorted(seen):
+                pipeline.put(packages, package_number)
+            for package_number in iter_download_year(
+                year,
+                data_dir=data_dir,
+                concurrency=concurrency,
+                keep_archives=keep_archives,
+                awards_only=awards_only,
+            ):
+                if package_number not in seen:
+                    seen.add(package_number)
+                    pipeline.put(packages, package_number)
+        pipeline.put(packages, _DONE)
+
+    def parse() -> None:
+        with parse_executor(workers, processes) as executor:
+            while (package_number := pipeline.get(packages)) is not _DONE:
+                quality = QualityReport()
+                parsed = parse_package(
+                    package_number, data_dir, executor, quality=quality
+                )
+                if parsed is None:
+                    continue
+                pipeline.put(documents, package_number)
+                for awards in parsed:
+                    if awards:
+                        pipeline.put(documents, awards)
+                pipeline.put(documents, _PACKAGE_END)
+                report_quality(package_number, data_dir, quality)
+        pipeline.put(documents, _DONE)
+
+    threads = [pipeline.start("download", download), pipeline.start("parse", parse)]
+
+    total_imported = 0
+    try:
+        while (package_number := pipeline.get(documents)) is not _DONE:
+            package_documents = iter(partial(pipeline.get, documents), _PACKAGE_END)
+            total_imported += save_package(package_number, package_documents)
+    except _Stopped:
+        pass
+    except BaseException as e:
+        pipeline.fail(e)
+    finally:
+        pipeline.stop.set()
+        for thread in threads:
+            thread.join()
+
+    if pipeline.error is not None:
+        raise pipeline.error
+    logger.info(
+        f"Pipeline {start_year}-{end_year}: Imported {total_imported} award notices"
+    )
+    return total_imported
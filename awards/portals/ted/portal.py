@@ -1,17 +1,45 @@
 """TED Europa portal — download and import EU-wide procurement data."""
 
+import gzip
+import hashlib
+import io
+import json
 import logging
 import os
 import requests
+import shutil
 import tarfile
-from concurrent.futures import ThreadPoolExecutor
+import urllib3
+import zlib
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+from itertools import batched, chain, islice
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Iterable, Iterator, List, Optional, TypeVar, Union
 
-from ...db import engine, get_session, save_document_core
+from ...db import (
+    engine,
+    get_session,
+    get_sync_state,
+    save_document_core,
+    save_sync_state,
+)
+from ...http import get_http_session
 from ...models import Base
-from ...schema import AwardDataModel
 from ...parsers import ted_v2, eforms_ubl
+from ...quality import QualityReport, collect
+from ...records import AwardDataRecord, validate_award_data
+from .manifest import (
+    ManifestEntry,
+    PackageManifest,
+    YearBounds,
+    load_index,
+    read_manifest,
+    record_year_bounds,
+    write_manifest,
+    write_quality_report,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -19,84 +47,518 @@ logger = logging.getLogger(__name__)
 DATA_DIR = Path(os.getenv("TED_DATA_DIR", "./data"))
 DATA_DIR.mkdir(exist_ok=True)
 
+# Number of packages kept in flight by download_year
+DEFAULT_DOWNLOAD_CONCURRENCY = 4
 
-def try_parse_award(file_path: Path) -> Optional[List[AwardDataModel]]:
-    """Parse file if it's an award notice, return None otherwise.
+# Consecutive missing issues after which a year is assumed to end there
+_MAX_ISSUE_GAP = 10
+
+# Read size when streaming a package to disk
+_CHUNK_SIZE = 1024 * 1024
+
+# Files per package in flight during import: submitted to the parse
+# workers, or parsed and waiting for the database writer
+DEFAULT_MAX_IN_FLIGHT = 256
+
+# Files per task sent to parse worker processes, amortizing pickling and IPC
+PROCESS_CHUNK_SIZE = 16
+
+# Tasks a parse worker process runs before it is replaced, bounding the
+# memory held by lxml and allocator fragmentation in long imports
+_MAX_TASKS_PER_CHILD = 200
 
-    Reads first 3KB to detect format, then delegates to appropriate parser.
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _bounded_map(
+    executor: Executor, fn: Callable[[T], R], items: Iterable[T], window: int
+) -> Iterator[R]:
+    """Like executor.map, but with at most `window` tasks submitted at once.
+
+    Results are yielded in input order. Items are only pulled from `items`
+    as earlier results are consumed, so closing the iterator early stops
+    submitting work and cancels whatever has not started yet.
     """
-    with open(file_path, "rb") as f:
-        header = f.read(3000).decode("utf-8", errors="ignore")
+    items = iter(items)
+    in_flight = deque(executor.submit(fn, item) for item in islice(items, window))
+    try:
+        while in_flight:
+            result = in_flight.popleft().result()
+            for item in islice(items, 1):
+                in_flight.append(executor.submit(fn, item))
+            yield result
+    finally:
+        for future in in_flight:
+            future.cancel()
+
+
+# Notice formats recognized by detect_notice_format
+EFORMS_UBL = "eforms_ubl"
+TED_V2 = "ted_v2"
+
+# Bytes of a file inspected by detect_notice_format
+_HEADER_SIZE = 3000
+
+
+def detect_notice_format(header: bytes) -> Optional[str]:
+    """Detect the format of an award notice from its first bytes.
+
+    Returns EFORMS_UBL or TED_V2 for award notices, None for anything else.
+    """
+    text = header[:_HEADER_SIZE].decode("utf-8", errors="ignore")
 
     # eForms: root element tells us document type directly
-    if "<ContractAwardNotice" in header:
-        return eforms_ubl.parse_xml_file(file_path)
+    if "<ContractAwardNotice" in text:
+        return EFORMS_UBL
 
     # TED 2.0: check root + document type code 7 (Contract award)
-    if "<TED_EXPORT" in header and 'CODE="7"' in header:
-        return ted_v2.parse_xml_file(file_path)
+    if "<TED_EXPORT" in text and 'CODE="7"' in text:
+        return TED_V2
 
     return None
 
 
+def parse_award(
+    file_path: Path, notice_format: str, data: Optional[bytes] = None
+) -> Optional[List[AwardDataRecord]]:
+    """Parse an award notice whose format is already known.
+
+    If `data` is given (e.g. a member read from a package archive) it is
+    used instead of reading `file_path`, which then only names the document.
+    """
+    parser = eforms_ubl if notice_format == EFORMS_UBL else ted_v2
+    if data is None:
+        return parser.parse_xml_file(file_path)
+    return parser.parse_xml_bytes(data, file_path)
+
+
+def try_parse_award_bytes(
+    data: bytes, source_name: Union[str, Path]
+) -> Optional[List[AwardDataRecord]]:
+    """Parse an in-memory notice if it's an award notice, None otherwise.
+
+    The format is detected from the start of the same buffer that is then
+    parsed, so memory buffers (archive members, mmaps, network bodies) can
+    be imported without touching the filesystem.
+    """
+    notice_format = detect_notice_format(data)
+    if notice_format is None:
+        return None
+    return parse_award(Path(source_name), notice_format, data)
+
+
+def try_parse_award(
+    file_path: Path, data: Optional[bytes] = None
+) -> Optional[List[AwardDataRecord]]:
+    """Parse file if it's an award notice, return None otherwise.
+
+    Only the first 3KB are read to decide the format; the rest of the file
+    is read, from the same handle, for award notices only. If `data` is
+    given (e.g. a member read from a package archive) it is used instead of
+    reading `file_path`, which then only names the document.
+    """
+    if data is not None:
+        return try_parse_award_bytes(data, file_path)
+    with open(file_path, "rb") as f:
+        header = f.read(_HEADER_SIZE)
+        notice_format = detect_notice_format(header)
+        if notice_format is None:
+            return None
+        data = header + f.read()
+    return parse_award(file_path, notice_format, data)
+
+
 def get_package_number(year: int, issue: int) -> int:
     """Calculate TED package number from year and OJ issue number."""
     return year * 100000 + issue
 
 
-def download_package(package_number: int, data_dir: Path = DATA_DIR) -> bool:
+def _package_url(package_number: int) -> str:
+    return f"https://ted.europa.eu/packages/daily/{package_number:09d}"
+
+
+def get_package_archive(
+    package_number: int, data_dir: Path = DATA_DIR
+) -> Optional[Path]:
+    """Get path of a package kept as its original .tar.gz archive.
+
+    Args:
+        package_number: TED package number (yyyynnnnn format)
+        data_dir: Directory where packages are stored
+
+    Returns:
+        Path to the archive, or None if the package is not stored as one
+    """
+    archive_path = data_dir / f"{package_number:09d}.tar.gz"
+    return archive_path if archive_path.is_file() else None
+
+
+# Transfer errors that end a package stream early
+_STREAM_ERRORS = (requests.RequestException, urllib3.exceptions.HTTPError, OSError)
+
+
+def _request_package(
+    url: str, offset: int = 0, validator: Optional[str] = None
+) -> requests.Response:
+    """Open a streamed GET for a package, starting at byte `offset`.
+
+    A non-zero offset is sent as a Range request guarded by If-Range, so a
+    server whose copy changed since `validator` was seen answers 200 with
+    the full body instead of 206 with a mismatched tail. Callers must check
+    for 206 before treating the body as a continuation.
+
+    Raises:
+        requests.HTTPError: For error statuses (response closed, but still
+            available as e.response)
+    """
+    # Byte offsets only line up with the stored file without transport
+    # compression; the package is already gzipped anyway
+    headers = {"Accept-Encoding": "identity"}
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+        if validator:
+            headers["If-Range"] = validator
+    response = get_http_session().get(url, headers=headers, stream=True, timeout=30)
+    try:
+        response.raise_for_status()
+    except requests.HTTPError:
+        response.close()
+        raise
+    return response
+
+
+def _validator(response: requests.Response) -> Optional[str]:
+    """Return the strongest cache validator of a response, if any."""
+    etag = response.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("Last-Modified")
+
+
+class _ResumableStream(io.RawIOBase):
+    """Readable package body that survives dropped connections.
+
+    When a read fails mid-transfer the request is reissued from the current
+    offset via _request_package. If the server ignores the Range header the
+    already-consumed prefix of the fresh body is skipped instead, provided
+    its validator shows it is the same file, so readers always see one
+    continuous byte stream.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        response: requests.Response,
+        offset: int = 0,
+        max_resumes: int = 5,
+    ):
+        self.url = url
+        self.offset = offset
+        self._response = response
+        self._validator = _validator(response)
+        self._resumes_left = max_resumes
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while True:
+            try:
+                n = self._response.raw.readinto(buffer)
+            except _STREAM_ERRORS as e:
+                if not self._resumes_left:
+                    raise
+                self._resumes_left -= 1
+                logger.warning(
+                    f"Download of {self.url} interrupted at {self.offset} bytes "
+                    f"({e}), resuming"
+                )
+                self._resume()
+                continue
+            self.offset += n
+            return n
+
+    def _resume(self) -> None:
+        self._response.close()
+        self._response = _request_package(self.url, self.offset, self._validator)
+        if self._response.status_code != 206:
+            # Full body: only skip ahead if it is provably the same file,
+            # otherwise the result would splice two different versions
+            validator = _validator(self._response)
+            if validator is None or validator != self._validator:
+                self._response.close()
+                raise IOError(f"{self.url} changed on the server during download")
+            remaining = self.offset
+            while remaining:
+                chunk = self._response.raw.read(min(remaining, _CHUNK_SIZE))
+                if not chunk:
+                    raise IOError(f"Body of {self.url} shorter than before resume")
+                remaining -= len(chunk)
+
+    def close(self) -> None:
+        self._response.close()
+        super().close()
+
+
+def _manifest_entry(name: str, data: bytes) -> ManifestEntry:
+    """Describe one package file for the manifest."""
+    return ManifestEntry(
+        name=name,
+        size=len(data),
+        sha256=hashlib.sha256(data).hexdigest(),
+        format=detect_notice_format(data),
+    )
+
+
+def _extract_members(
+    tar_file: tarfile.TarFile, dest_dir: Path, awards_only: bool = False
+) -> tuple[List[ManifestEntry], List[str]]:
+    """Extract a tar stream into dest_dir, describing each regular file.
+
+    Member names are sanitized with tarfile's "data" filter, exactly as
+    extractall(filter="data") would. With `awards_only`, only award notices
+    are written; the doc IDs of other XML notices are returned instead.
+
+    Returns:
+        Manifest entries of the written files, doc IDs of skipped notices
+    """
+    entries = []
+    skipped = []
+    for member in tar_file:
+        member = tarfile.data_filter(member, str(dest_dir))
+        if not member.isfile():
+            if not awards_only:
+                tar_file.extract(member, dest_dir, filter="data")
+            continue
+        data = tar_file.extractfile(member).read()
+        entry = _manifest_entry(member.name, data)
+        if awards_only and entry.format is None:
+            if member.name.lower().endswith(".xml"):
+                skipped.append(Path(member.name).stem.replace("_", "-"))
+            continue
+        target = dest_dir / member.name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(data)
+        entries.append(entry)
+    return entries, skipped
+
+
+def _archive_entries(archive_path: Path) -> List[ManifestEntry]:
+    """Describe the regular files of a package archive.
+
+    The whole gzip stream is read, so its length and CRC are verified too.
+
+    Raises:
+        tarfile.ReadError: If the archive is truncated or corrupt
+    """
+    try:
+        with gzip.open(archive_path) as gz:
+            with tarfile.open(fileobj=gz, mode="r|") as tar_file:
+                entries = [
+                    _manifest_entry(member.name, tar_file.extractfile(member).read())
+                    for member in tar_file
+                    if member.isfile()
+                ]
+            while gz.read(_CHUNK_SIZE):
+                pass
+    except (EOFError, zlib.error, gzip.BadGzipFile) as e:
+        raise tarfile.ReadError(f"{archive_path.name}: {e}") from e
+    return entries
+
+
+def _download_archive(url: str, package_str: str, archive_path: Path) -> bool:
+    """Download a package archive via a resumable .part file.
+
+    The partial file is kept next to a checkpoint recording the server's
+    validator, so a later run continues an interrupted transfer with a Range
+    request. The archive only appears under its final name once complete.
+    """
+    part_path = archive_path.with_name(f"{archive_path.name}.part")
+    checkpoint_path = archive_path.with_name(f"{package_str}.part.json")
+
+    offset = 0
+    validator = None
+    if part_path.exists() and checkpoint_path.exists():
+        offset = part_path.stat().st_size
+        validator = json.loads(checkpoint_path.read_text()).get("validator")
+
+    try:
+        response = _request_package(url, offset, validator)
+    except requests.HTTPError as e:
+        if offset and e.response.status_code == 416:
+            # Stale partial (e.g. larger than the current file): start over
+            logger.info(f"Package {package_str}: discarding stale partial download")
+            part_path.unlink()
+            checkpoint_path.unlink()
+            return _download_archive(url, package_str, archive_path)
+        raise
+
+    if offset and response.status_code == 206:
+        logger.info(f"Package {package_str}: resuming at {offset} bytes")
+        mode = "ab"
+    else:
+        offset = 0
+        mode = "wb"
+        checkpoint_path.write_text(json.dumps({"validator": _validator(response)}))
+
+    with _ResumableStream(url, response, offset) as stream:
+        with open(part_path, mode) as f:
+            shutil.copyfileobj(stream, f, _CHUNK_SIZE)
+            f.flush()
+            os.fsync(f.fileno())
+
+    # Check the archive before it gets its final name; a broken one is
+    # discarded so the next run downloads it again from the start
+    try:
+        entries = _archive_entries(part_path)
+    except tarfile.TarError:
+        part_path.unlink()
+        checkpoint_path.unlink()
+        raise
+
+    os.replace(part_path, archive_path)
+    checkpoint_path.unlink()
+    logger.debug(f"Saved {archive_path.stat().st_size} bytes for package {package_str}")
+
+    _write_archive_manifest(archive_path, int(package_str), entries)
+    return True
+
+
+def _write_archive_manifest(
+    archive_path: Path, package_number: int, entries: List[ManifestEntry]
+) -> None:
+    write_manifest(
+        archive_path.parent,
+        PackageManifest(
+            package=package_number,
+            storage="archive",
+            completed_at=datetime.now(timezone.utc),
+            files=entries,
+        ),
+    )
+
+
+def _download_and_extract(
+    url: str, package_str: str, extract_dir: Path, awards_only: bool = False
+) -> bool:
+    """Stream a package into tar extraction, publishing it atomically.
+
+    Members are extracted into a staging directory that is renamed to
+    `extract_dir` only once the whole archive has been read, so a crash
+    never leaves a half-extracted package that looks complete.
+    """
+    staging_dir = extract_dir.with_name(f"{extract_dir.name}.partial")
+    shutil.rmtree(staging_dir, ignore_errors=True)
+
+    response = _request_package(url)
+    with _ResumableStream(url, response) as stream:
+        staging_dir.mkdir()
+        try:
+            with tarfile.open(fileobj=stream, mode="r|gz") as tar_file:
+                entries, skipped = _extract_members(tar_file, staging_dir, awards_only)
+        except BaseException:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            raise
+        logger.debug(f"Extracted {stream.offset} bytes for package {package_str}")
+
+    # An existing extract_dir can only be an empty leftover at this point
+    shutil.rmtree(extract_dir, ignore_errors=True)
+    os.replace(staging_dir, extract_dir)
+
+    write_manifest(
+        extract_dir.parent,
+        PackageManifest(
+            package=int(package_str),
+            storage="extracted",
+            completed_at=datetime.now(timezone.utc),
+            files=entries,
+            awards_only=awards_only,
+            skipped=skipped,
+        ),
+    )
+    if awards_only:
+        logger.debug(f"Package {package_str}: skipped {len(skipped)} other notices")
+    return True
+
+
+def download_package(
+    package_number: int,
+    data_dir: Path = DATA_DIR,
+    keep_archive: bool = False,
+    awards_only: bool = False,
+) -> bool:
     """Download and extract a single daily package.
 
+    Transfers interrupted mid-stream are resumed with HTTP Range requests.
+    Archives are written to a .part file (resumable across runs) and renamed
+    into place when complete; extraction goes through a staging directory,
+    so a package only counts as downloaded once it is whole. Completed
+    packages get a manifest and an entry in the data directory index.
+
     Args:
         package_number: TED package number (yyyynnnnn format)
         data_dir: Directory to store downloaded data
+        keep_archive: Store the package as its original .tar.gz instead of
+            extracting it (import reads members straight from the archive)
+        awards_only: Extract only award notices (classified as at import);
+            the doc IDs of other notices are listed in the manifest
 
     Returns:
         True if downloaded successfully, False if package doesn't exist (404)
+
+    Raises:
+        ValueError: If both keep_archive and awards_only are set
     """
-    package_url = f"https://ted.europa.eu/packages/daily/{package_number:09d}"
+    if keep_archive and awards_only:
+        raise ValueError("awards_only requires extraction, not keep_archive")
+
+    package_url = _package_url(package_number)
     package_str = f"{package_number:09d}"
     archive_path = data_dir / f"{package_str}.tar.gz"
     extract_dir = data_dir / package_str
 
-    # Skip if already downloaded and extracted
+    # Skip if already downloaded: a manifest marks a complete package, older
+    # downloads without one are checked on disk
+    entry = load_index(data_dir).packages.get(package_number)
+    if entry is not None and entry.manifest:
+        logger.info(f"Package {package_str}: already downloaded")
+        return True
     if extract_dir.exists():
         existing_files = [f for f in extract_dir.glob("**/*") if f.is_file()]
         if existing_files:
             logger.info(f"Package {package_str}: already downloaded")
             return True
+    if get_package_archive(package_number, data_dir):
+        # No manifest: only complete if the archive reads back in full
+        try:
+            entries = _archive_entries(archive_path)
+        except tarfile.TarError as e:
+            logger.warning(f"Package {package_str}: discarding broken archive ({e})")
+            archive_path.unlink()
+        else:
+            _write_archive_manifest(archive_path, package_number, entries)
+            logger.info(f"Package {package_str}: already downloaded")
+            return True
 
-    # Download package
+    # Download package (streamed, the body is never held in memory)
     logger.info(f"Package {package_str}: downloading")
     try:
-        response = requests.get(package_url, timeout=30)
-        response.raise_for_status()
+        if keep_archive:
+            return _download_archive(package_url, package_str, archive_path)
+        return _download_and_extract(package_url, package_str, extract_dir, awards_only)
     except requests.HTTPError as e:
         if e.response.status_code == 404:
             logger.info(f"Package {package_str}: not found")
             return False
         logger.error(f"Failed to download package {package_str}: {e}")
         raise
-    except requests.RequestException as e:
-        logger.error(f"Failed to download package {package_str}: {e}")
-        raise
-
-    # Save and extract
-    archive_path.write_bytes(response.content)
-    logger.debug(f"Downloaded {len(response.content)} bytes for package {package_str}")
-
-    extract_dir.mkdir(exist_ok=True)
-    try:
-        with tarfile.open(archive_path, "r:gz") as tar_file:
-            tar_file.extractall(extract_dir, filter="data")
     except tarfile.TarError as e:
         logger.error(f"Failed to extract package {package_str}: {e}")
         raise
-
-    # Clean up archive file
-    archive_path.unlink()
-
-    return True
+    except _STREAM_ERRORS as e:
+        logger.error(f"Failed to download package {package_str}: {e}")
+        raise
 
 
 def get_package_files(
@@ -114,6 +576,13 @@ def get_package_files(
     package_str = f"{package_number:09d}"
     extract_dir = data_dir / package_str
 
+    manifest = read_manifest(data_dir, package_number)
+    if manifest is not None:
+        if manifest.storage != "extracted" or not manifest.files:
+            return None
+        return [extract_dir / f.name for f in manifest.files]
+
+    # Downloaded before manifests existed
     if not extract_dir.exists():
         return None
 
@@ -121,38 +590,331 @@ def get_package_files(
     return files if files else None
 
 
-def download_year(year: int, max_issue: int = 300, data_dir: Path = DATA_DIR):
-    """Download TED packages for a year.
+def package_manifest(
+    package_number: int, data_dir: Path = DATA_DIR
+) -> Optional[PackageManifest]:
+    """Get a package's manifest, creating it on first use if missing.
+
+    Packages downloaded before manifests existed are scanned once here
+    (reading every file to record its format), so later imports can skip
+    non-award files without opening them.
+
+    Returns:
+        The manifest, or None if the package is not downloaded
+    """
+    manifest = read_manifest(data_dir, package_number)
+    if manifest is not None:
+        return manifest
+
+    extract_dir = data_dir / f"{package_number:09d}"
+    archive_path = get_package_archive(package_number, data_dir)
+    if extract_dir.is_dir():
+        files = sorted(f for f in extract_dir.glob("**/*") if f.is_file())
+        if not files:
+            return None
+        storage = "extracted"
+        entries = [
+            _manifest_entry(f.relative_to(extract_dir).as_posix(), f.read_bytes())
+            for f in files
+        ]
+    elif archive_path is not None:
+        storage = "archive"
+        entries = _archive_entries(archive_path)
+    else:
+        return None
+
+    manifest = PackageManifest(
+        package=package_number,
+        storage=storage,
+        completed_at=datetime.now(timezone.utc),
+        files=entries,
+    )
+    write_manifest(data_dir, manifest)
+    logger.info(f"Package {package_number:09d}: Created manifest for existing files")
+    return manifest
+
+
+# A notice to parse: (path or member name, format, archive member content)
+Notice = tuple[Path, str, Optional[bytes]]
+
+
+def _award_notices(manifest: PackageManifest) -> dict[str, str]:
+    """Names and formats of a package's award notices."""
+    return {
+        entry.name: entry.format
+        for entry in manifest.files
+        if entry.format is not None and entry.name.lower().endswith(".xml")
+    }
+
+
+def _iter_archive_notices(
+    archive_path: Path, notices: dict[str, str]
+) -> Iterator[Notice]:
+    """Yield the listed award notices of a package archive.
+
+    The archive is read sequentially in stream mode; other members are
+    skipped without being read, and only one member is held in memory at a
+    time by this generator.
+    """
+    with tarfile.open(archive_path, mode="r|gz") as tar_file:
+        for member in tar_file:
+            notice_format = notices.get(member.name)
+            if notice_format is not None and member.isfile():
+                data = tar_file.extractfile(member).read()
+                yield Path(member.name), notice_format, data
+
+
+def _parse_notice(notice: Notice) -> Optional[List[AwardDataRecord]]:
+    """Parse a notice produced by parse_package."""
+    return parse_award(*notice)
+
+
+def _parse_notice_batch(
+    notices: tuple[Notice, ...],
+) -> tuple[List[Optional[List[AwardDataRecord]]], QualityReport]:
+    """Parse a batch of notices in one worker task.
+
+    Returns the parse results and the data-quality events of the batch.
+    """
+    with collect() as report:
+        results = [_parse_notice(notice) for notice in notices]
+    return results, report
+
+
+def _merge_quality(
+    batches: Iterable[tuple[List[T], QualityReport]], quality: Optional[QualityReport]
+) -> Iterator[List[T]]:
+    """Unpack batch results, merging their data-quality events into `quality`."""
+    for results, report in batches:
+        if quality is not None and report:
+            quality.merge(report)
+        yield results
+
+
+def report_quality(package_number: int, data_dir: Path, quality: QualityReport) -> None:
+    """Log and store the data-quality summary of an imported package."""
+    if not quality:
+        return
+    logger.warning(
+        f"Package {package_number:09d}: data-quality issues:\n  "
+        + "\n  ".join(quality.summary())
+    )
+    write_quality_report(data_dir, package_number, quality)
+
+
+def parse_executor(workers: Optional[int] = None, processes: bool = False) -> Executor:
+    """Create the executor used to parse package files.
+
+    Threads suit small imports; parsing is mostly GIL-bound lxml and
+    Pydantic work, so large imports scale with cores only in processes.
+    Worker processes are recycled after _MAX_TASKS_PER_CHILD tasks.
+
+    Args:
+        workers: Number of workers (default: number of CPUs)
+        processes: Parse in worker processes instead of threads
+    """
+    if processes:
+        return ProcessPoolExecutor(
+            max_workers=workers, max_tasks_per_child=_MAX_TASKS_PER_CHILD
+        )
+    return ThreadPoolExecutor(max_workers=workers)
+
+
+class ProbeUnsupported(Exception):
+    """The server does not answer HEAD requests for packages."""
+
+
+def package_exists(package_number: int) -> bool:
+    """Check whether a package is published, using a HEAD request.
+
+    Raises:
+        ProbeUnsupported: If the server rejects HEAD requests
+        requests.HTTPError: For other error statuses
+    """
+    response = get_http_session().head(
+        _package_url(package_number), allow_redirects=True, timeout=30
+    )
+    if response.status_code == 404:
+        return False
+    if response.status_code in (405, 501):
+        raise ProbeUnsupported(f"HEAD returned {response.status_code}")
+    response.raise_for_status()
+    return True
+
+
+def discover_last_issue(
+    year: int, data_dir: Path = DATA_DIR, max_issue: int = 300
+) -> Optional[int]:
+    """Find the last published OJ S issue of a year by probing.
+
+    Starting above the last issue known from the index, probes issues at
+    growing distances until one is missing, then binary searches the gap.
+    As issue numbers can have gaps, the search only ends once the next
+    _MAX_ISSUE_GAP issues are missing too; otherwise it continues from the
+    first one found. A daily run therefore costs about a dozen HEAD
+    requests. The result is cached as the starting point of the next run,
+    never as final: a gap may still hide later issues.
+
+    Args:
+        year: Year to probe
+        data_dir: Directory whose index caches the year bounds
+        max_issue: Highest issue number considered
+
+    Returns:
+        Last published issue (0 if none), or None if the server does not
+        support probing
+    """
+    cached = load_index(data_dir).years.get(year)
+
+    def exists(issue: int) -> bool:
+        return package_exists(get_package_number(year, issue))
+
+    # lo is known to exist (or 0), hi is known to be missing
+    lo = cached.last_issue if cached is not None else 0
+    try:
+        while True:
+            # Steps 1, 1, 2, 4, ...: a single new issue costs just two probes
+            step, next_step = 1, 1
+            while True:
+                probe = lo + step
+                if probe > max_issue:
+                    hi = max_issue + 1
+                    break
+                if not exists(probe):
+                    hi = probe
+                    break
+                lo = probe
+                step, next_step = next_step, next_step * 2
+
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                if exists(mid):
+                    lo = mid
+                else:
+                    hi = mid
+
+            # hi may only be a gap: look past it before accepting lo
+            gap_end = min(hi + _MAX_ISSUE_GAP, max_issue)
+            later = next((i for i in range(hi + 1, gap_end + 1) if exists(i)), None)
+            if later is None:
+                break
+            lo = later
+    except ProbeUnsupported as e:
+        logger.info(f"Issue discovery unavailable ({e}), walking issues instead")
+        return None
+
+    record_year_bounds(data_dir, year, YearBounds(last_issue=lo))
+    logger.info(f"Year {year}: last published issue is {lo}")
+    return lo
+
+
+def iter_download_year(
+    year: int,
+    max_issue: int = 300,
+    data_dir: Path = DATA_DIR,
+    concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+    keep_archives: bool = False,
+    awards_only: bool = False,
+    first_issue: int = 1,
+) -> Iterator[int]:
+    """Download TED packages for a year, yielding each downloaded package.
+
+    The last published issue is found with discover_last_issue, and only
+    issues not yet in the data index are requested. If the server does not
+    support probing, issues are walked from `first_issue` and the run stops
+    after _MAX_ISSUE_GAP consecutive 404s.
+
+    Up to `concurrency` packages are downloaded in parallel. Results are
+    still evaluated in issue order, so the 404 stop rule behaves exactly as
+    in a sequential walk.
 
     Args:
         year: The year to download
         max_issue: Maximum issue number to try (default: 300)
         data_dir: Directory for storing downloaded packages
+        concurrency: Number of packages to keep in flight
+        keep_archives: Store packages as .tar.gz instead of extracting them
+        awards_only: Store only award notices (see download_package)
+        first_issue: First issue to consider (earlier ones are skipped)
+
+    Yields:
+        Package numbers of successfully downloaded packages, in issue order
     """
-    logger.info(
-        f"Downloading TED packages for year {year} (issues 1-{max_issue}, stopping after 10 consecutive 404s)"
-    )
+    last_issue = discover_last_issue(year, data_dir, max_issue)
+    if last_issue is None:
+        issues = range(first_issue, max_issue + 1)
+        max_consecutive_404s = _MAX_ISSUE_GAP
+        logger.info(
+            f"Downloading TED packages for year {year} "
+            f"(issues {first_issue}-{max_issue}, concurrency {concurrency}, "
+            f"stopping after {max_consecutive_404s} consecutive 404s)"
+        )
+    else:
+        downloaded = load_index(data_dir).packages
+
+        def is_downloaded(issue: int) -> bool:
+            entry = downloaded.get(get_package_number(year, issue))
+            return entry is not None and entry.manifest
+
+        issues = [i for i in range(first_issue, last_issue + 1) if not is_downloaded(i)]
+        max_consecutive_404s = None
+        logger.info(
+            f"Downloading {len(issues)} new TED packages for year {year} "
+            f"(issues {first_issue}-{last_issue}, concurrency {concurrency})"
+        )
 
-    total_downloaded = 0
     consecutive_404s = 0
-    max_consecutive_404s = 10
 
-    for issue in range(1, max_issue + 1):
-        package_number = get_package_number(year, issue)
-        success = download_package(package_number, data_dir)
+    def download(issue: int) -> bool:
+        return download_package(
+            get_package_number(year, issue),
+            data_dir,
+            keep_archive=keep_archives,
+            awards_only=awards_only,
+        )
 
-        if not success:
-            consecutive_404s += 1
-            if consecutive_404s >= max_consecutive_404s:
-                logger.info(
-                    f"Stopping after {max_consecutive_404s} consecutive 404s at issue {issue}"
-                )
-                break
-            continue
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = _bounded_map(executor, download, issues, concurrency)
+        for issue, success in zip(issues, results):
+            if not success:
+                consecutive_404s += 1
+                if max_consecutive_404s and consecutive_404s >= max_consecutive_404s:
+                    logger.info(
+                        f"Stopping after {max_consecutive_404s} consecutive 404s at issue {issue}"
+                    )
+                    results.close()
+                    break
+                continue
+
+            consecutive_404s = 0
+            yield get_package_number(year, issue)
 
-        consecutive_404s = 0
-        total_downloaded += 1
 
+def download_year(
+    year: int,
+    max_issue: int = 300,
+    data_dir: Path = DATA_DIR,
+    concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+    keep_archives: bool = False,
+    awards_only: bool = False,
+    first_issue: int = 1,
+):
+    """Download TED packages for a year.
+
+    See iter_download_year for how issues are selected.
+    """
+    total_downloaded = sum(
+        1
+        for _ in iter_download_year(
+            year,
+            max_issue=max_issue,
+            data_dir=data_dir,
+            concurrency=concurrency,
+            keep_archives=keep_archives,
+            awards_only=awards_only,
+            first_issue=first_issue,
+        )
+    )
     logger.info(f"Year {year}: Downloaded {total_downloaded} packages")
 
 
@@ -164,80 +926,164 @@ def get_downloaded_packages(year: int, data_dir: Path = DATA_DIR) -> List[int]:
         data_dir: Directory where packages are stored
 
     Returns:
-        Sorted list of package numbers that have been downloaded
+        Sorted list of package numbers that have been downloaded, whether
+        extracted or kept as archives
     """
-    year_prefix = str(year)
-    packages = []
+    # A copy: concurrent downloads add to the shared index
+    packages = list(load_index(data_dir).packages)
+    return sorted(p for p in packages if p // 100000 == year)
 
-    for item in data_dir.iterdir():
-        if item.is_dir() and item.name.startswith(year_prefix) and len(item.name) == 9:
-            try:
-                package_num = int(item.name)
-                pkg_year = package_num // 100000
-                if pkg_year == year:
-                    packages.append(package_num)
-            except ValueError:
+
+def parse_package(
+    package_number: int,
+    data_dir: Path,
+    executor: Executor,
+    max_in_flight: Optional[int] = None,
+    quality: Optional[QualityReport] = None,
+) -> Optional[Iterator[Optional[List[AwardDataRecord]]]]:
+    """Parse the files of a downloaded package in an executor.
+
+    Only award notices are parsed, as classified by the package manifest;
+    other files are never opened. At most `max_in_flight` files are
+    submitted or parsed but not yet consumed, so memory stays flat however
+    large the package is and a slow consumer holds back the parse workers.
+    Packages kept as .tar.gz archives are read in a single sequential pass,
+    with members handed to the parsers as in-memory bytes. Process pools
+    receive files in chunks of PROCESS_CHUNK_SIZE. Data-quality events of
+    the parsers are merged into `quality` as results are consumed.
+
+    Args:
+        package_number: TED package number (yyyynnnnn format)
+        data_dir: Directory where packages are stored
+        executor: Thread or process pool (see parse_executor)
+        max_in_flight: Bound on files in flight (default: DEFAULT_MAX_IN_FLIGHT,
+            or two chunks per CPU for process pools if that is more)
+        quality: Report collecting the package's data-quality events
+
+    Returns:
+        Parse results in file order (None for notices that failed to parse),
+        or None if the package is not downloaded
+    """
+    chunk_size = 1
+    if isinstance(executor, ProcessPoolExecutor):
+        chunk_size = PROCESS_CHUNK_SIZE
+    if max_in_flight is None:
+        max_in_flight = max(
+            DEFAULT_MAX_IN_FLIGHT, 2 * (os.cpu_count() or 1) * chunk_size
+        )
+
+    manifest = package_manifest(package_number, data_dir)
+    if manifest is None:
+        logger.warning(f"Package {package_number:09d} not found in {data_dir}")
+        return None
+
+    notices = _award_notices(manifest)
+    if manifest.storage == "extracted":
+        extract_dir = data_dir / f"{package_number:09d}"
+        items = [(extract_dir / name, fmt, None) for name, fmt in notices.items()]
+    else:
+        archive_path = get_package_archive(package_number, data_dir)
+        items = _iter_archive_notices(archive_path, notices)
+
+    batches = _bounded_map(
+        executor,
+        _parse_notice_batch,
+        batched(items, chunk_size),
+        max(1, max_in_flight // chunk_size),
+    )
+    return chain.from_iterable(_merge_quality(batches, quality))
+
+
+def save_package(
+    package_number: int,
+    parsed: Iterable[Optional[List[AwardDataRecord]]],
+    validate: bool = False,
+) -> int:
+    """Save a package's parsed award notices in a single transaction.
+
+    With validate=True every notice is checked against the Pydantic schema
+    before saving, and the first invalid one raises ValidationError.
+
+    Returns:
+        Number of award notices imported
+    """
+    count = 0
+    with get_session() as session:
+        for awards in parsed:
+            if not awards:
                 continue
+            for award_data in awards:
+                if validate:
+                    validate_award_data(award_data)
+                if save_document_core(session, award_data):
+                    count += 1
 
-    return sorted(packages)
+    if count:
+        logger.info(f"Package {package_number:09d}: Imported {count} award notices")
+    return count
 
 
 def import_package(
     package_number: int,
     data_dir: Path = DATA_DIR,
-    executor: Optional[ThreadPoolExecutor] = None,
+    executor: Optional[Executor] = None,
+    max_in_flight: Optional[int] = None,
+    validate: bool = False,
 ) -> int:
     """Import awards from a single downloaded package.
 
     All documents are saved in a single transaction per package.
-    Parsing is done in the provided thread pool executor while
+    Parsing is done in the provided executor (see parse_executor) while
     database saving runs sequentially on the calling thread.
 
     Args:
         package_number: TED package number (yyyynnnnn format)
         data_dir: Directory where packages are stored
-        executor: Thread pool for parallel XML parsing (created if None)
+        executor: Thread or process pool for parallel XML parsing (a thread
+            pool is created if None)
+        max_in_flight: Bound on files parsed ahead of the database writer
+            (see parse_package)
+        validate: Check parsed notices against the schema (see save_package)
 
     Returns:
         Number of award notices imported
     """
-    files = get_package_files(package_number, data_dir)
-    if files is None:
-        logger.warning(f"Package {package_number:09d} not found in {data_dir}")
-        return 0
-
-    xml_files = [f for f in files if f.suffix.lower() == ".xml"]
-
     own_executor = executor is None
     if own_executor:
         executor = ThreadPoolExecutor()
 
     try:
-        parsed = executor.map(try_parse_award, xml_files)
-
-        count = 0
-        with get_session() as session:
-            for awards in parsed:
-                if not awards:
-                    continue
-                for award_data in awards:
-                    if save_document_core(session, award_data):
-                        count += 1
+        quality = QualityReport()
+        parsed = parse_package(
+            package_number, data_dir, executor, max_in_flight, quality
+        )
+        if parsed is None:
+            return 0
+        imported = save_package(package_number, parsed, validate)
+        report_quality(package_number, data_dir, quality)
+        return imported
     finally:
         if own_executor:
             executor.shutdown(wait=False)
 
-    if count:
-        logger.info(f"Package {package_number:09d}: Imported {count} award notices")
-    return count
-
 
-def import_year(year: int, data_dir: Path = DATA_DIR):
+def import_year(
+    year: int,
+    data_dir: Path = DATA_DIR,
+    workers: Optional[int] = None,
+    processes: bool = False,
+    max_in_flight: Optional[int] = None,
+    validate: bool = False,
+):
     """Import awards from all downloaded packages for a year.
 
     Args:
         year: The year to import
         data_dir: Directory where packages are stored
+        workers: Number of parse workers (default: number of CPUs)
+        processes: Parse in worker processes instead of threads
+        max_in_flight: Bound on files parsed ahead of the database writer
+        validate: Check parsed notices against the schema (see save_package)
     """
     Base.metadata.create_all(engine)
 
@@ -249,20 +1095,165 @@ def import_year(year: int, data_dir: Path = DATA_DIR):
     logger.info(f"Importing {len(packages)} packages for year {year}")
 
     total_imported = 0
-    with ThreadPoolExecutor() as executor:
+    with parse_executor(workers, processes) as executor:
         for package_number in packages:
-            total_imported += import_package(package_number, data_dir, executor)
+            total_imported += import_package(
+                package_number, data_dir, executor, max_in_flight, validate
+            )
 
     logger.info(f"Year {year}: Imported {total_imported} total award notices")
 
 
+def sync(
+    start_year: Optional[int] = None,
+    data_dir: Path = DATA_DIR,
+    concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+    keep_archives: bool = False,
+    awards_only: bool = False,
+    workers: Optional[int] = None,
+    processes: bool = False,
+) -> int:
+    """Download and import only the packages published since the last sync.
+
+    The last downloaded and last imported package numbers are kept in the
+    sync_state table. Downloads resume after the download watermark, and
+    only packages after the import watermark are imported, so documents
+    imported by earlier runs are never re-parsed or checked again. The
+    download watermark moves to the last package this run downloaded, never
+    to packages that other commands left in the data directory. The import
+    watermark advances after each package's transaction commits.
+
+    Args:
+        start_year: Year to start from when there is no watermark yet
+            (default: current year)
+        data_dir: Directory for storing downloaded packages
+        concurrency: Number of packages to download in parallel
+        keep_archives: Store packages as .tar.gz instead of extracting them
+        awards_only: Store only award notices (see download_package)
+        workers: Number of parse workers (default: number of CPUs)
+        processes: Parse in worker processes instead of threads
+
+    Returns:
+        Number of award notices imported
+    """
+    Base.metadata.create_all(engine)
+
+    last_downloaded, last_imported = get_sync_state(TEDPortal.name)
+    if start_year is None:
+        start_year = datetime.now().year
+    floor = get_package_number(start_year, 0)
+
+    # Every year from the watermark on is walked to its end, so the issues
+    # below the last package downloaded here are all downloaded or missing
+    # on the server, whatever else the data directory holds
+    download_from = max(floor, last_downloaded or 0) + 1
+    downloaded_to = None
+    for year in range(download_from // 100000, datetime.now().year + 1):
+        first_issue = download_from % 100000 if year == download_from // 100000 else 1
+        for package_number in iter_download_year(
+            year,
+            data_dir=data_dir,
+            concurrency=concurrency,
+            keep_archives=keep_archives,
+            awards_only=awards_only,
+            first_issue=first_issue,
+        ):
+            downloaded_to = package_number
+    if downloaded_to is not None:
+        save_sync_state(TEDPortal.name, last_downloaded=downloaded_to)
+
+    packages = sorted(load_index(data_dir).packages)
+
+    import_from = max(floor, last_imported or 0) + 1
+    pending = [p for p in packages if p >= import_from]
+    if not pending:
+        logger.info("Sync: no new packages to import")
+        return 0
+
+    logger.info(f"Sync: importing {len(pending)} new packages")
+    total_imported = 0
+    with parse_executor(workers, processes) as executor:
+        for package_number in pending:
+            total_imported += import_package(package_number, data_dir, executor)
+            save_sync_state(TEDPortal.name, last_imported=package_number)
+
+    logger.info(f"Sync: imported {total_imported} award notices")
+    return total_imported
+
+
 class TEDPortal:
     name = "ted"
 
-    def download(self, start_year: int, end_year: int) -> None:
+    def download(
+        self,
+        start_year: int,
+        end_year: int,
+        concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+        keep_archives: bool = False,
+        awards_only: bool = False,
+    ) -> None:
         for y in range(start_year, end_year + 1):
-            download_year(y)
+            download_year(
+                y,
+                concurrency=concurrency,
+                keep_archives=keep_archives,
+                awards_only=awards_only,
+            )
 
-    def import_data(self, start_year: int, end_year: int) -> None:
+    def import_data(
+        self,
+        start_year: int,
+        end_year: int,
+        workers: Optional[int] = None,
+        processes: bool = False,
+        max_in_flight: Optional[int] = None,
+        validate: bool = False,
+    ) -> None:
         for y in range(start_year, end_year + 1):
-            import_year(y)
+            import_year(
+                y,
+                workers=workers,
+                processes=processes,
+                max_in_flight=max_in_flight,
+                validate=validate,
+            )
+
+    def sync(
+        self,
+        start_year: Optional[int] = None,
+        concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+        keep_archives: bool = False,
+        awards_only: bool = False,
+        workers: Optional[int] = None,
+        processes: bool = False,
+    ) -> int:
+        return sync(
+            start_year,
+            concurrency=concurrency,
+            keep_archives=keep_archives,
+            awards_only=awards_only,
+            workers=workers,
+            processes=processes,
+        )
+
+    def backfill(
+        self,
+        start_year: int,
+        end_year: int,
+        concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+        keep_archives: bool = False,
+        awards_only: bool = False,
+        workers: Optional[int] = None,
+        processes: bool = False,
+    ) -> int:
+        from .pipeline import run_pipeline  # pipeline builds on this module
+
+        return run_pipeline(
+            start_year,
+            end_year,
+            concurrency=concurrency,
+            keep_archives=keep_archives,
+            awards_only=awards_only,
+            workers=workers,
+            processes=processes,
+        )
@@ -0,0 +1,101 @@
+"""
+Data-quality counters.
+
+Parsers report recoverable data problems (unparseable amounts, invalid
+integers, unknown codes) with record() instead of logging a warning per
+occurrence. Inside collect(), events are counted per (issue, field) with a
+few sample values; the importer collects a report per parse task, merges
+them per package and writes one summary. Outside collect() events are
+dropped. Individual occurrences are logged at DEBUG by the parsers.
+"""
+
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Distinct sample values kept per (issue, field)
+MAX_SAMPLES = 5
+
+# Issue names used by the parsers
+UNPARSEABLE_AMOUNT = "unparseable_amount"
+INVALID_INTEGER = "invalid_integer"
+UNKNOWN_CODE = "unknown_code"
+UNEXPECTED_SCHEME_ID = "unexpected_scheme_id"
+
+Key = Tuple[str, str]
+
+
+@dataclass(slots=True)
+class QualityReport:
+    """Counts and sample values of data-quality events."""
+
+    counts: Counter = field(default_factory=Counter)
+    samples: Dict[Key, List[str]] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.counts)
+
+    def add(self, issue: str, field_name: str, value: object) -> None:
+        """Count one occurrence of an issue, keeping `value` as a sample."""
+        key = (issue, field_name)
+        self.counts[key] += 1
+        samples = self.samples.setdefault(key, [])
+        sample = str(value)
+        if len(samples) < MAX_SAMPLES and sample not in samples:
+            samples.append(sample)
+
+    def merge(self, other: "QualityReport") -> None:
+        """Add the events of another report to this one."""
+        self.counts.update(other.counts)
+        for key, other_samples in other.samples.items():
+            samples = self.samples.setdefault(key, [])
+            for sample in other_samples:
+                if len(samples) >= MAX_SAMPLES:
+                    break
+                if sample not in samples:
+                    samples.append(sample)
+
+    def summary(self) -> List[str]:
+        """One line per (issue, field), most frequent first."""
+        lines = []
+        for key, count in self.counts.most_common():
+            samples = ", ".join(repr(s) for s in self.samples.get(key, []))
+            lines.append(f"{key[0]} {key[1]}: {count} (e.g. {samples})")
+        return lines
+
+    def to_dict(self) -> dict:
+        """JSON-serializable form of the report."""
+        return {
+            "issues": [
+                {
+                    "issue": issue,
+                    "field": field_name,
+                    "count": count,
+                    "samples": self.samples.get((issue, field_name), []),
+                }
+                for (issue, field_name), count in self.counts.most_common()
+            ]
+        }
+
+
+_local = threading.local()
+
+
+def record(issue: str, field_name: str, value: object) -> None:
+    """Count an event in the report being collected by this thread, if any."""
+    report: Optional[QualityReport] = getattr(_local, "report", None)
+    if report is not None:
+        report.add(issue, field_name, value)
+
+
+@contextmanager
+def collect() -> Iterator[QualityReport]:
+    """Collect the events recorded by this thread into a new report."""
+    previous = getattr(_local, "report", None)
+    _local.report = report = QualityReport()
+    try:
+        yield report
+    finally:
+        _local.report = previous
@@ -2,15 +2,16 @@
 
 import csv
 import io
+import json
 import logging
 
-import requests
 from sqlalchemy import select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from .models import ExchangeRate, PriceIndex
 from .db import engine, get_session
+from .http import fetch_cached
 
 logger = logging.getLogger(__name__)
 
@@ -64,11 +65,10 @@ def fetch_ecb_rates(
     logger.info(
         f"Fetching ECB rates for {len(currencies)} currencies ({start_year}-{end_year})"
     )
-    response = requests.get(url, headers={"Accept": "text/csv"}, timeout=60)
-    response.raise_for_status()
+    body = fetch_cached(url, headers={"Accept": "text/csv"}, timeout=60)
 
     rows = []
-    reader = csv.DictReader(io.StringIO(response.text))
+    reader = csv.DictReader(io.StringIO(body.decode("utf-8")))
     for row in reader:
         time_period = row["TIME_PERIOD"]
         year, month = time_period.split("-")
@@ -94,10 +94,7 @@ def fetch_hicp(start_year: int, end_year: int) -> list[dict]:
     )
 
     logger.info(f"Fetching Eurostat HICP ({start_year}-{end_year})")
-    response = requests.get(url, timeout=60)
-    response.raise_for_status()
-
-    data = response.json()
+    data = json.loads(fetch_cached(url, timeout=60))
 
     # JSON-stat 2.0: time dimension maps index positions to period labels
     time_dim = data["dimension"]["time"]["category"]["index"]
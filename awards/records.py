@@ -0,0 +1,139 @@
+"""
+Lightweight records for parsed award data.
+
+Parsers build these slotted dataclasses instead of the Pydantic models in
+schema.py: they cost no validation when built, take a fraction of the
+memory, pickle cheaply between worker processes and are read by the
+database layer attribute by attribute, without a model_dump round trip.
+
+Field names and defaults mirror schema.py. Code entries are frozen, as the
+parsers share one instance per code between documents (see parsers/codes.py).
+Validation against the Pydantic models is an opt-in boundary check
+(validate_award_data), used by tests and by imports run with --validate.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from typing import List, Optional
+
+from .schema import AwardDataModel
+
+
+@dataclass(slots=True, kw_only=True, frozen=True)
+class AuthorityTypeRecord:
+    """Authority type entry (schema.AuthorityTypeEntry)."""
+
+    code: str
+    description: Optional[str] = None
+
+
+@dataclass(slots=True, kw_only=True)
+class IdentifierRecord:
+    """Organization identifier (schema.IdentifierEntry)."""
+
+    scheme: Optional[str] = None
+    identifier: str
+
+
+@dataclass(slots=True, kw_only=True)
+class OrganizationRecord:
+    """Buyer or contractor organization (schema.OrganizationModel)."""
+
+    official_name: str
+    address: Optional[str] = None
+    town: Optional[str] = None
+    postal_code: Optional[str] = None
+    country_code: Optional[str] = None
+    nuts_code: Optional[str] = None
+    identifiers: List[IdentifierRecord] = field(default_factory=list)
+
+
+@dataclass(slots=True, kw_only=True)
+class DocumentRecord:
+    """Document metadata (schema.DocumentModel)."""
+
+    doc_id: str
+    edition: Optional[str] = None
+    version: Optional[str] = None
+    reception_id: Optional[str] = None
+    official_journal_ref: Optional[str] = None
+    publication_date: Optional[date] = None
+    dispatch_date: Optional[date] = None
+    source_country: Optional[str] = None
+    contact_point: Optional[str] = None
+    phone: Optional[str] = None
+    email: Optional[str] = None
+    url_general: Optional[str] = None
+    buyer_url: Optional[str] = None
+    buyer_authority_type: Optional[AuthorityTypeRecord] = None
+    buyer_main_activity_code: Optional[str] = None
+
+
+@dataclass(slots=True, kw_only=True)
+class CpvCodeRecord:
+    """CPV code entry (schema.CpvCodeEntry)."""
+
+    code: str
+    description: Optional[str] = None
+
+
+@dataclass(slots=True, kw_only=True, frozen=True)
+class ProcedureTypeRecord:
+    """Procedure type entry (schema.ProcedureTypeEntry)."""
+
+    code: str
+    description: Optional[str] = None
+
+
+@dataclass(slots=True, kw_only=True)
+class ContractRecord:
+    """Contract information (schema.ContractModel)."""
+
+    title: str
+    short_description: Optional[str] = None
+    main_cpv_code: Optional[str] = None
+    cpv_codes: List[CpvCodeRecord] = field(default_factory=list)
+    nuts_code: Optional[str] = None
+    contract_nature_code: Optional[str] = None
+    procedure_type: Optional[ProcedureTypeRecord] = None
+    accelerated: bool = False
+    estimated_value: Optional[Decimal] = None
+    estimated_value_currency: Optional[str] = None
+    framework_agreement: bool = False
+    eu_funded: bool = False
+
+
+@dataclass(slots=True, kw_only=True)
+class AwardRecord:
+    """A single award (schema.AwardModel)."""
+
+    award_title: Optional[str] = None
+    contract_number: Optional[str] = None
+    tenders_received: Optional[int] = None
+    awarded_value: Optional[float] = None
+    awarded_value_currency: Optional[str] = None
+    award_date: Optional[date] = None
+    lot_number: Optional[str] = None
+    contract_start_date: Optional[date] = None
+    contract_end_date: Optional[date] = None
+    contractors: List[OrganizationRecord] = field(default_factory=list)
+
+
+@dataclass(slots=True, kw_only=True)
+class AwardDataRecord:
+    """A parsed award notice (schema.AwardDataModel)."""
+
+    document: DocumentRecord
+    buyer: OrganizationRecord
+    contract: ContractRecord
+    awards: List[AwardRecord]
+
+
+def validate_award_data(record: AwardDataRecord) -> AwardDataModel:
+    """Validate a parsed notice against the Pydantic schema.
+
+    Raises:
+        pydantic.ValidationError: If the record does not satisfy the schema
+    """
+    return AwardDataModel.model_validate(record, from_attributes=True)
@@ -1,6 +1,37 @@
 """Tests for parse_monetary_value aggregator."""
 
-from awards.parsers.monetary import parse_monetary_value
+import logging
+
+import pytest
+
+from awards import quality
+from awards.parsers.monetary import (
+    matching_formats,
+    parse_monetary_value,
+)
+
+# One example per format, plus near-misses between formats
+SAMPLE_VALUES = [
+    "885,72",
+    "72,8",
+    "40,0000",
+    "1234.56",
+    "1234",
+    "979828.1",
+    "10 760 400",
+    "1 234,56",
+    "1 234.56",
+    "9 117,5",
+    "56 146,820",
+    "264 886,8600",
+    "1 011  606,51",
+    "336  256,12",
+    "600,000",
+    "1,234,567",
+    "123,456",
+    "1 234,567",
+    "1,234.56",
+]
 
 
 class TestParseMonetaryValue:
@@ -36,10 +67,14 @@ class TestParseMonetaryValue:
         """Should match float_doublespace_thousands parser."""
         assert parse_monetary_value("336  256,12", "test_field") == 336256.12
 
-    def test_no_match_logs_warning(self, caplog):
-        """Should log warning when no parser matches."""
-        result = parse_monetary_value("año 2011: 34 993,09", "awarded_value")
+    def test_no_match_counted(self, caplog):
+        """Should count a data-quality issue and log only at DEBUG."""
+        caplog.set_level(logging.DEBUG)
+        with quality.collect() as report:
+            result = parse_monetary_value("año 2011: 34 993,09", "awarded_value")
         assert result is None
+        assert report.counts == {(quality.UNPARSEABLE_AMOUNT, "awarded_value"): 1}
+        assert [r.levelno for r in caplog.records] == [logging.DEBUG]
         assert "No monetary parser matched for awarded_value" in caplog.text
 
     def test_empty_string(self):
@@ -50,3 +85,18 @@ class TestParseMonetaryValue:
 
     def test_whitespace_only(self):
         assert parse_monetary_value("   ", "test_field") is None
+
+
+class TestFormatsExclusive:
+    """The formats must never overlap, or the parsed value would be ambiguous."""
+
+    @pytest.mark.parametrize("value", SAMPLE_VALUES)
+    def test_at_most_one_format_matches(self, value):
+        assert len(matching_formats(value)) <= 1
+
+    @pytest.mark.parametrize("value", SAMPLE_VALUES)
+    def test_engine_agrees_with_matching_format(self, value):
+        """Should parse exactly the values some format matches."""
+        assert (parse_monetary_value(value, "test_field") is not None) == bool(
+            matching_formats(value)
+        )
@@ -0,0 +1,60 @@
+"""Tests for parsers/codes.py — shared canonical code entries."""
+
+import dataclasses
+
+import pytest
+
+from awards.parsers.codes import make_authority_type_entry, normalize_procedure_type
+
+
+class TestNormalizeProcedureType:
+    """Tests for normalize_procedure_type."""
+
+    @pytest.mark.parametrize(
+        "raw_code, accelerated",
+        [("T", False), ("AWARD_CONTRACT_WITHOUT_CALL", False), ("neg-wo-call", False)],
+    )
+    def test_all_notations_share_one_entry(self, raw_code, accelerated):
+        entry, is_accelerated = normalize_procedure_type(raw_code, None)
+        expected, _ = normalize_procedure_type("neg-wo-call", None)
+        assert entry is expected
+        assert entry.code == "neg-wo-call"
+        assert is_accelerated is accelerated
+
+    def test_accelerated(self):
+        entry, accelerated = normalize_procedure_type("ACCELERATED_RESTRICTED", None)
+        assert entry.code == "restricted"
+        assert accelerated is True
+
+    def test_eforms_description_kept(self):
+        """Test that an eForms code keeps the description given with it."""
+        entry, _ = normalize_procedure_type("open", "Offenes Verfahren")
+        assert entry.code == "open"
+        assert entry.description == "Offenes Verfahren"
+
+    def test_ted_v2_description_ignored(self):
+        entry, _ = normalize_procedure_type("1", "Offenes Verfahren")
+        assert entry.description == "Open procedure"
+
+    @pytest.mark.parametrize("raw_code", [None, "unpublished", "9", "bogus"])
+    def test_no_entry(self, raw_code):
+        assert normalize_procedure_type(raw_code, None) == (None, False)
+
+    def test_entries_immutable(self):
+        entry, _ = normalize_procedure_type("open", None)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            entry.description = "changed"
+
+
+class TestMakeAuthorityTypeEntry:
+    """Tests for make_authority_type_entry."""
+
+    def test_all_notations_share_one_entry(self):
+        codes = ["6", "BODY_PUBLIC", "body-pl"]
+        entries = [make_authority_type_entry(code) for code in codes]
+        assert entries[0] is entries[1] is entries[2]
+        assert entries[0].description == "Body governed by public law"
+
+    @pytest.mark.parametrize("raw_code", [None, "8", "OTHER", "bogus"])
+    def test_no_entry(self, raw_code):
+        assert make_authority_type_entry(raw_code) is None
@@ -0,0 +1,98 @@
+"""Tests for parsers/xml.py — shared XML parser and helpers."""
+
+import io
+import threading
+
+from lxml import etree
+
+from awards.parsers import ted_v2
+from awards.parsers.xml import (
+    element_text,
+    iterparse,
+    xml_parser,
+    xpath_text,
+)
+
+ENTITY_EXPANSION = b"""<?xml version="1.0"?>
+<!DOCTYPE TED_EXPORT [
+  <!ENTITY a "aaaaaaaaaa">
+  <!ENTITY b "&a;&a;&a;&a;&a;&a;&a;&a;&a;&a;">
+  <!ENTITY c "&b;&b;&b;&b;&b;&b;&b;&b;&b;&b;">
+]>
+<TED_EXPORT><TITLE>&c;</TITLE></TED_EXPORT>"""
+
+EXTERNAL_ENTITY = b"""<?xml version="1.0"?>
+<!DOCTYPE TED_EXPORT [<!ENTITY secret SYSTEM "file:///etc/passwd">]>
+<TED_EXPORT><TITLE>&secret;</TITLE></TED_EXPORT>"""
+
+
+class TestXmlParser:
+    """Tests for the per-thread notice parser."""
+
+    def test_reused_within_thread(self):
+        assert xml_parser() is xml_parser()
+
+    def test_separate_per_thread(self):
+        parsers = []
+        thread = threading.Thread(target=lambda: parsers.append(xml_parser()))
+        thread.start()
+        thread.join()
+        assert parsers[0] is not xml_parser()
+
+    def test_entities_not_expanded(self):
+        """Test that entity-expansion payloads are not expanded."""
+        root = etree.fromstring(ENTITY_EXPANSION, xml_parser())
+        assert "aaaaaaaaaa" not in element_text(root.find("TITLE"))
+
+    def test_external_entities_not_loaded(self):
+        root = etree.fromstring(EXTERNAL_ENTITY, xml_parser())
+        assert "root:" not in element_text(root.find("TITLE"))
+
+    def test_paragraph_whitespace_kept(self):
+        """Test that text spread over <P> elements keeps its separators."""
+        root = etree.fromstring(b"<T><P>Lot 1</P>\n<P>Lot 2</P></T>", xml_parser())
+        assert element_text(root) == "Lot 1\nLot 2"
+
+    def test_malicious_notice_parses_safely(self):
+        """Test that a notice parser returns without expanding entities."""
+        assert ted_v2.parse_xml_bytes(ENTITY_EXPANSION, "x.xml") is None
+
+
+class TestXpathText:
+    """Tests for xpath_text with string and compiled expressions."""
+
+    ROOT = etree.fromstring(b"<T><A> one </A><A>two</A><B/></T>")
+
+    def test_string_expression(self):
+        assert xpath_text(self.ROOT, "A") == "one"
+        assert xpath_text(self.ROOT, "B") == ""
+
+    def test_compiled_element_expression(self):
+        assert xpath_text(self.ROOT, etree.XPath("A")) == "one"
+        assert xpath_text(self.ROOT, etree.XPath("C")) == ""
+
+    def test_compiled_text_expression(self):
+        assert xpath_text(self.ROOT, etree.XPath("A[2]/text()")) == "two"
+
+
+class TestIterparse:
+    """Tests for hardened incremental parsing."""
+
+    DOCUMENT = (
+        b'<T xmlns="urn:t"><KEEP><A>1</A></KEEP>'
+        b"<SKIP><B><C>2</C></B></SKIP><LAST>3</LAST></T>"
+    )
+
+    def test_matching_elements_streamed(self):
+        """Test that only matching end tags are reported, in document order."""
+        events = iterparse(io.BytesIO(self.DOCUMENT), ["{*}A", "{*}SKIP"])
+        for _, elem in events:
+            if etree.QName(elem).localname == "SKIP":
+                elem.getparent().remove(elem)
+        assert [etree.QName(c).localname for c in events.root] == ["KEEP", "LAST"]
+        assert element_text(events.root) == "13"
+
+    def test_entities_not_expanded(self):
+        events = iterparse(io.BytesIO(ENTITY_EXPANSION), ["TITLE"])
+        [(_, title)] = list(events)
+        assert "aaaaaaaaaa" not in element_text(title)
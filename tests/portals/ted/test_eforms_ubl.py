@@ -5,19 +5,20 @@ The eForms UBL format is the new EU standard for TED notices starting in 2025.
 These tests validate:
 1. Document parsing (parse_xml_file)
 2. Data extraction (document, buyer, contract, awards, contractors)
-3. Data validation using Pydantic models
+3. Data validation against the Pydantic models
 """
 
 import pytest
 from pathlib import Path
 
 from awards.parsers import eforms_ubl
-from awards.schema import (
-    AwardDataModel,
-    DocumentModel,
-    OrganizationModel,
-    ContractModel,
-    AwardModel,
+from awards.records import (
+    AwardDataRecord,
+    DocumentRecord,
+    OrganizationRecord,
+    ContractRecord,
+    AwardRecord,
+    validate_award_data,
 )
 
 
@@ -46,11 +47,12 @@ class TestEFormsUBLParser:
 
         # Validate award data
         award_data = result[0]
-        assert isinstance(award_data, AwardDataModel)
+        assert isinstance(award_data, AwardDataRecord)
+        validate_award_data(award_data)
 
         # Validate document
         document = award_data.document
-        assert isinstance(document, DocumentModel)
+        assert isinstance(document, DocumentRecord)
         assert document.doc_id, f"Document ID should be present in {fixture_name}"
         assert "2025" in document.doc_id, (
             f"Document ID should contain 2025 in {fixture_name}"
@@ -64,13 +66,13 @@ class TestEFormsUBLParser:
 
         # Validate buyer
         buyer = award_data.buyer
-        assert isinstance(buyer, OrganizationModel)
+        assert isinstance(buyer, OrganizationRecord)
         assert buyer.official_name, f"Buyer name should be present in {fixture_name}"
         assert buyer.country_code, f"Country code should be present in {fixture_name}"
 
         # Validate contract
         contract = award_data.contract
-        assert isinstance(contract, ContractModel)
+        assert isinstance(contract, ContractRecord)
         assert contract.title, f"Contract title should be present in {fixture_name}"
 
         # Validate awards
@@ -78,12 +80,12 @@ class TestEFormsUBLParser:
             f"Should have at least one award in {fixture_name}"
         )
         award = award_data.awards[0]
-        assert isinstance(award, AwardModel)
+        assert isinstance(award, AwardRecord)
 
         # Validate contractors if present
         if award.contractors:
             for contractor in award.contractors:
-                assert isinstance(contractor, OrganizationModel)
+                assert isinstance(contractor, OrganizationRecord)
                 assert contractor.official_name, (
                     f"Contractor name should be present in {fixture_name}"
                 )
@@ -235,5 +237,99 @@ class TestEFormsUBLParser:
         assert award.award_date is None
 
 
+def multi_lot_notice(lots: int) -> bytes:
+    """A minimal award notice with one lot, tender, contract and winner per lot."""
+    organizations = [
+        "<efac:Organization><efac:Company><cac:PartyIdentification>"
+        "<cbc:ID>ORG-0000</cbc:ID></cac:PartyIdentification>"
+        "<cac:PartyName><cbc:Name>Buyer</cbc:Name></cac:PartyName>"
+        "</efac:Company></efac:Organization>"
+    ]
+    project_lots, results, tenders, parties, contracts = [], [], [], [], []
+    for n in range(1, lots + 1):
+        organizations.append(
+            f"<efac:Organization><efac:Company><cac:PartyIdentification>"
+            f"<cbc:ID>ORG-{n:04d}</cbc:ID></cac:PartyIdentification>"
+            f"<cac:PartyName><cbc:Name>Winner {n}</cbc:Name></cac:PartyName>"
+            f"</efac:Company></efac:Organization>"
+        )
+        project_lots.append(
+            f"<cac:ProcurementProjectLot><cbc:ID>LOT-{n:04d}</cbc:ID>"
+            f"</cac:ProcurementProjectLot>"
+        )
+        # Reverse order: lookups must go by ID, not by position
+        results.insert(
+            0,
+            f"<efac:LotResult>"
+            f"<efac:LotTender><cbc:ID>TEN-{n:04d}</cbc:ID></efac:LotTender>"
+            f"<efac:SettledContract><cbc:ID>CON-{n:04d}</cbc:ID>"
+            f"</efac:SettledContract>"
+            f"<efac:TenderLot><cbc:ID>LOT-{n:04d}</cbc:ID></efac:TenderLot>"
+            f"</efac:LotResult>",
+        )
+        tenders.append(
+            f"<efac:LotTender><cbc:ID>TEN-{n:04d}</cbc:ID>"
+            f'<cac:LegalMonetaryTotal><cbc:PayableAmount currencyID="EUR">'
+            f"{n}000</cbc:PayableAmount></cac:LegalMonetaryTotal>"
+            f"<efac:TenderingParty><cbc:ID>TPA-{n:04d}</cbc:ID>"
+            f"</efac:TenderingParty></efac:LotTender>"
+        )
+        parties.append(
+            f"<efac:TenderingParty><cbc:ID>TPA-{n:04d}</cbc:ID>"
+            f"<efac:Tenderer><cbc:ID>ORG-{n:04d}</cbc:ID></efac:Tenderer>"
+            f"</efac:TenderingParty>"
+        )
+        contracts.append(
+            f"<efac:SettledContract><cbc:ID>CON-{n:04d}</cbc:ID>"
+            f"<cbc:Title>Contract {n}</cbc:Title></efac:SettledContract>"
+        )
+    ns = " ".join(f'xmlns:{p}="{uri}"' for p, uri in eforms_ubl.NAMESPACES.items())
+    return (
+        f"<can:ContractAwardNotice {ns}>"
+        f"<cbc:IssueDate>2025-01-02+01:00</cbc:IssueDate>"
+        f"<efac:NoticeResult>{''.join(results + tenders + parties + contracts)}"
+        f"</efac:NoticeResult>"
+        f"<efac:Organizations>{''.join(organizations)}</efac:Organizations>"
+        f"<cac:ContractingParty><cac:Party><cac:PartyIdentification>"
+        f"<cbc:ID>ORG-0000</cbc:ID></cac:PartyIdentification></cac:Party>"
+        f"</cac:ContractingParty>"
+        f"{''.join(project_lots)}"
+        f"</can:ContractAwardNotice>"
+    ).encode()
+
+
+class TestMultiLotNotice:
+    """Tests for ID cross-references in notices with many lots."""
+
+    def test_awards_resolved_per_lot(self):
+        result = eforms_ubl.parse_xml_bytes(multi_lot_notice(50), "000001_2025.xml")
+
+        assert result[0].buyer.official_name == "Buyer"
+        awards = result[0].awards
+        assert len(awards) == 50
+        for award in awards:
+            n = int(award.lot_number.removeprefix("LOT-"))
+            assert award.award_title == f"Contract {n}"
+            assert award.awarded_value == n * 1000
+            assert [c.official_name for c in award.contractors] == [f"Winner {n}"]
+
+    def test_repeated_organization_ids(self):
+        """Test that a repeated ID gives the first buyer but the last contractor."""
+        duplicates = "".join(
+            f"<efac:Organization><efac:Company><cac:PartyIdentification>"
+            f"<cbc:ID>{org_id}</cbc:ID></cac:PartyIdentification>"
+            f"<cac:PartyName><cbc:Name>Repeated</cbc:Name></cac:PartyName>"
+            f"</efac:Company></efac:Organization>"
+            for org_id in ["ORG-0000", "ORG-0001"]
+        )
+        data = multi_lot_notice(1).replace(
+            b"</efac:Organizations>", f"{duplicates}</efac:Organizations>".encode()
+        )
+        result = eforms_ubl.parse_xml_bytes(data, "000001_2025.xml")
+
+        assert result[0].buyer.official_name == "Buyer"
+        assert result[0].awards[0].contractors[0].official_name == "Repeated"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
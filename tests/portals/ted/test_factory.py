@@ -4,11 +4,16 @@ Tests for try_parse_award detection and parsing.
 Validates that:
 1. Award notices are correctly detected and parsed
 2. Non-award files return None
+3. In-memory notices parse exactly like files
 """
 
 from pathlib import Path
 
-from awards.portals.ted import try_parse_award
+import pytest
+from lxml import etree
+
+from awards.parsers import eforms_ubl, ted_v2
+from awards.portals.ted import try_parse_award, try_parse_award_bytes
 
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
@@ -47,3 +52,41 @@ class TestTryParseAward:
         result = try_parse_award(FIXTURES_DIR / "eforms_ubl_2025_alt.xml")
         assert result is not None
         assert len(result) == 1
+
+    def test_skips_non_award_file(self, tmp_path):
+        """Test that a file is judged by its header alone."""
+        path = tmp_path / "notice.xml"
+        path.write_bytes(b"<TED_EXPORT>" + b" " * 5000 + b'CODE="7" <broken')
+        assert try_parse_award(path) is None
+
+
+class TestParseFromBytes:
+    """Tests for parsing notices held in memory."""
+
+    @pytest.mark.parametrize(
+        "parser,fixture_name",
+        [
+            (ted_v2, "ted_v2_r2_0_7_2011.xml"),
+            (ted_v2, "ted_v2_r2_0_9_2024.xml"),
+            (eforms_ubl, "eforms_ubl_2025.xml"),
+        ],
+    )
+    def test_bytes_match_file(self, parser, fixture_name):
+        """Test that parse_xml_bytes gives the same result as parse_xml_file."""
+        fixture_file = FIXTURES_DIR / fixture_name
+        from_bytes = parser.parse_xml_bytes(fixture_file.read_bytes(), fixture_name)
+        assert from_bytes == parser.parse_xml_file(fixture_file)
+
+    def test_dispatcher_detects_format(self):
+        """Test that try_parse_award_bytes sniffs the buffer it parses."""
+        data = (FIXTURES_DIR / "eforms_ubl_2025.xml").read_bytes()
+        result = try_parse_award_bytes(data, "eforms_ubl_2025.xml")
+        assert result == try_parse_award(FIXTURES_DIR / "eforms_ubl_2025.xml")
+
+    def test_dispatcher_skips_non_award(self):
+        assert try_parse_award_bytes(b"<test/>", "test.xml") is None
+
+    def test_malformed_bytes_raise(self):
+        """Test that a broken buffer fails like a broken file."""
+        with pytest.raises(etree.XMLSyntaxError):
+            ted_v2.parse_xml_bytes(b"<TED_EXPORT>", "broken.xml")
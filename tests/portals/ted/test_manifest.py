@@ -0,0 +1,251 @@
+"""
+Tests for portals/ted/manifest.py — package manifests and data index.
+"""
+
+import hashlib
+import io
+import tarfile
+import tempfile
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from awards.portals.ted import (
+    download_package,
+    get_downloaded_packages,
+    get_package_files,
+)
+from awards.portals.ted import manifest
+from awards.portals.ted.manifest import (
+    INDEX_FILE,
+    JOURNAL_FILE,
+    IndexEntry,
+    load_index,
+    read_manifest,
+    record_package,
+)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def temp_data_dir():
+    """Create a temporary directory for test data."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+def package_response(members: dict[str, bytes]):
+    """Mock a streamed package download containing the given members."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    response = Mock()
+    response.status_code = 200
+    response.headers = {}
+    response.raw = io.BytesIO(buffer.getvalue())
+    response.raise_for_status = Mock()
+    return response
+
+
+MEMBERS = {
+    "a/eforms.xml": (FIXTURES_DIR / "eforms_ubl_2025.xml").read_bytes(),
+    "a/tedv2.xml": (FIXTURES_DIR / "ted_v2_r2_0_9_2024.xml").read_bytes(),
+    "a/other.xml": b"<TED_EXPORT><CODE_NOTICE CODE='3'/></TED_EXPORT>",
+}
+
+
+class TestManifestWrittenOnDownload:
+    """Tests for manifests created by download_package."""
+
+    @pytest.mark.parametrize("keep_archive", [False, True])
+    def test_manifest_describes_files(self, temp_data_dir, keep_archive):
+        """Test that the manifest lists files with size, checksum and format."""
+        with patch("requests.Session.get", return_value=package_response(MEMBERS)):
+            download_package(202400001, temp_data_dir, keep_archive=keep_archive)
+
+        manifest = read_manifest(temp_data_dir, 202400001)
+        assert manifest.storage == ("archive" if keep_archive else "extracted")
+        by_name = {f.name: f for f in manifest.files}
+        assert set(by_name) == set(MEMBERS)
+        for name, data in MEMBERS.items():
+            assert by_name[name].size == len(data)
+            assert by_name[name].sha256 == hashlib.sha256(data).hexdigest()
+        assert by_name["a/eforms.xml"].format == "eforms_ubl"
+        assert by_name["a/tedv2.xml"].format == "ted_v2"
+        assert by_name["a/other.xml"].format is None
+
+    def test_package_indexed(self, temp_data_dir):
+        """Test that a completed download is registered in the index."""
+        with patch("requests.Session.get", return_value=package_response(MEMBERS)):
+            download_package(202400001, temp_data_dir)
+
+        assert load_index(temp_data_dir).packages[202400001] == IndexEntry(
+            storage="extracted"
+        )
+        assert get_downloaded_packages(2024, temp_data_dir) == [202400001]
+
+    def test_not_found_not_indexed(self, temp_data_dir):
+        """Test that a 404 leaves no manifest and no index entry."""
+        import requests
+
+        response = Mock()
+        response.status_code = 404
+        response.raise_for_status.side_effect = requests.HTTPError(response=response)
+        with patch("requests.Session.get", return_value=response):
+            assert download_package(202400001, temp_data_dir) is False
+
+        assert read_manifest(temp_data_dir, 202400001) is None
+        assert get_downloaded_packages(2024, temp_data_dir) == []
+
+
+class TestLookupsUseManifest:
+    """Tests that lookups are answered from manifests and the index."""
+
+    def test_manifest_marks_package_complete(self, temp_data_dir):
+        """Test that a manifested package is skipped without inspecting disk."""
+        with patch("requests.Session.get", return_value=package_response(MEMBERS)):
+            download_package(202400001, temp_data_dir)
+
+        with (
+            patch("requests.Session.get") as mock_get,
+            patch.object(Path, "glob") as mock_glob,
+        ):
+            assert download_package(202400001, temp_data_dir) is True
+            mock_get.assert_not_called()
+            mock_glob.assert_not_called()
+
+    def test_package_files_from_manifest(self, temp_data_dir):
+        """Test that get_package_files lists files without globbing."""
+        with patch("requests.Session.get", return_value=package_response(MEMBERS)):
+            download_package(202400001, temp_data_dir)
+
+        with patch.object(Path, "glob") as mock_glob:
+            files = get_package_files(202400001, temp_data_dir)
+            mock_glob.assert_not_called()
+
+        assert sorted(files) == sorted(temp_data_dir / "202400001" / n for n in MEMBERS)
+
+    def test_downloaded_packages_from_index(self, temp_data_dir):
+        """Test that listing packages reads the index, not the directory."""
+        record_package(temp_data_dir, 202400002, IndexEntry(storage="archive"))
+        record_package(temp_data_dir, 202400001, IndexEntry(storage="extracted"))
+        record_package(temp_data_dir, 202300001, IndexEntry(storage="extracted"))
+
+        with patch.object(Path, "iterdir") as mock_iterdir:
+            assert get_downloaded_packages(2024, temp_data_dir) == [
+                202400001,
+                202400002,
+            ]
+            mock_iterdir.assert_not_called()
+
+
+class TestIndexJournal:
+    """Tests for recording packages through the index journal."""
+
+    def test_record_does_not_rewrite_index(self, temp_data_dir):
+        """Test that recording a package only appends to the journal."""
+        load_index(temp_data_dir)
+        index_bytes = (temp_data_dir / INDEX_FILE).read_bytes()
+
+        for issue in range(1, 4):
+            record_package(
+                temp_data_dir, 202400000 + issue, IndexEntry(storage="archive")
+            )
+
+        assert (temp_data_dir / INDEX_FILE).read_bytes() == index_bytes
+        assert len((temp_data_dir / JOURNAL_FILE).read_text().splitlines()) == 3
+        assert get_downloaded_packages(2024, temp_data_dir) == [
+            202400001,
+            202400002,
+            202400003,
+        ]
+
+    def test_journal_compacted_on_load(self, temp_data_dir):
+        """Test that a new process folds the journal into the index."""
+        record_package(temp_data_dir, 202400001, IndexEntry(storage="archive"))
+        record_package(temp_data_dir, 202400001, IndexEntry(storage="extracted"))
+        manifest._index_cache.clear()
+
+        index = load_index(temp_data_dir)
+
+        assert index.packages == {202400001: IndexEntry(storage="extracted")}
+        assert not (temp_data_dir / JOURNAL_FILE).exists()
+        assert b"202400001" in (temp_data_dir / INDEX_FILE).read_bytes()
+
+    def test_records_of_other_processes_picked_up(self, temp_data_dir):
+        """Test that journal records appended elsewhere reach the cached index."""
+        load_index(temp_data_dir)
+        with open(temp_data_dir / JOURNAL_FILE, "a") as f:
+            f.write('{"package": 202400001, "storage": "archive", "manifest": true}\n')
+            # Still being written
+            f.write('{"package": 202400002, "sto')
+
+        assert list(load_index(temp_data_dir).packages) == [202400001]
+
+
+class TestLegacyPackages:
+    """Tests for packages downloaded before manifests existed."""
+
+    def test_index_created_from_existing_packages(self, temp_data_dir):
+        """Test that the first index picks up existing packages once."""
+        (temp_data_dir / "202400001").mkdir()
+        (temp_data_dir / "202400002.tar.gz").write_bytes(b"")
+        (temp_data_dir / "202400003.partial").mkdir()
+        (temp_data_dir / "notes").mkdir()
+
+        index = load_index(temp_data_dir)
+
+        assert (temp_data_dir / INDEX_FILE).exists()
+        assert index.packages == {
+            202400001: IndexEntry(storage="extracted", manifest=False),
+            202400002: IndexEntry(storage="archive", manifest=False),
+        }
+
+    def test_legacy_package_without_files_downloaded_again(self, temp_data_dir):
+        """Test that an empty legacy directory does not count as downloaded."""
+        (temp_data_dir / "202400001").mkdir()
+        load_index(temp_data_dir)
+
+        with patch(
+            "requests.Session.get", return_value=package_response(MEMBERS)
+        ) as mock_get:
+            assert download_package(202400001, temp_data_dir) is True
+            mock_get.assert_called_once()
+
+        assert load_index(temp_data_dir).packages[202400001].manifest is True
+
+
+class TestAwardsOnly:
+    """Tests for downloads that only store award notices."""
+
+    def test_only_award_notices_stored(self, temp_data_dir):
+        """Test that other notices are dropped and listed in the manifest."""
+        with patch("requests.Session.get", return_value=package_response(MEMBERS)):
+            download_package(202400001, temp_data_dir, awards_only=True)
+
+        package_dir = temp_data_dir / "202400001"
+        stored = sorted(
+            f.relative_to(package_dir).as_posix()
+            for f in package_dir.glob("**/*")
+            if f.is_file()
+        )
+        assert stored == ["a/eforms.xml", "a/tedv2.xml"]
+
+        manifest = read_manifest(temp_data_dir, 202400001)
+        assert manifest.awards_only is True
+        assert manifest.skipped == ["other"]
+        assert sorted(get_package_files(202400001, temp_data_dir)) == [
+            package_dir / "a/eforms.xml",
+            package_dir / "a/tedv2.xml",
+        ]
+
+    def test_not_combinable_with_keep_archive(self, temp_data_dir):
+        with pytest.raises(ValueError):
+            download_package(
+                202400001, temp_data_dir, keep_archive=True, awards_only=True
+            )
@@ -0,0 +1,122 @@
+"""
+Tests for portals/ted/pipeline.py — overlapping download, parse and import.
+"""
+
+import tempfile
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from awards.portals.ted import run_pipeline
+from awards.portals.ted.manifest import IndexEntry, record_package
+
+
+@pytest.fixture
+def temp_data_dir():
+    """Create a temporary directory for test data."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest.fixture(autouse=True)
+def no_schema():
+    """Skip table creation; the writer is faked in these tests."""
+    with patch("awards.portals.ted.pipeline.Base.metadata.create_all"):
+        yield
+
+
+def fake_parse(package_number, data_dir, executor, quality=None):
+    """Two files per package: one award notice and one other notice."""
+    return iter([[f"{package_number}-a"], None])
+
+
+class FakeWriter:
+    """Stands in for save_package, recording what reached the writer."""
+
+    def __init__(self, on_save=None):
+        self.saved = {}
+        self.on_save = on_save
+
+    def __call__(self, package_number, parsed):
+        awards = [a for batch in parsed if batch for a in batch]
+        self.saved[package_number] = awards
+        if self.on_save:
+            self.on_save(package_number)
+        return len(awards)
+
+
+def run(temp_data_dir, download_year, writer, **kwargs):
+    with (
+        patch(
+            "awards.portals.ted.pipeline.iter_download_year",
+            side_effect=download_year,
+        ),
+        patch("awards.portals.ted.pipeline.parse_package", side_effect=fake_parse),
+        patch("awards.portals.ted.pipeline.save_package", side_effect=writer),
+    ):
+        return run_pipeline(2023, 2024, temp_data_dir, **kwargs)
+
+
+class TestRunPipeline:
+    """Tests for run_pipeline."""
+
+    def test_imports_existing_and_new_packages(self, temp_data_dir):
+        """Test that every package is imported once, grouped by package."""
+        record_package(temp_data_dir, 202300001, IndexEntry(storage="extracted"))
+
+        def download_year(year, **kwargs):
+            # Already downloaded packages may be reported again
+            yield from [202300001, 202300002] if year == 2023 else [202400001]
+
+        writer = FakeWriter()
+        imported = run(temp_data_dir, download_year, writer)
+
+        assert imported == 3
+        assert writer.saved == {
+            202300001: ["202300001-a"],
+            202300002: ["202300002-a"],
+            202400001: ["202400001-a"],
+        }
+
+    def test_import_overlaps_download(self, temp_data_dir):
+        """Test that a package is imported while later ones still download."""
+        first_imported = threading.Event()
+
+        def download_year(year, **kwargs):
+            if year == 2023:
+                yield 202300001
+                # Blocks forever in a download-then-import implementation
+                assert first_imported.wait(timeout=5)
+                yield 202300002
+
+        writer = FakeWriter(on_save=lambda package: first_imported.set())
+        run(temp_data_dir, download_year, writer)
+
+        assert set(writer.saved) == {202300001, 202300002}
+
+    def test_download_error_raised(self, temp_data_dir):
+        """Test that a failing download stage stops the run with its error."""
+
+        def download_year(year, **kwargs):
+            yield 202300001
+            raise RuntimeError("network down")
+
+        with pytest.raises(RuntimeError, match="network down"):
+            run(temp_data_dir, download_year, FakeWriter())
+
+    def test_writer_error_stops_producers(self, temp_data_dir):
+        """Test that a failing writer stops the download and parse stages."""
+
+        def download_year(year, **kwargs):
+            issue = 0
+            while True:
+                issue += 1
+                yield year * 100000 + issue
+
+        def writer(package_number, parsed):
+            raise RuntimeError("database went away")
+
+        with pytest.raises(RuntimeError, match="database went away"):
+            run(temp_data_dir, download_year, writer, document_queue_size=1)
@@ -9,20 +9,22 @@ The unified TED 2.0 parser handles multiple format variants:
 These tests validate:
 1. Document parsing (parse_xml_file)
 2. Data extraction (document, buyer, contract, awards, contractors)
-3. Data validation using Pydantic models
+3. Data validation against the Pydantic models
 """
 
 import pytest
+from lxml import etree
 from pathlib import Path
 from datetime import date
 
 from awards.parsers import ted_v2
-from awards.schema import (
-    AwardDataModel,
-    DocumentModel,
-    OrganizationModel,
-    ContractModel,
-    AwardModel,
+from awards.records import (
+    AwardDataRecord,
+    DocumentRecord,
+    OrganizationRecord,
+    ContractRecord,
+    AwardRecord,
+    validate_award_data,
 )
 
 
@@ -60,11 +62,12 @@ class TestTedV2R207Parser:
 
         # Validate award data
         award_data = result[0]
-        assert isinstance(award_data, AwardDataModel)
+        assert isinstance(award_data, AwardDataRecord)
+        validate_award_data(award_data)
 
         # Validate document
         document = award_data.document
-        assert isinstance(document, DocumentModel)
+        assert isinstance(document, DocumentRecord)
         assert document.doc_id, f"Document ID should be present in {fixture_name}"
         assert document.publication_date is not None, (
             f"Publication date should be present in {fixture_name}"
@@ -74,13 +77,13 @@ class TestTedV2R207Parser:
 
         # Validate buyer
         buyer = award_data.buyer
-        assert isinstance(buyer, OrganizationModel)
+        assert isinstance(buyer, OrganizationRecord)
         assert buyer.official_name, f"Buyer name should be present in {fixture_name}"
         assert buyer.country_code, f"Country code should be present in {fixture_name}"
 
         # Validate contract
         contract = award_data.contract
-        assert isinstance(contract, ContractModel)
+        assert isinstance(contract, ContractRecord)
         assert contract.title, f"Contract title should be present in {fixture_name}"
 
         # Validate awards
@@ -88,12 +91,12 @@ class TestTedV2R207Parser:
             f"Should have at least one award in {fixture_name}"
         )
         award = award_data.awards[0]
-        assert isinstance(award, AwardModel)
+        assert isinstance(award, AwardRecord)
 
         # Validate contractors if present
         if award.contractors:
             for contractor in award.contractors:
-                assert isinstance(contractor, OrganizationModel)
+                assert isinstance(contractor, OrganizationRecord)
                 assert contractor.official_name, (
                     f"Contractor name should be present in {fixture_name}"
                 )
@@ -160,11 +163,12 @@ class TestTedV2R208Parser:
 
         # Validate award data
         award_data = result[0]
-        assert isinstance(award_data, AwardDataModel)
+        assert isinstance(award_data, AwardDataRecord)
+        validate_award_data(award_data)
 
         # Validate document
         document = award_data.document
-        assert isinstance(document, DocumentModel)
+        assert isinstance(document, DocumentRecord)
         assert document.doc_id, f"Document ID should be present in {fixture_name}"
         assert document.publication_date is not None, (
             f"Publication date should be present in {fixture_name}"
@@ -174,13 +178,13 @@ class TestTedV2R208Parser:
 
         # Validate buyer
         buyer = award_data.buyer
-        assert isinstance(buyer, OrganizationModel)
+        assert isinstance(buyer, OrganizationRecord)
         assert buyer.official_name, f"Buyer name should be present in {fixture_name}"
         assert buyer.country_code, f"Country code should be present in {fixture_name}"
 
         # Validate contract
         contract = award_data.contract
-        assert isinstance(contract, ContractModel)
+        assert isinstance(contract, ContractRecord)
         assert contract.title, f"Contract title should be present in {fixture_name}"
 
         # Validate awards
@@ -188,12 +192,12 @@ class TestTedV2R208Parser:
             f"Should have at least one award in {fixture_name}"
         )
         award = award_data.awards[0]
-        assert isinstance(award, AwardModel)
+        assert isinstance(award, AwardRecord)
 
         # Validate contractors if present
         if award.contractors:
             for contractor in award.contractors:
-                assert isinstance(contractor, OrganizationModel)
+                assert isinstance(contractor, OrganizationRecord)
                 assert contractor.official_name, (
                     f"Contractor name should be present in {fixture_name}"
                 )
@@ -249,11 +253,12 @@ class TestTedV2R209Parser:
 
         # Validate award data
         award_data = result[0]
-        assert isinstance(award_data, AwardDataModel)
+        assert isinstance(award_data, AwardDataRecord)
+        validate_award_data(award_data)
 
         # Validate document
         document = award_data.document
-        assert isinstance(document, DocumentModel)
+        assert isinstance(document, DocumentRecord)
         assert document.doc_id == "002670-2024", "Document ID should match fixture"
         assert document.publication_date is not None, (
             "Publication date should be present"
@@ -266,7 +271,7 @@ class TestTedV2R209Parser:
 
         # Validate buyer
         buyer = award_data.buyer
-        assert isinstance(buyer, OrganizationModel)
+        assert isinstance(buyer, OrganizationRecord)
         assert buyer.official_name, "Buyer name should be present"
         assert "Medizinische Universität Innsbruck" in buyer.official_name
         assert buyer.country_code == "AT", "Country code should be Austria"
@@ -282,7 +287,7 @@ class TestTedV2R209Parser:
 
         # Validate contract
         contract = award_data.contract
-        assert isinstance(contract, ContractModel)
+        assert isinstance(contract, ContractRecord)
         assert contract.title, "Contract title should be present"
         assert "Pipettierroboter" in contract.title, (
             "Title should mention Pipettierroboter"
@@ -305,7 +310,7 @@ class TestTedV2R209Parser:
         # Validate awards
         assert len(award_data.awards) > 0, "Should have at least one award"
         award = award_data.awards[0]
-        assert isinstance(award, AwardModel)
+        assert isinstance(award, AwardRecord)
         assert award.awarded_value is not None, "Award value should be present"
         assert award.awarded_value == 388481.50, "Award value should match"
         assert award.awarded_value_currency == "EUR", "Currency should be EUR"
@@ -314,7 +319,7 @@ class TestTedV2R209Parser:
         # Validate contractors
         assert len(award.contractors) > 0, "Should have at least one contractor"
         contractor = award.contractors[0]
-        assert isinstance(contractor, OrganizationModel)
+        assert isinstance(contractor, OrganizationRecord)
         assert contractor.official_name, "Contractor name should be present"
         assert "Hamilton Germany" in contractor.official_name, (
             "Contractor should be Hamilton Germany"
@@ -335,11 +340,12 @@ class TestTedV2R209Parser:
 
         # Validate award data
         award_data = result[0]
-        assert isinstance(award_data, AwardDataModel)
+        assert isinstance(award_data, AwardDataRecord)
+        validate_award_data(award_data)
 
         # Validate document
         document = award_data.document
-        assert isinstance(document, DocumentModel)
+        assert isinstance(document, DocumentRecord)
         assert document.doc_id, f"Document ID should be present in {fixture_name}"
         assert document.publication_date is not None, (
             f"Publication date should be present in {fixture_name}"
@@ -353,12 +359,12 @@ class TestTedV2R209Parser:
 
         # Validate buyer
         buyer = award_data.buyer
-        assert isinstance(buyer, OrganizationModel)
+        assert isinstance(buyer, OrganizationRecord)
         assert buyer.official_name, f"Buyer name should be present in {fixture_name}"
 
         # Validate contract
         contract = award_data.contract
-        assert isinstance(contract, ContractModel)
+        assert isinstance(contract, ContractRecord)
         assert contract.title, f"Contract title should be present in {fixture_name}"
 
         # Validate awards
@@ -366,7 +372,7 @@ class TestTedV2R209Parser:
             f"Should have at least one award in {fixture_name}"
         )
         award = award_data.awards[0]
-        assert isinstance(award, AwardModel)
+        assert isinstance(award, AwardRecord)
 
 
 class TestNewFields:
@@ -514,5 +520,97 @@ class TestDataValidation:
                     assert len(contractor.official_name.strip()) > 0
 
 
+class TestVariantDetection:
+    """Tests for detecting the TED 2.0 variant from the file header."""
+
+    @pytest.mark.parametrize(
+        "fixture_name,variant",
+        [
+            ("ted_v2_r2_0_8_2015.xml", "R2.0.8"),
+            ("ted_v2_r2_0_9_2024.xml", "R2.0.9"),
+        ],
+    )
+    def test_variant_from_header(self, fixture_name, variant):
+        header = (FIXTURES_DIR / fixture_name).read_bytes()[:3000]
+        assert ted_v2._detect_variant_from_header(header) == variant
+
+    def test_header_without_version_falls_back_to_structure(self):
+        """Test that R2.0.7 notices without a versioned schema use the form."""
+        data = (FIXTURES_DIR / "ted_v2_r2_0_7_2011.xml").read_bytes()
+        assert ted_v2._detect_variant_from_header(data[:3000]) is None
+
+        result = ted_v2.parse_xml_bytes(data, "ted_v2_r2_0_7_2011.xml")
+        assert result[0].document.version == "R2.0.7/R2.0.8"
+
+    def test_root_tag_outside_header(self):
+        assert ted_v2._detect_variant_from_header(b"<?xml version='1.0'?>") is None
+
+    @pytest.mark.parametrize(
+        "fixture_name",
+        TED_V2_R207_FIXTURES + TED_V2_R208_FIXTURES + TED_V2_R209_FIXTURES,
+    )
+    def test_bytes_and_file_agree(self, fixture_name):
+        """Test that header-based detection matches the tree-based one."""
+        fixture_file = FIXTURES_DIR / fixture_name
+        from_file = ted_v2.parse_xml_file(fixture_file)
+        from_bytes = ted_v2.parse_xml_bytes(fixture_file.read_bytes(), fixture_name)
+        assert from_bytes == from_file
+
+
+class TestStreamingParse:
+    """Tests for incremental parsing of very large notices."""
+
+    @pytest.mark.parametrize(
+        "fixture_name",
+        TED_V2_R207_FIXTURES + TED_V2_R208_FIXTURES + TED_V2_R209_FIXTURES,
+    )
+    def test_same_result_as_tree_parse(self, fixture_name, monkeypatch):
+        fixture_file = FIXTURES_DIR / fixture_name
+        expected = ted_v2.parse_xml_file(fixture_file)
+
+        monkeypatch.setattr(ted_v2, "STREAMING_THRESHOLD", 0)
+        assert ted_v2.parse_xml_file(fixture_file) == expected
+        assert (
+            ted_v2.parse_xml_bytes(fixture_file.read_bytes(), fixture_name) == expected
+        )
+
+    @pytest.mark.parametrize(
+        "fixture_name, tag, extractor",
+        [
+            ("ted_v2_r2_0_9_2024.xml", b"AWARD_CONTRACT", "_extract_award_r209"),
+            ("ted_v2_r2_0_8_2015.xml", b"AWARD_OF_CONTRACT", "_extract_award_r207"),
+        ],
+    )
+    def test_awards_dropped_as_they_stream(
+        self, fixture_name, tag, extractor, monkeypatch
+    ):
+        """Test that a notice with many awards never sits in memory whole."""
+        data = (FIXTURES_DIR / fixture_name).read_bytes()
+        start = data.index(b"<" + tag)
+        end = data.index(b"</" + tag + b">") + len(tag) + 3
+        lots = 2000
+        notice = data[:end] + data[start:end] * (lots - 1) + data[end:]
+        assert len(notice) >= ted_v2.STREAMING_THRESHOLD
+
+        tree_sizes = []
+        extract = getattr(ted_v2, extractor)
+
+        def measured_extract(award_elem, *args, **kwargs):
+            tree_sizes.append(sum(1 for _ in award_elem.getroottree().iter()))
+            return extract(award_elem, *args, **kwargs)
+
+        monkeypatch.setattr(ted_v2, extractor, measured_extract)
+        streamed = ted_v2.parse_xml_bytes(notice, fixture_name)
+        monkeypatch.setattr(ted_v2, extractor, extract)
+
+        assert len(tree_sizes) == lots
+        # Bounded by the parser's read-ahead, not by the number of awards
+        full_size = sum(1 for _ in etree.fromstring(notice).iter())
+        assert max(tree_sizes) * 10 < full_size
+
+        monkeypatch.setattr(ted_v2, "STREAMING_THRESHOLD", len(notice) + 1)
+        assert streamed == ted_v2.parse_xml_bytes(notice, fixture_name)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,54 @@
+"""
+Tests for countries.py — static country table and code normalization.
+"""
+
+from awards.countries import COUNTRY_NAMES, get_country_name, normalize_country_code
+
+
+class TestNormalizeCountryCode:
+    """Tests for normalize_country_code."""
+
+    def test_uk_maps_to_gb(self):
+        assert normalize_country_code("UK") == "GB"
+
+    def test_uk_lowercase_maps_to_gb(self):
+        assert normalize_country_code("uk") == "GB"
+
+    def test_1a_maps_to_none(self):
+        assert normalize_country_code("1A") is None
+
+    def test_empty_string_maps_to_none(self):
+        assert normalize_country_code("") is None
+
+    def test_none_maps_to_none(self):
+        assert normalize_country_code(None) is None
+
+    def test_normal_code_uppercased(self):
+        assert normalize_country_code("de") == "DE"
+
+    def test_normal_code_preserved(self):
+        assert normalize_country_code("FR") == "FR"
+
+    def test_mixed_case_alias(self):
+        assert normalize_country_code("Uk") == "GB"
+
+    def test_unknown_code_uppercased(self):
+        assert normalize_country_code("xk") == "XK"
+
+
+class TestGetCountryName:
+    """Tests for get_country_name."""
+
+    def test_iso_code(self):
+        assert get_country_name("DE") == "Germany"
+
+    def test_historical_code(self):
+        assert get_country_name("AN") == "Netherlands Antilles"
+
+    def test_unknown_code(self):
+        assert get_country_name("XK") is None
+
+    def test_table_covers_normalized_codes(self):
+        """Test that every code normalize_country_code produces has a name."""
+        for code in COUNTRY_NAMES:
+            assert get_country_name(normalize_country_code(code.lower())) is not None
@@ -13,7 +13,8 @@ from sqlalchemy.orm import sessionmaker
 from awards.db import (
     save_document,
     get_session,
-    _normalize_country_code,
+    get_sync_state,
+    save_sync_state,
 )
 from awards.models import (
     Base,
@@ -729,31 +730,6 @@ class TestGetSession:
             verify_session.close()
 
 
-class TestNormalizeCountryCode:
-    """Tests for _normalize_country_code function."""
-
-    def test_uk_maps_to_gb(self):
-        assert _normalize_country_code("UK") == "GB"
-
-    def test_uk_lowercase_maps_to_gb(self):
-        assert _normalize_country_code("uk") == "GB"
-
-    def test_1a_maps_to_none(self):
-        assert _normalize_country_code("1A") is None
-
-    def test_empty_string_maps_to_none(self):
-        assert _normalize_country_code("") is None
-
-    def test_none_maps_to_none(self):
-        assert _normalize_country_code(None) is None
-
-    def test_normal_code_uppercased(self):
-        assert _normalize_country_code("de") == "DE"
-
-    def test_normal_code_preserved(self):
-        assert _normalize_country_code("FR") == "FR"
-
-
 class TestCountryLookupTable:
     """Tests for country lookup table integration."""
 
@@ -1142,3 +1118,19 @@ class TestOrganizationIdentifiers:
             assert len(org_ids) == 1
         finally:
             session.close()
+
+
+class TestSyncState:
+    """Tests for the sync watermarks."""
+
+    def test_missing_state(self, test_db):
+        assert get_sync_state("ted") == (None, None)
+
+    def test_watermarks_updated_independently(self, test_db):
+        """Test that saving one watermark leaves the other unchanged."""
+        save_sync_state("ted", last_downloaded=202400010)
+        save_sync_state("ted", last_imported=202400005)
+        assert get_sync_state("ted") == (202400010, 202400005)
+
+        save_sync_state("ted", last_imported=202400010)
+        assert get_sync_state("ted") == (202400010, 202400010)
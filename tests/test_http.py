@@ -0,0 +1,233 @@
+"""
+Tests for http.py — shared pooled, retrying HTTP session and the
+conditional-request cache.
+
+Runs against a local stand-in server so retry and keep-alive behavior is
+exercised end-to-end through requests/urllib3.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from awards.http import (
+    RETRY_STATUSES,
+    build_retry,
+    build_session,
+    fetch_cached,
+    get_http_session,
+)
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serves a scripted sequence of (status, headers) responses."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, self.client_address))
+        status, headers = server.script.pop(0) if server.script else (200, {})
+        body = b"ok" if status == 200 else b"error"
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ConditionalHandler(BaseHTTPRequestHandler):
+    """Serves server.body with validators, answering 304 when unchanged."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append(dict(self.headers))
+        if server.etag is not None:
+            unchanged = self.headers.get("If-None-Match") == server.etag
+        else:
+            since = self.headers.get("If-Modified-Since")
+            unchanged = since is not None and since == server.last_modified
+        if unchanged:
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        if server.etag:
+            self.send_header("ETag", server.etag)
+        if server.last_modified:
+            self.send_header("Last-Modified", server.last_modified)
+        self.send_header("Content-Length", str(len(server.body)))
+        self.end_headers()
+        self.wfile.write(server.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Start a local stand-in HTTP server on a free port."""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    httpd.script = []
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def conditional_server():
+    """Start a local server that supports conditional requests."""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), ConditionalHandler)
+    httpd.body = b"v1"
+    httpd.etag = '"v1"'
+    httpd.last_modified = None
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def session():
+    """Session with the production retry policy minus the backoff delay."""
+    s = build_session(retry=build_retry(backoff_factor=0, backoff_jitter=0))
+    yield s
+    s.close()
+
+
+class TestRetries:
+    """Tests for transient failure retries."""
+
+    @pytest.mark.parametrize("status", sorted(RETRY_STATUSES))
+    def test_retries_transient_status(self, server, session, status):
+        """Test that 429/5xx responses are retried until success."""
+        server.script = [(status, {}), (status, {}), (200, {})]
+
+        response = session.get(f"{server.url}/pkg", timeout=5)
+
+        assert response.status_code == 200
+        assert len(server.requests) == 3
+
+    def test_honors_retry_after(self, server, session):
+        """Test that a Retry-After header is accepted and the request retried."""
+        server.script = [(503, {"Retry-After": "0"}), (200, {})]
+
+        response = session.get(f"{server.url}/pkg", timeout=5)
+
+        assert response.status_code == 200
+        assert len(server.requests) == 2
+
+    def test_404_not_retried(self, server, session):
+        """Test that a 404 is returned immediately (it means 'no such package')."""
+        server.script = [(404, {})]
+
+        response = session.get(f"{server.url}/pkg", timeout=5)
+
+        assert response.status_code == 404
+        assert len(server.requests) == 1
+
+    def test_gives_up_with_last_response(self, server):
+        """Test that exhausted retries surface the last error response."""
+        s = build_session(
+            retry=build_retry(attempts=2, backoff_factor=0, backoff_jitter=0)
+        )
+        server.script = [(503, {})] * 5
+
+        response = s.get(f"{server.url}/pkg", timeout=5)
+        s.close()
+
+        assert response.status_code == 503
+        assert len(server.requests) == 3
+
+
+class TestConnectionReuse:
+    """Tests for keep-alive connection pooling."""
+
+    def test_connection_reused(self, server, session):
+        """Test that consecutive requests share one TCP connection."""
+        for _ in range(3):
+            assert session.get(f"{server.url}/pkg", timeout=5).status_code == 200
+
+        client_ports = {addr[1] for _, addr in server.requests}
+        assert len(client_ports) == 1
+
+
+class TestSharedSession:
+    """Tests for the process-wide session."""
+
+    def test_same_instance_returned(self):
+        assert get_http_session() is get_http_session()
+
+
+class TestConditionalCache:
+    """Tests for fetch_cached revalidation."""
+
+    def test_unchanged_served_from_cache(self, conditional_server, tmp_path):
+        """Test that a 304 returns the cached body."""
+        url = f"{conditional_server.url}/rates"
+
+        assert fetch_cached(url, cache_dir=tmp_path) == b"v1"
+        assert fetch_cached(url, cache_dir=tmp_path) == b"v1"
+
+        first, second = conditional_server.requests
+        assert "If-None-Match" not in first
+        assert second["If-None-Match"] == '"v1"'
+
+    def test_changed_content_refetched(self, conditional_server, tmp_path):
+        """Test that a changed resource replaces the cached copy."""
+        url = f"{conditional_server.url}/rates"
+        fetch_cached(url, cache_dir=tmp_path)
+
+        conditional_server.body, conditional_server.etag = b"v2", '"v2"'
+
+        assert fetch_cached(url, cache_dir=tmp_path) == b"v2"
+        assert fetch_cached(url, cache_dir=tmp_path) == b"v2"
+        assert conditional_server.requests[-1]["If-None-Match"] == '"v2"'
+
+    def test_last_modified_validator(self, conditional_server, tmp_path):
+        """Test revalidation with If-Modified-Since when there is no ETag."""
+        conditional_server.etag = None
+        conditional_server.last_modified = "Wed, 01 Jan 2025 00:00:00 GMT"
+        url = f"{conditional_server.url}/rates"
+
+        fetch_cached(url, cache_dir=tmp_path)
+        assert fetch_cached(url, cache_dir=tmp_path) == b"v1"
+        assert (
+            conditional_server.requests[-1]["If-Modified-Since"]
+            == "Wed, 01 Jan 2025 00:00:00 GMT"
+        )
+
+    def test_not_cached_without_validators(self, conditional_server, tmp_path):
+        """Test that responses without validators are always re-fetched."""
+        conditional_server.etag = None
+        url = f"{conditional_server.url}/rates"
+
+        fetch_cached(url, cache_dir=tmp_path)
+        fetch_cached(url, cache_dir=tmp_path)
+
+        assert all("If-None-Match" not in r for r in conditional_server.requests)
+        assert not tmp_path.exists() or not any(tmp_path.iterdir())
+
+    def test_headers_part_of_cache_key(self, conditional_server, tmp_path):
+        """Test that different request headers are cached separately."""
+        url = f"{conditional_server.url}/rates"
+        fetch_cached(url, cache_dir=tmp_path)
+
+        fetch_cached(url, headers={"Accept": "text/csv"}, cache_dir=tmp_path)
+
+        assert "If-None-Match" not in conditional_server.requests[-1]
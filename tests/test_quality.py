@@ -0,0 +1,94 @@
+"""
+Tests for quality.py — aggregated data-quality counters.
+"""
+
+import pickle
+import threading
+
+from awards import quality
+from awards.parsers.codes import normalize_procedure_type
+from awards.quality import MAX_SAMPLES, QualityReport
+
+
+class TestQualityReport:
+    """Tests for QualityReport."""
+
+    def test_counts_and_samples(self):
+        """Test that events are counted per key with distinct samples."""
+        report = QualityReport()
+        for value in ["a", "b", "a"]:
+            report.add(quality.UNKNOWN_CODE, "procedure_type", value)
+
+        assert report.counts == {(quality.UNKNOWN_CODE, "procedure_type"): 3}
+        assert report.samples[(quality.UNKNOWN_CODE, "procedure_type")] == ["a", "b"]
+
+    def test_samples_capped(self):
+        report = QualityReport()
+        for i in range(MAX_SAMPLES + 3):
+            report.add(quality.INVALID_INTEGER, "tenders_received", i)
+
+        key = (quality.INVALID_INTEGER, "tenders_received")
+        assert report.counts[key] == MAX_SAMPLES + 3
+        assert len(report.samples[key]) == MAX_SAMPLES
+
+    def test_merge(self):
+        """Test that merging adds counts and keeps samples distinct and capped."""
+        first, second = QualityReport(), QualityReport()
+        first.add(quality.UNKNOWN_CODE, "authority_type", "X")
+        second.add(quality.UNKNOWN_CODE, "authority_type", "X")
+        second.add(quality.UNKNOWN_CODE, "authority_type", "Y")
+        second.add(quality.INVALID_INTEGER, "tenders_received", "n/a")
+
+        first.merge(second)
+
+        assert first.counts == {
+            (quality.UNKNOWN_CODE, "authority_type"): 3,
+            (quality.INVALID_INTEGER, "tenders_received"): 1,
+        }
+        assert first.samples[(quality.UNKNOWN_CODE, "authority_type")] == ["X", "Y"]
+
+    def test_summary_most_frequent_first(self):
+        report = QualityReport()
+        report.add(quality.UNKNOWN_CODE, "authority_type", "X")
+        report.add(quality.INVALID_INTEGER, "tenders_received", "n/a")
+        report.add(quality.INVALID_INTEGER, "tenders_received", "n/a")
+
+        assert report.summary() == [
+            "invalid_integer tenders_received: 2 (e.g. 'n/a')",
+            "unknown_code authority_type: 1 (e.g. 'X')",
+        ]
+
+    def test_pickle_round_trip(self):
+        """Test that reports survive transfer from worker processes."""
+        report = QualityReport()
+        report.add(quality.UNKNOWN_CODE, "procedure_type", "Q")
+        assert pickle.loads(pickle.dumps(report)) == report
+
+
+class TestCollect:
+    """Tests for record() and collect()."""
+
+    def test_parser_events_collected(self):
+        """Test that parser events land in the collecting report."""
+        with quality.collect() as report:
+            assert normalize_procedure_type("bogus", None) == (None, False)
+
+        assert report.counts == {(quality.UNKNOWN_CODE, "procedure_type"): 1}
+
+    def test_dropped_outside_collect(self):
+        with quality.collect() as report:
+            pass
+        quality.record(quality.UNKNOWN_CODE, "procedure_type", "bogus")
+        assert not report
+
+    def test_collect_per_thread(self):
+        """Test that events of other threads are not collected."""
+        with quality.collect() as report:
+            thread = threading.Thread(
+                target=quality.record,
+                args=(quality.UNKNOWN_CODE, "procedure_type", "bogus"),
+            )
+            thread.start()
+            thread.join()
+
+        assert not report
@@ -1,5 +1,6 @@
 """Tests for rates.py — ECB exchange rates and Eurostat HICP fetching/saving."""
 
+import json
 import pytest
 from datetime import date
 from decimal import Decimal
@@ -59,6 +60,23 @@ EUROSTAT_JSON = {
 }
 
 
+def mock_response(body: bytes):
+    """Mock a 200 response without cache validators."""
+    mock_resp = Mock()
+    mock_resp.status_code = 200
+    mock_resp.headers = {}
+    mock_resp.content = body
+    mock_resp.raise_for_status = Mock()
+    return mock_resp
+
+
+@pytest.fixture(autouse=True)
+def http_cache_dir(tmp_path):
+    """Keep the HTTP cache out of the real data directory."""
+    with patch("awards.http.CACHE_DIR", tmp_path / "http-cache"):
+        yield
+
+
 @pytest.fixture
 def test_db():
     """Create a PostgreSQL test database with fresh tables for each test."""
@@ -84,11 +102,9 @@ class TestFetchEcbRates:
     """Tests for fetch_ecb_rates with mocked HTTP."""
 
     def test_parses_csv_response(self):
-        mock_resp = Mock()
-        mock_resp.text = ECB_CSV
-        mock_resp.raise_for_status = Mock()
+        mock_resp = mock_response(ECB_CSV.encode())
 
-        with patch("awards.rates.requests.get", return_value=mock_resp):
+        with patch("requests.Session.get", return_value=mock_resp):
             rows = fetch_ecb_rates(["GBP", "SEK"], 2024, 2024)
 
         assert len(rows) == 4
@@ -105,11 +121,9 @@ class TestFetchHicp:
     """Tests for fetch_hicp with mocked HTTP."""
 
     def test_parses_json_stat_response(self):
-        mock_resp = Mock()
-        mock_resp.json.return_value = EUROSTAT_JSON
-        mock_resp.raise_for_status = Mock()
+        mock_resp = mock_response(json.dumps(EUROSTAT_JSON).encode())
 
-        with patch("awards.rates.requests.get", return_value=mock_resp):
+        with patch("requests.Session.get", return_value=mock_resp):
             rows = fetch_hicp(2022, 2024)
 
         assert len(rows) == 3
@@ -259,20 +273,15 @@ class TestUpdateRates:
         finally:
             session.close()
 
-        mock_ecb = Mock()
-        mock_ecb.text = ECB_CSV
-        mock_ecb.raise_for_status = Mock()
-
-        mock_hicp = Mock()
-        mock_hicp.json.return_value = EUROSTAT_JSON
-        mock_hicp.raise_for_status = Mock()
+        mock_ecb = mock_response(ECB_CSV.encode())
+        mock_hicp = mock_response(json.dumps(EUROSTAT_JSON).encode())
 
         def route_get(url, **kwargs):
             if "ecb.europa.eu" in url:
                 return mock_ecb
             return mock_hicp
 
-        with patch("awards.rates.requests.get", side_effect=route_get):
+        with patch("requests.Session.get", side_effect=route_get):
             update_rates(2024, 2024)
 
         session = SessionLocal()
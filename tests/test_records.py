@@ -0,0 +1,79 @@
+"""
+Tests for records.py — parsed award records and their schema validation.
+"""
+
+import pickle
+from datetime import date
+
+import pytest
+from pydantic import ValidationError
+
+from awards.records import (
+    AuthorityTypeRecord,
+    AwardDataRecord,
+    AwardRecord,
+    ContractRecord,
+    CpvCodeRecord,
+    DocumentRecord,
+    IdentifierRecord,
+    OrganizationRecord,
+    validate_award_data,
+)
+from awards.schema import AwardDataModel
+
+
+def make_record(**contract_fields) -> AwardDataRecord:
+    return AwardDataRecord(
+        document=DocumentRecord(
+            doc_id="123456-2024",
+            publication_date=date(2024, 3, 1),
+            buyer_authority_type=AuthorityTypeRecord(code="3", description="Local"),
+        ),
+        buyer=OrganizationRecord(
+            official_name="City of Example",
+            country_code="NL",
+            identifiers=[IdentifierRecord(scheme="KVK", identifier="12345678")],
+        ),
+        contract=ContractRecord(
+            title="Road maintenance",
+            cpv_codes=[CpvCodeRecord(code="45233141")],
+            **contract_fields,
+        ),
+        awards=[
+            AwardRecord(
+                awarded_value=1000.0,
+                contractors=[OrganizationRecord(official_name="Roads BV")],
+            )
+        ],
+    )
+
+
+class TestValidateAwardData:
+    """Tests for validate_award_data."""
+
+    def test_valid_record(self):
+        """Test that a record converts to the equivalent Pydantic model."""
+        model = validate_award_data(make_record())
+
+        assert isinstance(model, AwardDataModel)
+        assert model.buyer.identifiers[0].identifier == "12345678"
+        assert model.document.buyer_authority_type.code == "3"
+        assert model.awards[0].contractors[0].official_name == "Roads BV"
+
+    def test_invalid_record_raises(self):
+        """Test that schema violations surface as ValidationError."""
+        with pytest.raises(ValidationError):
+            validate_award_data(make_record(estimated_value="not a number"))
+
+
+class TestRecords:
+    """Tests for the record classes themselves."""
+
+    def test_slotted(self):
+        """Test that records carry no per-instance __dict__."""
+        assert not hasattr(make_record().contract, "__dict__")
+
+    def test_pickle_round_trip(self):
+        """Test that records survive transfer from worker processes."""
+        record = make_record()
+        assert pickle.loads(pickle.dumps(record)) == record